@@ -1,8 +1,11 @@
+import asyncio
 import discord
 from redbot.core import commands, Config
 from redbot.core.bot import Red
 from datetime import datetime
 
+from .inviteindex import InviteIndex
+
 class AdvancedInviteTracker(commands.Cog):
     """Advanced Invite Tracker Cog"""
 
@@ -13,61 +16,97 @@ class AdvancedInviteTracker(commands.Cog):
             "invites": {},
             "invite_counts": {},
             "log_channel": None,
-            "variables": {}
+            "variables": {},
+            "invite_totals": {"joined": 0, "left": 0},
+            "invitee_index_built": False,
         }
         self.config.register_guild(**default_guild)
-        self.invites_cache = {}
+        # Reverse index: who invited this member
+        self.config.register_member(inviter=None)
+        # guild_id -> [(inviter_id, joined, left, net)] sorted by net, rebuilt after counts change
+        self.rankings = {}
+        self.invite_index = InviteIndex()
+        self.initialize_task = None
 
     async def initialize(self):
         await self.bot.wait_until_ready()
         for guild in self.bot.guilds:
-            try:
-                self.invites_cache[guild.id] = await guild.invites()
-            except discord.Forbidden:
+            if not await self.invite_index.load(guild):
                 print(f"Missing permissions to fetch invites for guild: {guild.name} ({guild.id})")
 
     @commands.Cog.listener()
     async def on_member_join(self, member):
-        invites_before = self.invites_cache.get(member.guild.id, [])
-        invites_after = await member.guild.invites()
-        self.invites_cache[member.guild.id] = invites_after
-
-        invite_used = None
-        for invite in invites_before:
-            if invite.uses < next((i.uses for i in invites_after if i.code == invite.code), invite.uses):
-                invite_used = invite
-                break
-
-        if invite_used:
-            inviter_id = str(invite_used.inviter.id)
-            async with self.config.guild(member.guild).invites() as invites:
-                if inviter_id not in invites:
-                    invites[inviter_id] = []
-                invites[inviter_id].append(member.id)
-
-            async with self.config.guild(member.guild).invite_counts() as invite_counts:
-                if inviter_id not in invite_counts:
-                    invite_counts[inviter_id] = {"joined": 0, "left": 0}
-                invite_counts[inviter_id]["joined"] += 1
-
-            await self.send_invite_embed(member, invite_used.inviter, "joined")
+        invite_use = await self.invite_index.resolve(member)
+        if invite_use.kind == "vanity":
+            await self.send_invite_embed(member, None, "joined", via=f"Vanity URL (`{invite_use.code}`)")
+            return
+        if not invite_use.inviter_id:
+            await self.send_invite_embed(member, None, "joined", via="Unknown")
+            return
+
+        inviter_id = str(invite_use.inviter_id)
+        # Attribution lives on the member alone; the guild's invites list only holds codes added by hand.
+        await self.config.member(member).inviter.set(invite_use.inviter_id)
+        await self.update_counts(member.guild, inviter_id, "joined")
+
+        inviter = member.guild.get_member(invite_use.inviter_id) or self.bot.get_user(invite_use.inviter_id)
+        await self.send_invite_embed(member, inviter, "joined", via=f"<@{inviter_id}>")
 
     @commands.Cog.listener()
     async def on_member_remove(self, member):
-        async with self.config.guild(member.guild).invites() as invites:
-            for inviter_id, invitees in invites.items():
-                if member.id in invitees:
-                    invitees.remove(member.id)
-                    async with self.config.guild(member.guild).invite_counts() as invite_counts:
-                        if inviter_id not in invite_counts:
-                            invite_counts[inviter_id] = {"joined": 0, "left": 0}
-                        invite_counts[inviter_id]["left"] += 1
-                    inviter = member.guild.get_member(int(inviter_id))
-                    await self.send_invite_embed(member, inviter, "left")
-                    break
-
-    async def send_invite_embed(self, member, inviter, action):
-        if not inviter:
+        inviter_id = await self.config.member(member).inviter()
+        if inviter_id is None:
+            return
+        await self.config.member(member).inviter.clear()
+        inviter_id = str(inviter_id)
+        await self.update_counts(member.guild, inviter_id, "left")
+        inviter = member.guild.get_member(int(inviter_id))
+        await self.send_invite_embed(member, inviter, "left")
+
+    async def update_counts(self, guild, inviter_id, field):
+        """Add one join or leave to an inviter's counts and the guild totals."""
+        async with self.config.guild(guild).invite_counts() as invite_counts:
+            if inviter_id not in invite_counts:
+                invite_counts[inviter_id] = {"joined": 0, "left": 0}
+            invite_counts[inviter_id][field] += 1
+        async with self.config.guild(guild).invite_totals() as invite_totals:
+            invite_totals[field] += 1
+        self.rankings.pop(guild.id, None)
+
+    async def get_ranking(self, guild):
+        ranking = self.rankings.get(guild.id)
+        if ranking is None:
+            invite_counts = await self.config.guild(guild).invite_counts()
+            ranking = sorted(
+                (
+                    (int(inviter_id), counts["joined"], counts["left"], counts["joined"] - counts["left"])
+                    for inviter_id, counts in invite_counts.items()
+                ),
+                key=lambda x: x[3],
+                reverse=True,
+            )
+            self.rankings[guild.id] = ranking
+        return ranking
+
+    async def build_invitee_index(self):
+        """Fill the invitee -> inviter index and guild totals from data tracked before they existed."""
+        for guild_id, data in (await self.config.all_guilds()).items():
+            if data["invitee_index_built"]:
+                continue
+            for inviter_id, invitees in data["invites"].items():
+                # These lists also hold invite codes added by hand.
+                for member_id in invitees:
+                    if isinstance(member_id, int):
+                        await self.config.member_from_ids(guild_id, member_id).inviter.set(int(inviter_id))
+            counts = data["invite_counts"].values()
+            await self.config.guild_from_id(guild_id).invite_totals.set({
+                "joined": sum(c["joined"] for c in counts),
+                "left": sum(c["left"] for c in counts),
+            })
+            await self.config.guild_from_id(guild_id).invitee_index_built.set(True)
+
+    async def send_invite_embed(self, member, inviter, action, via=None):
+        if not inviter and not via:
             return
         embed = discord.Embed(
             title=f"User {action.capitalize()}",
@@ -75,7 +114,7 @@ class AdvancedInviteTracker(commands.Cog):
             color=discord.Color.green() if action == "joined" else discord.Color.red(),
             timestamp=datetime.utcnow()
         )
-        embed.add_field(name="Invited By", value=inviter.mention)
+        embed.add_field(name="Invited By", value=inviter.mention if inviter else via)
         embed.set_footer(text=f"User ID: {member.id}")
         log_channel_id = await self.config.guild(member.guild).log_channel()
         if log_channel_id:
@@ -102,6 +141,9 @@ class AdvancedInviteTracker(commands.Cog):
         """Reset the invite tracker."""
         await self.config.guild(ctx.guild).invites.clear()
         await self.config.guild(ctx.guild).invite_counts.clear()
+        await self.config.guild(ctx.guild).invite_totals.clear()
+        await self.config.clear_all_members(ctx.guild)
+        self.rankings.pop(ctx.guild.id, None)
         await ctx.send("Invite tracker has been reset.")
 
     @invites.command(name="invites")
@@ -111,14 +153,17 @@ class AdvancedInviteTracker(commands.Cog):
         invites = await self.config.guild(ctx.guild).invites()
         invite_counts = await self.config.guild(ctx.guild).invite_counts()
         inviter_id = str(member.id)
-        if inviter_id in invites:
+        # Member ids in these lists predate per-member attribution; only codes added by hand count here.
+        codes = [code for code in invites.get(inviter_id, []) if isinstance(code, str)]
+        counts = invite_counts.get(inviter_id, {"joined": 0, "left": 0})
+        if codes or inviter_id in invite_counts:
             embed = discord.Embed(
                 title=f"Invites for {member.display_name}",
                 color=discord.Color.blue()
             )
-            embed.add_field(name="Total Invites", value=len(invites[inviter_id]))
-            embed.add_field(name="Joined", value=invite_counts.get(inviter_id, {}).get("joined", 0))
-            embed.add_field(name="Left", value=invite_counts.get(inviter_id, {}).get("left", 0))
+            embed.add_field(name="Total Invites", value=counts["joined"] - counts["left"] + len(codes))
+            embed.add_field(name="Joined", value=counts["joined"])
+            embed.add_field(name="Left", value=counts["left"])
             await ctx.send(embed=embed)
         else:
             await ctx.send(f"{member.mention} has no invites tracked.")
@@ -138,17 +183,13 @@ class AdvancedInviteTracker(commands.Cog):
     @invites.command(name="leaderboard")
     async def invite_leaderboard(self, ctx):
         """View the leaderboard for top inviters in your server."""
-        invite_counts = await self.config.guild(ctx.guild).invite_counts()
-        sorted_invites = sorted(invite_counts.items(), key=lambda x: x[1]["joined"] - x[1]["left"], reverse=True)
+        ranking = await self.get_ranking(ctx.guild)
         pages = []
         page = []
-        for i, (inviter_id, counts) in enumerate(sorted_invites, 1):
-            inviter = ctx.guild.get_member(int(inviter_id))
+        for i, (inviter_id, joined, left, net) in enumerate(ranking, 1):
+            inviter = ctx.guild.get_member(inviter_id)
             if not inviter:
                 continue
-            joined = counts["joined"]
-            left = counts["left"]
-            net = joined - left
             page.append(f"{i}. {inviter.mention} - Invites: {net} (Joined: {joined}, Left: {left})")
             if len(page) == 10:
                 pages.append("\n".join(page))
@@ -207,9 +248,9 @@ class AdvancedInviteTracker(commands.Cog):
     async def stats(self, ctx):
         """View statistics about your server, including invite tracking."""
         guild = ctx.guild
-        invite_counts = await self.config.guild(guild).invite_counts()
-        total_invites = sum(counts["joined"] for counts in invite_counts.values())
-        total_left = sum(counts["left"] for counts in invite_counts.values())
+        invite_totals = await self.config.guild(guild).invite_totals()
+        total_invites = invite_totals["joined"]
+        total_left = invite_totals["left"]
         net_invites = total_invites - total_left
         embed = discord.Embed(
             title=f"Server Stats - {guild.name}",
@@ -283,32 +324,34 @@ class AdvancedInviteTracker(commands.Cog):
 
     @commands.Cog.listener()
     async def on_guild_join(self, guild):
-        try:
-            self.invites_cache[guild.id] = await guild.invites()
-        except discord.Forbidden:
+        if not await self.invite_index.load(guild):
             print(f"Missing permissions to fetch invites for guild: {guild.name} ({guild.id})")
 
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild):
+        # Guilds that were unavailable during startup get their baseline once they come back.
+        if self.initialize_task is not None and self.initialize_task.done() and guild.id not in self.invite_index.guilds:
+            await self.invite_index.load(guild)
+
     @commands.Cog.listener()
     async def on_guild_remove(self, guild):
-        if guild.id in self.invites_cache:
-            del self.invites_cache[guild.id]
+        self.invite_index.forget(guild.id)
+        self.rankings.pop(guild.id, None)
 
     @commands.Cog.listener()
     async def on_invite_create(self, invite):
-        try:
-            self.invites_cache[invite.guild.id] = await invite.guild.invites()
-        except discord.Forbidden:
-            print(f"Missing permissions to fetch invites for guild: {invite.guild.name} ({invite.guild.id})")
+        self.invite_index.created(invite)
 
     @commands.Cog.listener()
     async def on_invite_delete(self, invite):
-        try:
-            self.invites_cache[invite.guild.id] = await invite.guild.invites()
-        except discord.Forbidden:
-            print(f"Missing permissions to fetch invites for guild: {invite.guild.name} ({invite.guild.id})")
+        self.invite_index.deleted(invite)
 
     async def cog_load(self):
-        await self.initialize()
+        await self.build_invitee_index()
+        # Loading waits for the gateway, so it must not hold up cog loading.
+        self.initialize_task = asyncio.create_task(self.initialize())
 
     async def cog_unload(self):
-        self.invites_cache.clear()
+        if self.initialize_task is not None:
+            self.initialize_task.cancel()
+        self.invite_index.clear()
@@ -0,0 +1,178 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import discord
+
+# How long to wait after a join before diffing invites, so a burst of joins shares one fetch.
+COALESCE_DELAY = 2.0
+
+
+class InviteUse:
+    """How a member joined: through a tracked invite, the vanity URL, or an unknown route."""
+
+    __slots__ = ("kind", "code", "inviter_id")
+
+    def __init__(self, kind: str, code: Optional[str] = None, inviter_id: Optional[int] = None):
+        self.kind = kind
+        self.code = code
+        self.inviter_id = inviter_id
+
+
+UNKNOWN = InviteUse("unknown")
+
+
+class _GuildInvites:
+    __slots__ = ("uses", "max_uses", "inviters", "expired", "vanity_uses", "synced_at", "surplus", "waiters", "flush")
+
+    def __init__(self):
+        # code -> uses, max_uses and inviter id as last seen
+        self.uses: Dict[str, int] = {}
+        self.max_uses: Dict[str, int] = {}
+        self.inviters: Dict[str, Optional[int]] = {}
+        # Invites deleted since the last diff: code -> (uses, max_uses, inviter id)
+        self.expired: Dict[str, Tuple[int, int, Optional[int]]] = {}
+        self.vanity_uses: Optional[int] = None
+        self.synced_at: datetime = datetime.now(timezone.utc)
+        # Uses seen by the last diff that no waiting join claimed yet.
+        self.surplus: List[InviteUse] = []
+        self.waiters: List[asyncio.Future] = []
+        self.flush: Optional[asyncio.Task] = None
+
+
+class InviteIndex:
+    """Invite uses per guild, keyed by invite code.
+
+    Invite create and delete events update the index in place. Joins do not
+    fetch invites themselves; they wait for a shared diff that runs shortly
+    after the first join of a burst and attributes every waiting join at once.
+    """
+
+    def __init__(self):
+        self.guilds: Dict[int, _GuildInvites] = {}
+
+    async def load(self, guild: discord.Guild) -> bool:
+        """Take a fresh snapshot of a guild's invites. Returns False without permission."""
+        state = self.guilds.get(guild.id) or _GuildInvites()
+        try:
+            invites, vanity = await self._fetch(guild)
+        except discord.HTTPException:
+            return False
+        self._sync(state, invites, vanity)
+        self.guilds[guild.id] = state
+        return True
+
+    def forget(self, guild_id: int):
+        state = self.guilds.pop(guild_id, None)
+        if state is None:
+            return
+        if state.flush is not None:
+            state.flush.cancel()
+        for future in state.waiters:
+            if not future.done():
+                future.set_result(UNKNOWN)
+        state.waiters.clear()
+
+    def clear(self):
+        for guild_id in list(self.guilds):
+            self.forget(guild_id)
+
+    def created(self, invite: discord.Invite):
+        state = self.guilds.get(invite.guild.id)
+        if state is None:
+            return
+        state.uses[invite.code] = invite.uses or 0
+        state.max_uses[invite.code] = invite.max_uses or 0
+        state.inviters[invite.code] = invite.inviter.id if invite.inviter else None
+
+    def deleted(self, invite: discord.Invite):
+        state = self.guilds.get(invite.guild.id)
+        if state is None or invite.code not in state.uses:
+            return
+        # Invites that reach max_uses are deleted by the join that used them up,
+        # so remember them until the next diff.
+        state.expired[invite.code] = (
+            state.uses.pop(invite.code),
+            state.max_uses.pop(invite.code, 0),
+            state.inviters.pop(invite.code, None),
+        )
+
+    async def resolve(self, member: discord.Member) -> InviteUse:
+        """Work out which invite a member joined with."""
+        guild = member.guild
+        state = self.guilds.get(guild.id)
+        if state is None:
+            # No baseline to diff against. Guilds are loaded on startup and on
+            # join, never from here, so a guild we cannot fetch invites for
+            # does not cost a REST call on every join.
+            return UNKNOWN
+        future = asyncio.get_running_loop().create_future()
+        state.waiters.append(future)
+        if state.flush is None or state.flush.done():
+            state.flush = asyncio.create_task(self._flush(guild, state))
+        return await future
+
+    @staticmethod
+    async def _fetch(guild: discord.Guild) -> Tuple[List[discord.Invite], Optional[discord.Invite]]:
+        invites = await guild.invites()
+        vanity = None
+        if "VANITY_URL" in guild.features:
+            try:
+                vanity = await guild.vanity_invite()
+            except discord.HTTPException:
+                pass
+        return invites, vanity
+
+    @staticmethod
+    def _sync(state: _GuildInvites, invites: List[discord.Invite], vanity: Optional[discord.Invite]):
+        state.uses = {invite.code: invite.uses or 0 for invite in invites}
+        state.max_uses = {invite.code: invite.max_uses or 0 for invite in invites}
+        state.inviters = {invite.code: invite.inviter.id if invite.inviter else None for invite in invites}
+        state.expired.clear()
+        state.vanity_uses = vanity.uses if vanity else None
+        state.synced_at = datetime.now(timezone.utc)
+
+    async def _flush(self, guild: discord.Guild, state: _GuildInvites):
+        await asyncio.sleep(COALESCE_DELAY)
+        waiters, state.waiters = state.waiters, []
+        try:
+            try:
+                invites, vanity = await self._fetch(guild)
+            except discord.HTTPException:
+                uses, carried = [], 0
+            else:
+                carried = len(state.surplus)
+                uses = state.surplus + self._diff(state, invites, vanity)
+                self._sync(state, invites, vanity)
+            for i, future in enumerate(waiters):
+                if not future.done():
+                    future.set_result(uses[i] if i < len(uses) else UNKNOWN)
+            # Joins that arrived during the fetch were likely counted here already;
+            # keep this diff's unclaimed uses for them, but only for one more round.
+            state.surplus = uses[max(len(waiters), carried):]
+        finally:
+            for future in waiters:
+                if not future.done():
+                    future.set_result(UNKNOWN)
+            if state.waiters:
+                state.flush = asyncio.create_task(self._flush(guild, state))
+
+    @staticmethod
+    def _diff(state: _GuildInvites, invites: List[discord.Invite], vanity: Optional[discord.Invite]) -> List[InviteUse]:
+        uses = []
+        for invite in invites:
+            if invite.code in state.uses:
+                before = state.uses[invite.code]
+            elif invite.created_at and invite.created_at >= state.synced_at:
+                # Created after the last sync without us seeing the event.
+                before = 0
+            else:
+                continue
+            inviter_id = invite.inviter.id if invite.inviter else None
+            uses.extend(InviteUse("invite", invite.code, inviter_id) for _ in range((invite.uses or 0) - before))
+        for code, (before, max_uses, inviter_id) in state.expired.items():
+            if max_uses and before + 1 >= max_uses:
+                uses.append(InviteUse("invite", code, inviter_id))
+        if vanity is not None and state.vanity_uses is not None:
+            uses.extend(InviteUse("vanity", vanity.code) for _ in range((vanity.uses or 0) - state.vanity_uses))
+        return uses
@@ -2,6 +2,7 @@ from redbot.core import commands, Config
 from redbot.core.bot import Red
 from datetime import datetime
 import discord
+from .auditcache import AuditLogCache
 from .dashboard_integration import DashboardIntegration
 
 class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``DashboardIntegration``.
@@ -40,6 +41,24 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
             "command_log_channel": None,  # Added for command logging
         }
         self.config.register_guild(**default_guild)
+        self.audit_log = AuditLogCache()
+
+    def cog_unload(self):
+        self.audit_log.clear()
+
+    @staticmethod
+    def format_actor(entry: discord.AuditLogEntry) -> str:
+        if entry is None or entry.user is None:
+            return "Unknown"
+        return f"{entry.user.mention} ({entry.user.id})"
+
+    @commands.Cog.listener()
+    async def on_audit_log_entry_create(self, entry: discord.AuditLogEntry):
+        self.audit_log.add(entry)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.audit_log.forget(guild.id)
 
     async def log_event(self, guild: discord.Guild, log_type: str, title: str, description: str, color: discord.Color = discord.Color.blue(), author: discord.Member = None):
         try:
@@ -252,82 +271,82 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
 
     @commands.Cog.listener()
     async def on_member_ban(self, guild, user):
-        entry = await guild.audit_logs(action=discord.AuditLogAction.ban, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.ban, user.id)
         description = (
             f"**User:** {user.mention} ({user.id})\n"
-            f"**Banned By:** {entry.user.mention} ({entry.user.id})\n"
-            f"**Reason:** {entry.reason if entry.reason else 'No reason provided'}\n"
+            f"**Banned By:** {self.format_actor(entry)}\n"
+            f"**Reason:** {entry.reason if entry and entry.reason else 'No reason provided'}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "ban", "User Banned", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "ban", "User Banned", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_member_unban(self, guild, user):
-        entry = await guild.audit_logs(action=discord.AuditLogAction.unban, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.unban, user.id)
         description = (
             f"**User:** {user.mention} ({user.id})\n"
-            f"**Unbanned By:** {entry.user.mention} ({entry.user.id})\n"
-            f"**Reason:** {entry.reason if entry.reason else 'No reason provided'}\n"
+            f"**Unbanned By:** {self.format_actor(entry)}\n"
+            f"**Reason:** {entry.reason if entry and entry.reason else 'No reason provided'}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "ban", "User Unbanned", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "ban", "User Unbanned", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_member_kick(self, guild, user):
-        entry = await guild.audit_logs(action=discord.AuditLogAction.kick, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.kick, user.id)
         description = (
             f"**User:** {user.mention} ({user.id})\n"
-            f"**Kicked By:** {entry.user.mention} ({entry.user.id})\n"
-            f"**Reason:** {entry.reason if entry.reason else 'No reason provided'}\n"
+            f"**Kicked By:** {self.format_actor(entry)}\n"
+            f"**Reason:** {entry.reason if entry and entry.reason else 'No reason provided'}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "kick", "User Kicked", description, discord.Color.orange(), entry.user)
+        await self.log_event(guild, "kick", "User Kicked", description, discord.Color.orange(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_member_warn(self, guild, user):
-        entry = await guild.audit_logs(action=discord.AuditLogAction.warn, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.warn, user.id)
         description = (
             f"**User:** {user.mention} ({user.id})\n"
-            f"**Warned By:** {entry.user.mention} ({entry.user.id})\n"
-            f"**Reason:** {entry.reason if entry.reason else 'No reason provided'}\n"
+            f"**Warned By:** {self.format_actor(entry)}\n"
+            f"**Reason:** {entry.reason if entry and entry.reason else 'No reason provided'}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "warn", "User Warned", description, discord.Color.yellow(), entry.user)
+        await self.log_event(guild, "warn", "User Warned", description, discord.Color.yellow(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_member_mute(self, guild, user, duration):
-        entry = await guild.audit_logs(action=discord.AuditLogAction.mute, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.mute, user.id)
         description = (
             f"**User:** {user.mention} ({user.id})\n"
-            f"**Muted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Muted By:** {self.format_actor(entry)}\n"
             f"**Duration:** {duration}\n"
-            f"**Reason:** {entry.reason if entry.reason else 'No reason provided'}\n"
+            f"**Reason:** {entry.reason if entry and entry.reason else 'No reason provided'}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "mute", "User Muted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "mute", "User Muted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_member_unmute(self, guild, user):
-        entry = await guild.audit_logs(action=discord.AuditLogAction.unmute, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.unmute, user.id)
         description = (
             f"**User:** {user.mention} ({user.id})\n"
-            f"**Unmuted By:** {entry.user.mention} ({entry.user.id})\n"
-            f"**Reason:** {entry.reason if entry.reason else 'No reason provided'}\n"
+            f"**Unmuted By:** {self.format_actor(entry)}\n"
+            f"**Reason:** {entry.reason if entry and entry.reason else 'No reason provided'}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "unmute", "User Unmuted", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "unmute", "User Unmuted", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_member_timeout(self, guild, user, duration):
-        entry = await guild.audit_logs(action=discord.AuditLogAction.timeout, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.timeout, user.id)
         description = (
             f"**User:** {user.mention} ({user.id})\n"
-            f"**Timed Out By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Timed Out By:** {self.format_actor(entry)}\n"
             f"**Duration:** {duration}\n"
-            f"**Reason:** {entry.reason if entry.reason else 'No reason provided'}\n"
+            f"**Reason:** {entry.reason if entry and entry.reason else 'No reason provided'}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "timeout", "User Timed Out", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "timeout", "User Timed Out", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_message_attachment(self, message):
@@ -412,103 +431,103 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
     @commands.Cog.listener()
     async def on_role_create(self, role):
         guild = role.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.role_create, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.role_create, role.id)
         description = (
             f"**Role Created:** {role.mention} ({role.name})\n"
             f"**Role ID:** {role.id}\n"
-            f"**Created By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Created By:** {self.format_actor(entry)}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "role", "Role Created", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "role", "Role Created", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_role_delete(self, role):
         guild = role.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.role_delete, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.role_delete, role.id)
         description = (
             f"**Role Deleted:** {role.name}\n"
             f"**Role ID:** {role.id}\n"
-            f"**Deleted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Deleted By:** {self.format_actor(entry)}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "role", "Role Deleted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "role", "Role Deleted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_role_update(self, before, after):
         guild = before.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.role_update, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.role_update, before.id)
         if before.name != after.name:
             description = (
                 f"**Role Renamed:** {before.name} -> {after.name}\n"
                 f"**Role ID:** {before.id}\n"
-                f"**Updated By:** {entry.user.mention} ({entry.user.id})\n"
+                f"**Updated By:** {self.format_actor(entry)}\n"
                 f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
             )
-            await self.log_event(guild, "role", "Role Renamed", description, discord.Color.blue(), entry.user)
+            await self.log_event(guild, "role", "Role Renamed", description, discord.Color.blue(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_webhook_create(self, webhook):
         guild = webhook.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.webhook_create, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.webhook_create, webhook.id)
         description = (
             f"**Webhook Created:** {webhook.name}\n"
             f"**Webhook ID:** {webhook.id}\n"
-            f"**Created By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Created By:** {self.format_actor(entry)}\n"
             f"**Channel:** {webhook.channel.mention}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "webhook", "Webhook Created", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "webhook", "Webhook Created", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_webhook_update(self, webhook):
         guild = webhook.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.webhook_update, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.webhook_update, webhook.id)
         description = (
             f"**Webhook Updated:** {webhook.name}\n"
             f"**Webhook ID:** {webhook.id}\n"
-            f"**Updated By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Updated By:** {self.format_actor(entry)}\n"
             f"**Channel:** {webhook.channel.mention}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "webhook", "Webhook Updated", description, discord.Color.blue(), entry.user)
+        await self.log_event(guild, "webhook", "Webhook Updated", description, discord.Color.blue(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_webhook_delete(self, webhook):
         guild = webhook.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.webhook_delete, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.webhook_delete, webhook.id)
         description = (
             f"**Webhook Deleted:** {webhook.name}\n"
             f"**Webhook ID:** {webhook.id}\n"
-            f"**Deleted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Deleted By:** {self.format_actor(entry)}\n"
             f"**Channel:** {webhook.channel.mention}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "webhook", "Webhook Deleted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "webhook", "Webhook Deleted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_app_add(self, integration):
         guild = integration.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.integration_create, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.integration_create, integration.id)
         description = (
             f"**App Invited:** {integration.name}\n"
             f"**App ID:** {integration.id}\n"
-            f"**Invited By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Invited By:** {self.format_actor(entry)}\n"
             f"**Permissions Level:** {integration.permissions}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "app", "App Invited", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "app", "App Invited", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_app_remove(self, integration):
         guild = integration.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.integration_delete, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.integration_delete, integration.id)
         description = (
             f"**App Removed:** {integration.name}\n"
             f"**App ID:** {integration.id}\n"
-            f"**Removed By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Removed By:** {self.format_actor(entry)}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "app", "App Removed", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "app", "App Removed", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_voice_state_update(self, member, before, after):
@@ -662,113 +681,115 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
         updated_emojis = {emoji for emoji in before_emojis & after_emojis if emoji.name != next(e.name for e in after if e.id == emoji.id)}
 
         for emoji in added_emojis:
-            entry = await guild.audit_logs(action=discord.AuditLogAction.emoji_create, limit=1).get()
+            entry = await self.audit_log.find(guild, discord.AuditLogAction.emoji_create, emoji.id)
             description = (
                 f"**Emoji Added:** {emoji} ({emoji.name})\n"
                 f"**Emoji ID:** {emoji.id}\n"
-                f"**Added By:** {entry.user.mention} ({entry.user.id})\n"
+                f"**Added By:** {self.format_actor(entry)}\n"
                 f"**Guild:** {guild.name} ({guild.id})\n"
                 f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
             )
-            await self.log_event(guild, "emoji", "Emoji Added", description, discord.Color.green(), entry.user)
+            await self.log_event(guild, "emoji", "Emoji Added", description, discord.Color.green(), entry.user if entry else None)
 
         for emoji in removed_emojis:
-            entry = await guild.audit_logs(action=discord.AuditLogAction.emoji_delete, limit=1).get()
+            entry = await self.audit_log.find(guild, discord.AuditLogAction.emoji_delete, emoji.id)
             description = (
                 f"**Emoji Removed:** {emoji} ({emoji.name})\n"
-                f"**Removed By:** {entry.user.mention} ({entry.user.id})\n"
+                f"**Removed By:** {self.format_actor(entry)}\n"
                 f"**Guild:** {guild.name} ({guild.id})\n"
                 f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
             )
-            await self.log_event(guild, "emoji", "Emoji Removed", description, discord.Color.red(), entry.user)
+            await self.log_event(guild, "emoji", "Emoji Removed", description, discord.Color.red(), entry.user if entry else None)
 
         for emoji in updated_emojis:
-            entry = await guild.audit_logs(action=discord.AuditLogAction.emoji_update, limit=1).get()
+            entry = await self.audit_log.find(guild, discord.AuditLogAction.emoji_update, emoji.id)
             description = (
                 f"**Emoji Updated:** {emoji} ({emoji.name})\n"
                 f"**Emoji ID:** {emoji.id}\n"
-                f"**Updated By:** {entry.user.mention} ({entry.user.id})\n"
+                f"**Updated By:** {self.format_actor(entry)}\n"
                 f"**Guild:** {guild.name} ({guild.id})\n"
                 f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
             )
-            await self.log_event(guild, "emoji", "Emoji Updated", description, discord.Color.blue(), entry.user)
+            await self.log_event(guild, "emoji", "Emoji Updated", description, discord.Color.blue(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_invite_create(self, invite):
         guild = invite.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.invite_create, limit=1).get()
+        # The gateway payload already names the creator, so no audit log lookup is needed.
+        inviter = invite.inviter
         description = (
             f"**Invite Created:**\n"
             f"**Code:** {invite.code}\n"
             f"**Channel:** {invite.channel.mention}\n"
-            f"**Inviter:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Inviter:** {f'{inviter.mention} ({inviter.id})' if inviter else 'Unknown'}\n"
             f"**Max Uses:** {invite.max_uses}\n"
             f"**Max Age:** {invite.max_age}\n"
             f"**Temporary:** {invite.temporary}\n"
             f"**Created At:** <t:{int(invite.created_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "invite", "Invite Created", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "invite", "Invite Created", description, discord.Color.green(), inviter)
 
     @commands.Cog.listener()
     async def on_invite_delete(self, invite):
         guild = invite.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.invite_delete, limit=1).get()
+        # Invite audit entries are keyed by their target's id, which for an invite is its code.
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.invite_delete, invite.code)
         description = (
             f"**Invite Deleted:**\n"
             f"**Code:** {invite.code}\n"
             f"**Channel:** {invite.channel.mention}\n"
-            f"**Deleted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Deleted By:** {self.format_actor(entry)}\n"
             f"**Max Uses:** {invite.max_uses}\n"
             f"**Max Age:** {invite.max_age}\n"
             f"**Temporary:** {invite.temporary}\n"
             f"**Created At:** <t:{int(invite.created_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "invite", "Invite Deleted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "invite", "Invite Deleted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_integration_create(self, integration):
         guild = integration.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.integration_create, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.integration_create, integration.id)
         description = (
             f"**Integration Created:**\n"
             f"**Name:** {integration.name}\n"
             f"**Type:** {integration.type}\n"
             f"**Enabled:** {integration.enabled}\n"
             f"**Account:** {integration.account.name}\n"
-            f"**Created By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Created By:** {self.format_actor(entry)}\n"
             f"**Created At:** <t:{int(integration.created_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "integration", "Integration Created", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "integration", "Integration Created", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_integration_update(self, integration):
         guild = integration.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.integration_update, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.integration_update, integration.id)
         description = (
             f"**Integration Updated:**\n"
             f"**Name:** {integration.name}\n"
             f"**Type:** {integration.type}\n"
             f"**Enabled:** {integration.enabled}\n"
             f"**Account:** {integration.account.name}\n"
-            f"**Updated By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Updated By:** {self.format_actor(entry)}\n"
             f"**Updated At:** <t:{int(integration.updated_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "integration", "Integration Updated", description, discord.Color.blue(), entry.user)
+        await self.log_event(guild, "integration", "Integration Updated", description, discord.Color.blue(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_integration_delete(self, integration):
         guild = integration.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.integration_delete, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.integration_delete, integration.id)
         description = (
             f"**Integration Deleted:**\n"
             f"**Name:** {integration.name}\n"
             f"**Type:** {integration.type}\n"
             f"**Enabled:** {integration.enabled}\n"
             f"**Account:** {integration.account.name}\n"
-            f"**Deleted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Deleted By:** {self.format_actor(entry)}\n"
             f"**Deleted At:** <t:{int(integration.deleted_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "integration", "Integration Deleted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "integration", "Integration Deleted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_typing(self, channel, user, when):
@@ -786,165 +807,165 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
     @commands.Cog.listener()
     async def on_thread_create(self, thread):
         guild = thread.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.thread_create, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.thread_create, thread.id)
         description = (
             f"**Thread Created:** {thread.mention} ({thread.name})\n"
             f"**Thread ID:** {thread.id}\n"
             f"**Parent Channel:** {thread.parent.mention}\n"
-            f"**Created By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Created By:** {self.format_actor(entry)}\n"
             f"**Guild:** {guild.name} ({guild.id})\n"
             f"**Timestamp:** <t:{int(thread.created_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "thread", "Thread Created", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "thread", "Thread Created", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_thread_delete(self, thread):
         guild = thread.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.thread_delete, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.thread_delete, thread.id)
         description = (
             f"**Thread Deleted:** {thread.name}\n"
             f"**Thread ID:** {thread.id}\n"
             f"**Parent Channel:** {thread.parent.mention}\n"
-            f"**Deleted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Deleted By:** {self.format_actor(entry)}\n"
             f"**Guild:** {guild.name} ({guild.id})\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "thread", "Thread Deleted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "thread", "Thread Deleted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_thread_update(self, before, after):
         guild = before.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.thread_update, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.thread_update, before.id)
         if before.name != after.name:
             description = (
                 f"**Thread Renamed:** {before.name} -> {after.name}\n"
                 f"**Thread ID:** {before.id}\n"
                 f"**Parent Channel:** {before.parent.mention}\n"
-                f"**Updated By:** {entry.user.mention} ({entry.user.id})\n"
+                f"**Updated By:** {self.format_actor(entry)}\n"
                 f"**Guild:** {guild.name} ({guild.id})\n"
                 f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
             )
-            await self.log_event(guild, "thread", "Thread Renamed", description, discord.Color.blue(), entry.user)
+            await self.log_event(guild, "thread", "Thread Renamed", description, discord.Color.blue(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_sticker_create(self, sticker):
         guild = sticker.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.sticker_create, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.sticker_create, sticker.id)
         description = (
             f"**Sticker Created:** {sticker.name}\n"
             f"**Sticker ID:** {sticker.id}\n"
-            f"**Created By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Created By:** {self.format_actor(entry)}\n"
             f"**Guild:** {guild.name} ({guild.id})\n"
             f"**Timestamp:** <t:{int(sticker.created_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "sticker", "Sticker Created", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "sticker", "Sticker Created", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_sticker_delete(self, sticker):
         guild = sticker.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.sticker_delete, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.sticker_delete, sticker.id)
         description = (
             f"**Sticker Deleted:** {sticker.name}\n"
             f"**Sticker ID:** {sticker.id}\n"
-            f"**Deleted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Deleted By:** {self.format_actor(entry)}\n"
             f"**Guild:** {guild.name} ({guild.id})\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "sticker", "Sticker Deleted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "sticker", "Sticker Deleted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_sticker_update(self, before, after):
         guild = before.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.sticker_update, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.sticker_update, before.id)
         if before.name != after.name:
             description = (
                 f"**Sticker Renamed:** {before.name} -> {after.name}\n"
                 f"**Sticker ID:** {before.id}\n"
-                f"**Updated By:** {entry.user.mention} ({entry.user.id})\n"
+                f"**Updated By:** {self.format_actor(entry)}\n"
                 f"**Guild:** {guild.name} ({guild.id})\n"
                 f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
             )
-            await self.log_event(guild, "sticker", "Sticker Renamed", description, discord.Color.blue(), entry.user)
+            await self.log_event(guild, "sticker", "Sticker Renamed", description, discord.Color.blue(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_scheduled_event_create(self, event):
         guild = event.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.scheduled_event_create, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.scheduled_event_create, event.id)
         description = (
             f"**Scheduled Event Created:** {event.name}\n"
             f"**Event ID:** {event.id}\n"
-            f"**Created By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Created By:** {self.format_actor(entry)}\n"
             f"**Guild:** {guild.name} ({guild.id})\n"
             f"**Timestamp:** <t:{int(event.created_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "scheduled_event", "Scheduled Event Created", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "scheduled_event", "Scheduled Event Created", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_scheduled_event_delete(self, event):
         guild = event.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.scheduled_event_delete, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.scheduled_event_delete, event.id)
         description = (
             f"**Scheduled Event Deleted:** {event.name}\n"
             f"**Event ID:** {event.id}\n"
-            f"**Deleted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Deleted By:** {self.format_actor(entry)}\n"
             f"**Guild:** {guild.name} ({guild.id})\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "scheduled_event", "Scheduled Event Deleted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "scheduled_event", "Scheduled Event Deleted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_scheduled_event_update(self, before, after):
         guild = before.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.scheduled_event_update, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.scheduled_event_update, before.id)
         if before.name != after.name:
             description = (
                 f"**Scheduled Event Renamed:** {before.name} -> {after.name}\n"
                 f"**Event ID:** {before.id}\n"
-                f"**Updated By:** {entry.user.mention} ({entry.user.id})\n"
+                f"**Updated By:** {self.format_actor(entry)}\n"
                 f"**Guild:** {guild.name} ({guild.id})\n"
                 f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
             )
-            await self.log_event(guild, "scheduled_event", "Scheduled Event Renamed", description, discord.Color.blue(), entry.user)
+            await self.log_event(guild, "scheduled_event", "Scheduled Event Renamed", description, discord.Color.blue(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_stage_instance_create(self, stage_instance):
         guild = stage_instance.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.stage_instance_create, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.stage_instance_create, stage_instance.id)
         description = (
             f"**Stage Instance Created:** {stage_instance.channel.mention} ({stage_instance.channel.name})\n"
             f"**Topic:** {stage_instance.topic}\n"
             f"**Channel ID:** {stage_instance.channel.id}\n"
-            f"**Created By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Created By:** {self.format_actor(entry)}\n"
             f"**Guild:** {guild.name} ({guild.id})\n"
             f"**Timestamp:** <t:{int(stage_instance.created_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "stage_instance", "Stage Instance Created", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "stage_instance", "Stage Instance Created", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_stage_instance_delete(self, stage_instance):
         guild = stage_instance.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.stage_instance_delete, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.stage_instance_delete, stage_instance.id)
         description = (
             f"**Stage Instance Deleted:** {stage_instance.channel.mention} ({stage_instance.channel.name})\n"
             f"**Topic:** {stage_instance.topic}\n"
             f"**Channel ID:** {stage_instance.channel.id}\n"
-            f"**Deleted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Deleted By:** {self.format_actor(entry)}\n"
             f"**Guild:** {guild.name} ({guild.id})\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "stage_instance", "Stage Instance Deleted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "stage_instance", "Stage Instance Deleted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_stage_instance_update(self, before, after):
         guild = before.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.stage_instance_update, limit=1).get()
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.stage_instance_update, before.id)
         if before.topic != after.topic:
             description = (
                 f"**Stage Instance Topic Updated:** {before.topic} -> {after.topic}\n"
                 f"**Channel:** {before.channel.mention} ({before.channel.name})\n"
                 f"**Channel ID:** {before.channel.id}\n"
-                f"**Updated By:** {entry.user.mention} ({entry.user.id})\n"
+                f"**Updated By:** {self.format_actor(entry)}\n"
                 f"**Guild:** {guild.name} ({guild.id})\n"
                 f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
             )
-            await self.log_event(guild, "stage_instance", "Stage Instance Topic Updated", description, discord.Color.blue(), entry.user)
+            await self.log_event(guild, "stage_instance", "Stage Instance Topic Updated", description, discord.Color.blue(), entry.user if entry else None)
@@ -0,0 +1,101 @@
+import asyncio
+from typing import Dict, Optional, Tuple, Union
+
+import discord
+
+# How old (by its creation time) an audit log entry can be and still be matched to a gateway event.
+ENTRY_TTL = 60.0
+# Delay before fetching, so a burst of events shares one request and the
+# audit log has time to record the action that triggered the event.
+FETCH_DELAY = 0.75
+FETCH_LIMIT = 100
+
+
+class _GuildAuditLog:
+    __slots__ = ("entries", "latest", "cursor", "fetch")
+
+    def __init__(self):
+        # (action, target_id) -> newest entry; invite targets are keyed by their code
+        self.entries: Dict[Tuple[discord.AuditLogAction, Union[int, str]], discord.AuditLogEntry] = {}
+        # action -> newest entry, for lookups without a target
+        self.latest: Dict[discord.AuditLogAction, discord.AuditLogEntry] = {}
+        self.cursor: Optional[int] = None
+        self.fetch: Optional[asyncio.Task] = None
+
+
+class AuditLogCache:
+    """Short-lived index of recent audit log entries, per guild.
+
+    Entries are fed from ``on_audit_log_entry_create`` and, on a cache miss,
+    from a single incremental fetch per guild that every waiting listener
+    shares. Lookups are keyed by (action, target_id) so concurrent events
+    resolve to their own entry rather than whichever entry happens to be newest.
+    """
+
+    def __init__(self):
+        self.guilds: Dict[int, _GuildAuditLog] = {}
+
+    def add(self, entry: discord.AuditLogEntry):
+        state = self.guilds.setdefault(entry.guild.id, _GuildAuditLog())
+        # Entries arrive newest first from fetches and in any order against
+        # the gateway, so keep whichever is newest rather than the last seen.
+        target_id = getattr(entry.target, "id", None)
+        if target_id is not None:
+            previous = state.entries.get((entry.action, target_id))
+            if previous is None or previous.id < entry.id:
+                state.entries[(entry.action, target_id)] = entry
+        previous = state.latest.get(entry.action)
+        if previous is None or previous.id < entry.id:
+            state.latest[entry.action] = entry
+        if state.cursor is None or entry.id > state.cursor:
+            state.cursor = entry.id
+
+    def forget(self, guild_id: int):
+        state = self.guilds.pop(guild_id, None)
+        if state is not None and state.fetch is not None:
+            state.fetch.cancel()
+
+    def clear(self):
+        for guild_id in list(self.guilds):
+            self.forget(guild_id)
+
+    def _lookup(self, state: _GuildAuditLog, action: discord.AuditLogAction, target_id: Optional[Union[int, str]]) -> Optional[discord.AuditLogEntry]:
+        now = discord.utils.utcnow()
+        # Drop expired entries while we are here so the index stays small.
+        for key in [key for key, entry in state.entries.items() if self._expired(entry, now)]:
+            del state.entries[key]
+        if target_id is not None:
+            entry = state.entries.get((action, target_id))
+        else:
+            entry = state.latest.get(action)
+        if entry is None or self._expired(entry, now):
+            return None
+        return entry
+
+    @staticmethod
+    def _expired(entry: discord.AuditLogEntry, now) -> bool:
+        # Age by when the action happened, so an old entry fetched late is not served as fresh.
+        return (now - entry.created_at).total_seconds() > ENTRY_TTL
+
+    async def find(self, guild: discord.Guild, action: discord.AuditLogAction, target_id: Optional[Union[int, str]] = None) -> Optional[discord.AuditLogEntry]:
+        """Return the audit log entry for an action on a target, fetching at most once per burst."""
+        state = self.guilds.setdefault(guild.id, _GuildAuditLog())
+        entry = self._lookup(state, action, target_id)
+        if entry is not None:
+            return entry
+        if state.fetch is None or state.fetch.done():
+            state.fetch = asyncio.create_task(self._fetch(guild, state))
+        try:
+            await asyncio.shield(state.fetch)
+        except (asyncio.CancelledError, discord.HTTPException):
+            return None
+        return self._lookup(state, action, target_id)
+
+    async def _fetch(self, guild: discord.Guild, state: _GuildAuditLog):
+        await asyncio.sleep(FETCH_DELAY)
+        if not guild.me.guild_permissions.view_audit_log:
+            return
+        after = discord.Object(id=state.cursor) if state.cursor is not None else None
+        # Without a cursor this reads the newest page; afterwards only new entries.
+        async for entry in guild.audit_logs(limit=FETCH_LIMIT, after=after, oldest_first=False):
+            self.add(entry)
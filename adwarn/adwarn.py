@@ -1,16 +1,85 @@
 import discord
+from discord.ext import tasks
 from redbot.core import commands, Config
 from redbot.core.bot import Red
+from redbot.core.data_manager import cog_data_path
 from datetime import timedelta, datetime
+import heapq
+import logging
 import re
 import uuid
 import asyncio
+from collections import Counter
+
+from .races import RaceStore
+from .warnlog import WarningLog, week_key, month_key, ALL_TIME
+
+log = logging.getLogger("red.adwarn")
+
 class AdWarn(commands.Cog):
     def __init__(self, bot: Red):
         self.bot = bot
         self.config = Config.get_conf(self, identifier=1234567890)  # Replace with a unique identifier
         self.config.register_guild(warn_channel=None, tholds={}, warnings_issued={}, mod_warnings={}, softban_duration=120, timeout_duration=120, weekly_stats={}, monthly_stats={})
         self.config.register_member(warnings=[], untimeout_time=None)
+        # Pending untimeouts as a heap of (expires_at, guild_id, member_id). Superseded
+        # heap entries are skipped by checking them against untimeout_deadlines.
+        self.untimeout_queue = []
+        self.untimeout_deadlines = {}
+        self.untimeout_wakeup = asyncio.Event()
+        self.untimeout_task = None
+        self.warnings = WarningLog(cog_data_path(self) / "warnings.db")
+        self.race_store = RaceStore(cog_data_path(self) / "races.db")
+        # guild_id -> race_id -> {participant_id: score} for races that are running
+        self.races = {}
+        self.race_tasks = {}
+        # (guild_id, week_key, month_key) -> Counter of adwarn invocations per author, not yet flushed
+        self.stats_buffer = {}
+
+    async def cog_load(self):
+        await self.warnings.open()
+        # Both startup passes share a single read of every member's config.
+        all_members = await self.config.all_members()
+        await self.import_legacy_warnings(all_members)
+        await self.load_untimeout_schedule(all_members)
+        await self.race_store.open()
+        for race in await self.race_store.active():
+            await self.resume_race(race)
+        self.flush_stats_task.start()
+        self.untimeout_task = asyncio.create_task(self.untimeout_worker())
+
+    async def cog_unload(self):
+        if self.untimeout_task is not None:
+            self.untimeout_task.cancel()
+        for task in self.race_tasks.values():
+            task.cancel()
+        self.flush_stats_task.cancel()
+        await self.flush_stats()
+        await self.warnings.close()
+        await self.race_store.close()
+
+    async def import_legacy_warnings(self, all_members):
+        """Move warnings out of the old Config blobs into the warning log, once."""
+        all_guilds = await self.config.all_guilds()
+        member_warnings = {
+            guild_id: {member_id: data["warnings"] for member_id, data in members.items() if data.get("warnings")}
+            for guild_id, members in all_members.items()
+        }
+        mod_warnings = {guild_id: data["mod_warnings"] for guild_id, data in all_guilds.items() if data.get("mod_warnings")}
+        warnings_issued = {guild_id: data["warnings_issued"] for guild_id, data in all_guilds.items() if data.get("warnings_issued")}
+        if not any(member_warnings.values()) and not mod_warnings and not warnings_issued:
+            return
+        # Returns 0 if an earlier run already imported them but stopped before
+        # clearing Config; the blobs are cleared below either way.
+        imported = await self.warnings.import_legacy(member_warnings, mod_warnings, warnings_issued)
+        for guild_id, members in member_warnings.items():
+            for member_id in members:
+                await self.config.member_from_ids(guild_id, member_id).warnings.clear()
+        for guild_id in mod_warnings.keys() | warnings_issued.keys():
+            await self.config.guild_from_id(guild_id).mod_warnings.clear()
+            await self.config.guild_from_id(guild_id).warnings_issued.clear()
+        if imported:
+            log.info(f"Imported {imported} legacy warnings into the warning log.")
 
     @commands.command()
     @commands.has_permissions(manage_messages=True)
@@ -20,35 +89,11 @@ class AdWarn(commands.Cog):
         if warn_channel_id:
             warn_channel = self.bot.get_channel(warn_channel_id)
             if warn_channel:
-                # Store the warning with a UUID
-                warnings = await self.config.member(user).warnings()
+                # Append the warning; this also bumps the moderator's issued counts
                 warning_time = discord.utils.utcnow()
-                warning_id = str(uuid.uuid4())
-                warnings.append({
-                    "id": warning_id,
-                    "reason": reason,
-                    "moderator": ctx.author.id,
-                    "time": warning_time.isoformat(),
-                    "channel": ctx.channel.id
-                })
-                await self.config.member(user).warnings.set(warnings)
-                # Increment the count of warnings issued by the moderator for the current server
-                warnings_issued = await self.config.guild(ctx.guild).warnings_issued()
-                if str(ctx.author.id) not in warnings_issued:
-                    warnings_issued[str(ctx.author.id)] = 0
-                warnings_issued[str(ctx.author.id)] += 1
-                await self.config.guild(ctx.guild).warnings_issued.set(warnings_issued)
-                # Store the details of the warning issued by the moderator
-                mod_warnings = await self.config.guild(ctx.guild).mod_warnings()
-                if str(ctx.author.id) not in mod_warnings:
-                    mod_warnings[str(ctx.author.id)] = []
-                mod_warnings[str(ctx.author.id)].append({
-                    "user": user.id,
-                    "reason": reason,
-                    "time": warning_time.isoformat(),
-                    "channel": ctx.channel.id
-                })
-                await self.config.guild(ctx.guild).mod_warnings.set(mod_warnings)
+                warning_id, warning_count = await self.warnings.add(
+                    ctx.guild.id, user.id, ctx.author.id, ctx.channel.id, reason, warning_time
+                )
                 # Create the embed message
                 timestamp = int(warning_time.timestamp())
                 embed = discord.Embed(title="New AdWarn", color=discord.Color.red())
@@ -57,7 +102,7 @@ class AdWarn(commands.Cog):
                 embed.add_field(name="<:reason:1270075201694203956> | Reason", value=reason, inline=False)
                 embed.add_field(name="<:mod:1270075235785506847> | Moderator", value=ctx.author.mention, inline=True)
                 embed.add_field(name="<:time:1273366594877259858> | Time", value=f"<t:{timestamp}:F>", inline=False)
-                embed.set_footer(text=f"Total warnings: {len(warnings)}")
+                embed.set_footer(text=f"Total warnings: {warning_count}")
 
                 # Send the embed to the specified warning channel
                 await warn_channel.send(embed=embed)
@@ -73,7 +118,7 @@ class AdWarn(commands.Cog):
                 await confirmation_message.delete(delay=3)
 
                 # Check thresholds and take action if necessary
-                await self.check_thresholds(ctx, user, len(warnings))
+                await self.check_thresholds(ctx, user, warning_count)
             else:
                 error_embed = discord.Embed(
                     title="Error 404",
@@ -125,33 +170,66 @@ class AdWarn(commands.Cog):
         if duration:
             timeout_until = discord.utils.utcnow() + timedelta(minutes=duration)
             await user.edit(timed_out_until=timeout_until, reason="Reached warning threshold")
-            await self.config.member(user).untimeout_time.set(timeout_until.isoformat())
+            await self.set_untimeout(user.guild.id, user.id, timeout_until)
     async def schedule_untimeout(self, ctx, user, duration):
         untimeout_time = discord.utils.utcnow() + timedelta(minutes=duration)
-        await self.config.member(user).untimeout_time.set(untimeout_time.isoformat())
-    @commands.Cog.listener()
-    async def on_ready(self):
-        await self.check_untimeout_times()
-    async def check_untimeout_times(self):
-        for guild in self.bot.guilds:
-            for member in guild.members:
-                untimeout_time = await self.config.member(member).untimeout_time()
+        await self.set_untimeout(user.guild.id, user.id, untimeout_time)
+    async def set_untimeout(self, guild_id: int, member_id: int, untimeout_time: datetime):
+        """Persist a member's untimeout time and add it to the expiry schedule."""
+        await self.config.member_from_ids(guild_id, member_id).untimeout_time.set(untimeout_time.isoformat())
+        self._schedule_untimeout(guild_id, member_id, untimeout_time)
+    def _schedule_untimeout(self, guild_id: int, member_id: int, untimeout_time: datetime):
+        expires_at = untimeout_time.timestamp()
+        self.untimeout_deadlines[(guild_id, member_id)] = expires_at
+        heapq.heappush(self.untimeout_queue, (expires_at, guild_id, member_id))
+        # Only wake the worker if this is now the earliest deadline.
+        if self.untimeout_queue[0][0] == expires_at:
+            self.untimeout_wakeup.set()
+    async def load_untimeout_schedule(self, all_members):
+        """Rebuild the expiry schedule from the members that have a pending untimeout."""
+        for guild_id, members in all_members.items():
+            for member_id, data in members.items():
+                untimeout_time = data.get("untimeout_time")
                 if untimeout_time:
-                    untimeout_time = datetime.fromisoformat(untimeout_time)
-                    if discord.utils.utcnow() >= untimeout_time:
-                        await self.untimeout_user(member)
-                        await self.config.member(member).untimeout_time.clear()
+                    self._schedule_untimeout(int(guild_id), int(member_id), datetime.fromisoformat(untimeout_time))
+    async def untimeout_worker(self):
+        await self.bot.wait_until_red_ready()
+        while True:
+            self.untimeout_wakeup.clear()
+            now = discord.utils.utcnow().timestamp()
+            while self.untimeout_queue and self.untimeout_queue[0][0] <= now:
+                expires_at, guild_id, member_id = heapq.heappop(self.untimeout_queue)
+                if self.untimeout_deadlines.get((guild_id, member_id)) != expires_at:
+                    continue
+                del self.untimeout_deadlines[(guild_id, member_id)]
+                try:
+                    await self.expire_untimeout(guild_id, member_id)
+                except Exception:
+                    log.exception(f"Failed to lift the timeout of member {member_id} in guild {guild_id}.")
+            delay = self.untimeout_queue[0][0] - now if self.untimeout_queue else None
+            try:
+                await asyncio.wait_for(self.untimeout_wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+    async def expire_untimeout(self, guild_id: int, member_id: int):
+        guild = self.bot.get_guild(guild_id)
+        member = guild.get_member(member_id) if guild else None
+        if member is not None:
+            try:
+                await self.untimeout_user(member)
+            except discord.HTTPException:
+                pass
+        await self.config.member_from_ids(guild_id, member_id).untimeout_time.clear()
     async def untimeout_user(self, user: discord.Member):
         await user.edit(timed_out_until=None, reason="Timeout duration expired")
     @commands.command()
     @commands.has_permissions(manage_messages=True)
     async def removewarn(self, ctx, user: discord.Member, warning_id: str):
         """Remove a specific warning from a user by its UUID."""
-        warnings = await self.config.member(user).warnings()
-        warning_to_remove = next((warning for warning in warnings if warning["id"] == warning_id), None)
+        warning_to_remove = await self.warnings.get(ctx.guild.id, user.id, warning_id)
         if warning_to_remove:
-            warnings.remove(warning_to_remove)
-            await self.config.member(user).warnings.set(warnings)
+            await self.warnings.remove(warning_id)
+            warning_count = await self.warnings.count(ctx.guild.id, user.id)
             warn_channel_id = await self.config.guild(ctx.guild).warn_channel()
             if warn_channel_id:
                 warn_channel = self.bot.get_channel(warn_channel_id)
@@ -161,7 +239,7 @@ class AdWarn(commands.Cog):
                     embed.add_field(name="<:reason:1270075201694203956> | Warning", value=warning_to_remove["reason"], inline=False)
                     embed.add_field(name="<:mod:1270075235785506847> | Moderator", value=ctx.author.mention, inline=True)
                     embed.add_field(name="<:time:1273366594877259858> | Removed Time", value=f"<t:{int(discord.utils.utcnow().timestamp())}:F>", inline=True)
-                    embed.set_footer(text=f"Total warnings: {len(warnings)}")
+                    embed.set_footer(text=f"Total warnings: {warning_count}")
 
                     # Send the embed to the specified warning channel
                     await warn_channel.send(embed=embed)
@@ -190,17 +268,18 @@ class AdWarn(commands.Cog):
     @commands.has_permissions(manage_messages=True)
     async def warncount(self, ctx, user: discord.Member):
         """Get the total number of warnings a user has."""
-        warnings = await self.config.member(user).warnings()
+        warnings = await self.warnings.for_member(ctx.guild.id, user.id)
         embed = discord.Embed(
             title="Warning Count",
             description=f"{user.mention} has {len(warnings)} warnings.",
             color=discord.Color.blue()
         )
-        for warning in warnings:
-            timestamp = int(datetime.fromisoformat(warning['time']).timestamp())
+        # Embeds hold at most 25 fields; show the most recent warnings.
+        for warning in warnings[-25:]:
+            timestamp = int(warning['created_at'])
             embed.add_field(
                 name=f"Warning ID: {warning['id']}",
-                value=f"<:reason:1270075201694203956> | Reason: {warning['reason']}\n<:mod:1270075235785506847> | Moderator: <@{warning['moderator']}>\n<:time:1273366594877259858> | Time: <t:{timestamp}:F>",
+                value=f"<:reason:1270075201694203956> | Reason: {warning['reason']}\n<:mod:1270075235785506847> | Moderator: <@{warning['moderator_id']}>\n<:time:1273366594877259858> | Time: <t:{timestamp}:F>",
                 inline=False
             )
 
@@ -209,7 +288,7 @@ class AdWarn(commands.Cog):
     @commands.has_permissions(manage_messages=True)
     async def clearwarns(self, ctx, user: discord.User):
         """Clear all warnings for a user."""
-        await self.config.member_from_ids(ctx.guild.id, user.id).warnings.set([])
+        await self.warnings.clear(ctx.guild.id, user.id)
         warn_channel_id = await self.config.guild(ctx.guild).warn_channel()
         if (warn_channel_id):
             warn_channel = self.bot.get_channel(warn_channel_id)
@@ -240,10 +319,10 @@ class AdWarn(commands.Cog):
     @commands.has_permissions(manage_messages=True)
     async def unadwarn(self, ctx, user: discord.Member):
         """Clear the most recent warning for a user."""
-        warnings = await self.config.member(user).warnings()
-        if warnings:
-            removed_warning = warnings.pop()
-            await self.config.member(user).warnings.set(warnings)
+        removed_warning = await self.warnings.latest(ctx.guild.id, user.id)
+        if removed_warning:
+            await self.warnings.remove(removed_warning["id"])
+            warning_count = await self.warnings.count(ctx.guild.id, user.id)
             warn_channel_id = await self.config.guild(ctx.guild).warn_channel()
             if warn_channel_id:
                 warn_channel = self.bot.get_channel(warn_channel_id)
@@ -253,7 +332,7 @@ class AdWarn(commands.Cog):
                     embed.add_field(name="<:reason:1270075201694203956> | Warning", value=removed_warning["reason"], inline=False)
                     embed.add_field(name="<:mod:1270075235785506847> | Moderator", value=ctx.author.mention, inline=True)
                     embed.add_field(name="<:time:1273366594877259858> | Removed Time", value=f"<t:{int(discord.utils.utcnow().timestamp())}:F>", inline=True)
-                    embed.set_footer(text=f"Total warnings: {len(warnings)}")
+                    embed.set_footer(text=f"Total warnings: {warning_count}")
 
                     # Send the embed to the specified warning channel
                     await warn_channel.send(embed=embed)
@@ -282,11 +361,10 @@ class AdWarn(commands.Cog):
     @commands.has_permissions(manage_messages=True)
     async def editaw(self, ctx, user: discord.Member, warning_id: str, *, new_reason: str):
         """Edit a specific warning by its UUID."""
-        warnings = await self.config.member(user).warnings()
-        warning_to_edit = next((warning for warning in warnings if warning["id"] == warning_id), None)
+        warning_to_edit = await self.warnings.get(ctx.guild.id, user.id, warning_id)
         if warning_to_edit:
-            warning_to_edit["reason"] = new_reason
-            await self.config.member(user).warnings.set(warnings)
+            await self.warnings.edit(warning_id, new_reason)
+            warning_count = await self.warnings.count(ctx.guild.id, user.id)
             warn_channel_id = await self.config.guild(ctx.guild).warn_channel()
             if warn_channel_id:
                 warn_channel = self.bot.get_channel(warn_channel_id)
@@ -296,7 +374,7 @@ class AdWarn(commands.Cog):
                     embed.add_field(name="<:reason:1270075201694203956> | Warning", value=new_reason, inline=False)
                     embed.add_field(name="<:mod:1270075235785506847> | Moderator", value=ctx.author.mention, inline=True)
                     embed.add_field(name="<:time:1273366594877259858> | Edited Time", value=f"<t:{int(discord.utils.utcnow().timestamp())}:F>", inline=True)
-                    embed.set_footer(text=f"Total warnings: {len(warnings)}")
+                    embed.set_footer(text=f"Total warnings: {warning_count}")
 
                     # Send the embed to the specified warning channel
                     await warn_channel.send(embed=embed)
@@ -325,14 +403,13 @@ class AdWarn(commands.Cog):
     @commands.has_permissions(manage_messages=True)
     async def topwarners(self, ctx):
         """Show the top 5 users who have issued the most warnings in the current server."""
-        warnings_issued = await self.config.guild(ctx.guild).warnings_issued()
-        sorted_users = sorted(warnings_issued.items(), key=lambda item: item[1], reverse=True)
+        sorted_users = await self.warnings.top_moderators(ctx.guild.id, limit=5)
         embed = discord.Embed(
             title="Top 5 Warners",
             color=discord.Color.gold()
         )
         if sorted_users:
-            for rank, (user_id, count) in enumerate(sorted_users[:5], start=1):
+            for rank, (user_id, count) in enumerate(sorted_users, start=1):
                 user = self.bot.get_user(int(user_id))
                 embed.add_field(
                     name=f"{rank}. {user} (ID: {user_id})",
@@ -344,24 +421,32 @@ class AdWarn(commands.Cog):
         await ctx.send(embed=embed)
     @commands.command()
     @commands.has_permissions(manage_messages=True)
-    async def modwarns(self, ctx, moderator: discord.Member):
+    async def modwarns(self, ctx, moderator: discord.Member, page: int = 1):
         """Show the number of warnings issued by a moderator and who they have warned in the current server."""
-        mod_warnings = await self.config.guild(ctx.guild).mod_warnings()
-        if str(moderator.id) in mod_warnings:
-            warnings = mod_warnings[str(moderator.id)]
+        warnings_per_page = 10
+        total, warnings = await self.warnings.by_moderator(
+            ctx.guild.id, moderator.id, warnings_per_page, (max(page, 1) - 1) * warnings_per_page
+        )
+        if total:
+            total_pages = -(-total // warnings_per_page)
+            if not warnings:
+                await ctx.send(embed=discord.Embed(description=f"There are only {total_pages} pages.", color=discord.Color.red()))
+                return
             embed = discord.Embed(
                 title=f"Warnings Issued by {moderator}",
                 color=discord.Color.blue()
             )
-            embed.add_field(name="Total Warnings Issued", value=len(warnings), inline=False)
+            embed.add_field(name="Total Warnings Issued", value=total, inline=False)
             for warning in warnings:
-                warned_user = self.bot.get_user(warning["user"])
-                timestamp = int(datetime.fromisoformat(warning['time']).timestamp())
+                warned_user = self.bot.get_user(warning["member_id"])
+                timestamp = int(warning['created_at'])
+                removed = " (removed)" if warning["removed_at"] else ""
                 embed.add_field(
-                    name=f"<:user:1268083437768671303> | User Warned: {warned_user} (ID: {warning['user']})",
-                    value=f"<:reason:1270075201694203956> | Reason: {warning['reason']}\n<:time:1273366594877259858> | Time: <t:{timestamp}:F>\n<:channel:1270075226566295623> | Channel: <#{warning['channel']}>",
+                    name=f"<:user:1268083437768671303> | User Warned: {warned_user} (ID: {warning['member_id']}){removed}",
+                    value=f"<:reason:1270075201694203956> | Reason: {warning['reason']}\n<:time:1273366594877259858> | Time: <t:{timestamp}:F>\n<:channel:1270075226566295623> | Channel: <#{warning['channel_id']}>",
                     inline=False
                 )
+            embed.set_footer(text=f"Page {max(page, 1)}/{total_pages}")
         else:
             embed = discord.Embed(
                 title=f"{moderator} has not issued any warnings.",
@@ -370,12 +455,21 @@ class AdWarn(commands.Cog):
         await ctx.send(embed=embed)
     @commands.command()
     @commands.has_permissions(manage_messages=True)
-    async def adboard(self, ctx):
-        """Show all users who have issued warnings and how many they have issued."""
-        warnings_issued = await self.config.guild(ctx.guild).warnings_issued()
-        sorted_users = sorted(warnings_issued.items(), key=lambda item: item[1], reverse=True)
+    async def adboard(self, ctx, period: str = "all"):
+        """Show all users who have issued warnings and how many they have issued.
+
+        `period` can be `all`, `week` or `month`.
+        """
+        now = discord.utils.utcnow()
+        periods = {"all": (ALL_TIME, "All Time"), "week": (week_key(now), "This Week"), "month": (month_key(now), "This Month")}
+        if period.lower() not in periods:
+            await ctx.send(f"Invalid period. Valid periods are: {', '.join(periods)}")
+            return
+        period_key, period_name = periods[period.lower()]
+        # Embeds hold at most 25 fields.
+        sorted_users = await self.warnings.top_moderators(ctx.guild.id, period_key, limit=25)
         embed = discord.Embed(
-            title="AdBoard - Warning Issuers",
+            title=f"AdBoard - Warning Issuers ({period_name})",
             color=discord.Color.purple()
         )
         if sorted_users:
@@ -518,36 +612,65 @@ class AdWarn(commands.Cog):
         embed.add_field(name="Ends", value=f"<t:{int(race_end_time.timestamp())}:R>", inline=True)
         embed.add_field(name="Participants", value=participants_mentions, inline=False)
         race_message = await ctx.send(embed=embed)
-        await asyncio.sleep(duration * 60)
-        # Compile results as quickly as possible
-        results = {}
-        for participant in participants:
-            warnings = 0
-            for channel in ctx.guild.text_channels:
-                async for message in channel.history(after=race_start_time, limit=None):
-                    if message.author == participant and "adwarn" in message.content:
-                        warnings += 1
-            results[participant] = warnings
+        race_id = await self.race_store.start(
+            ctx.guild.id, ctx.channel.id, race_message.id, duration,
+            race_start_time.timestamp(), race_end_time.timestamp(), [participant.id for participant in participants]
+        )
+        await self.resume_race(await self.race_store.get(race_id))
+    async def resume_race(self, race):
+        """Start counting a race live and schedule its results for when it ends."""
+        self.races.setdefault(race["guild_id"], {})[race["id"]] = await self.race_store.scores(race["id"])
+        self.race_tasks[race["id"]] = asyncio.create_task(self.finish_race(race))
+    async def finish_race(self, race):
+        delay = race["ends_at"] - discord.utils.utcnow().timestamp()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        # Scores were counted live, so the results are ready as soon as the timer fires.
+        guild_races = self.races.get(race["guild_id"], {})
+        results = guild_races.pop(race["id"], {})
+        if not guild_races:
+            self.races.pop(race["guild_id"], None)
+        self.race_tasks.pop(race["id"], None)
+        await self.race_store.finish(race["id"])
         sorted_results = sorted(results.items(), key=lambda item: item[1], reverse=True)
+        guild = self.bot.get_guild(race["guild_id"])
+        channel = guild.get_channel(race["channel_id"]) if guild else None
+        if channel is None:
+            return
         # Edit the race started message to display the results
-        embed.title = "AdWarn Race Results"
-        embed.description = f"The race lasted for {duration} minutes. Here are the results:"
-        embed.clear_fields()
-        for rank, (user, count) in enumerate(sorted_results, start=1):
+        embed = discord.Embed(
+            title="AdWarn Race Results",
+            description=f"The race lasted for {race['duration']} minutes. Here are the results:",
+            color=discord.Color.gold()
+        )
+        for rank, (user_id, count) in enumerate(sorted_results, start=1):
+            user = guild.get_member(user_id) or f"<@{user_id}>"
             embed.add_field(name=f"{rank}. {user}", value=f"Warnings: {count}", inline=False)
-        await race_message.edit(embed=embed)
+        try:
+            await channel.get_partial_message(race["message_id"]).edit(embed=embed)
+        except discord.HTTPException:
+            pass
+    async def count_race_message(self, message):
+        guild_races = self.races.get(message.guild.id)
+        if not guild_races or "adwarn" not in message.content:
+            return
+        for race_id, scores in guild_races.items():
+            if message.author.id in scores:
+                scores[message.author.id] += 1
+                await self.race_store.add_score(race_id, message.author.id)
     @commands.command()
     @commands.has_permissions(administrator=True)
     async def weeklystats(self, ctx):
         """Send an embed with the weekly AdWarn stats sorted by per-issuer."""
-        weekly_stats = await self.config.guild(ctx.guild).weekly_stats()
+        await self.flush_stats()
+        weekly_stats = self._period_counts(await self.config.guild(ctx.guild).weekly_stats(), week_key(discord.utils.utcnow()))
         sorted_stats = sorted(weekly_stats.items(), key=lambda item: item[1], reverse=True)
         embed = discord.Embed(
             title="Weekly AdWarn Stats",
             color=discord.Color.blue()
         )
         if sorted_stats:
-            for rank, (user_id, count) in enumerate(sorted_stats, start=1):
+            for rank, (user_id, count) in enumerate(sorted_stats[:25], start=1):
                 user = self.bot.get_user(int(user_id))
                 embed.add_field(
                     name=f"{rank}. {user} (ID: {user_id})",
@@ -557,20 +680,19 @@ class AdWarn(commands.Cog):
         else:
             embed.add_field(name="No data available", value="No warnings have been issued this week.", inline=False)
         await ctx.send(embed=embed)
-        # Reset weekly stats
-        await self.config.guild(ctx.guild).weekly_stats.set({})
     @commands.command()
     @commands.has_permissions(administrator=True)
     async def monthlystats(self, ctx):
         """Send an embed with the monthly AdWarn stats sorted by per-issuer."""
-        monthly_stats = await self.config.guild(ctx.guild).monthly_stats()
+        await self.flush_stats()
+        monthly_stats = self._period_counts(await self.config.guild(ctx.guild).monthly_stats(), month_key(discord.utils.utcnow()))
         sorted_stats = sorted(monthly_stats.items(), key=lambda item: item[1], reverse=True)
         embed = discord.Embed(
             title="Monthly AdWarn Stats",
             color=discord.Color.blue()
         )
         if sorted_stats:
-            for rank, (user_id, count) in enumerate(sorted_stats, start=1):
+            for rank, (user_id, count) in enumerate(sorted_stats[:25], start=1):
                 user = self.bot.get_user(int(user_id))
                 embed.add_field(
                     name=f"{rank}. {user} (ID: {user_id})",
@@ -580,23 +702,46 @@ class AdWarn(commands.Cog):
         else:
             embed.add_field(name="No data available", value="No warnings have been issued this month.", inline=False)
         await ctx.send(embed=embed)
-        # Reset monthly stats
-        await self.config.guild(ctx.guild).monthly_stats.set({})
+    @staticmethod
+    def _period_counts(stats, period):
+        """Counts stored for a period, or nothing if the stored stats belong to an earlier one."""
+        if "period" not in stats:
+            # Stats saved before periods were tracked count towards the current period.
+            return dict(stats)
+        return stats["counts"] if stats["period"] == period else {}
     @commands.Cog.listener()
     async def on_message(self, message):
-        """Listener to update weekly and monthly stats."""
-        if message.author.bot:
+        """Listener to update race scores."""
+        if message.guild is None:
             return
-        if message.content.startswith("!adwarn"):
-            author_id = str(message.author.id)
-            weekly_stats = await self.config.guild(message.guild).weekly_stats()
-            monthly_stats = await self.config.guild(message.guild).monthly_stats()
-            if author_id not in weekly_stats:
-                weekly_stats[author_id] = 0
-            if author_id not in monthly_stats:
-                monthly_stats[author_id] = 0
-            weekly_stats[author_id] += 1
-            monthly_stats[author_id] += 1
-
-            await self.config.guild(message.guild).weekly_stats.set(weekly_stats)
-            await self.config.guild(message.guild).monthly_stats.set(monthly_stats)
+        await self.count_race_message(message)
+    @commands.Cog.listener()
+    async def on_command_completion(self, ctx):
+        """Count successful adwarn invocations towards the weekly and monthly stats."""
+        if ctx.guild is None or ctx.author.bot or ctx.command.qualified_name != "adwarn":
+            return
+        now = discord.utils.utcnow()
+        key = (ctx.guild.id, week_key(now), month_key(now))
+        self.stats_buffer.setdefault(key, Counter())[str(ctx.author.id)] += 1
+    @tasks.loop(minutes=5)
+    async def flush_stats_task(self):
+        try:
+            await self.flush_stats()
+        except Exception:
+            log.exception("Failed to flush AdWarn stats.")
+    async def flush_stats(self):
+        """Add the buffered stats deltas to the stored weekly and monthly stats."""
+        buffer, self.stats_buffer = self.stats_buffer, {}
+        for (guild_id, week, month), deltas in buffer.items():
+            guild_config = self.config.guild_from_id(guild_id)
+            for stats_value, period in ((guild_config.weekly_stats, week), (guild_config.monthly_stats, month)):
+                async with stats_value() as stats:
+                    current = stats.get("period")
+                    if current is not None and current > period:
+                        # These deltas belong to a period that has already rolled over.
+                        continue
+                    counts = dict(self._period_counts(stats, period))
+                    for user_id, count in deltas.items():
+                        counts[user_id] = counts.get(user_id, 0) + count
+                    stats.clear()
+                    stats.update(period=period, counts=counts)
@@ -0,0 +1,87 @@
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import aiosqlite
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS races (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    guild_id INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    message_id INTEGER NOT NULL,
+    duration INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    ends_at REAL NOT NULL,
+    finished INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS races_active ON races (finished, ends_at);
+
+CREATE TABLE IF NOT EXISTS race_scores (
+    race_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    score INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (race_id, user_id)
+);
+"""
+
+
+class RaceStore:
+    """SQLite-backed record of AdWarn races and their live participant scores."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.db: Optional[aiosqlite.Connection] = None
+
+    async def open(self):
+        self.db = await aiosqlite.connect(self.path)
+        self.db.row_factory = aiosqlite.Row
+        await self.db.executescript(SCHEMA)
+        await self.db.commit()
+
+    async def close(self):
+        if self.db is not None:
+            await self.db.close()
+            self.db = None
+
+    async def start(
+        self,
+        guild_id: int,
+        channel_id: int,
+        message_id: int,
+        duration: int,
+        started_at: float,
+        ends_at: float,
+        participants: List[int],
+    ) -> int:
+        cursor = await self.db.execute(
+            "INSERT INTO races (guild_id, channel_id, message_id, duration, started_at, ends_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (guild_id, channel_id, message_id, duration, started_at, ends_at),
+        )
+        race_id = cursor.lastrowid
+        await self.db.executemany(
+            "INSERT INTO race_scores (race_id, user_id) VALUES (?, ?)", [(race_id, user_id) for user_id in participants]
+        )
+        await self.db.commit()
+        return race_id
+
+    async def add_score(self, race_id: int, user_id: int, amount: int = 1):
+        await self.db.execute(
+            "UPDATE race_scores SET score = score + ? WHERE race_id = ? AND user_id = ?", (amount, race_id, user_id)
+        )
+        await self.db.commit()
+
+    async def get(self, race_id: int) -> Optional[aiosqlite.Row]:
+        async with self.db.execute("SELECT * FROM races WHERE id = ?", (race_id,)) as cursor:
+            return await cursor.fetchone()
+
+    async def active(self) -> List[aiosqlite.Row]:
+        async with self.db.execute("SELECT * FROM races WHERE finished = 0 ORDER BY ends_at") as cursor:
+            return await cursor.fetchall()
+
+    async def scores(self, race_id: int) -> Dict[int, int]:
+        async with self.db.execute("SELECT user_id, score FROM race_scores WHERE race_id = ?", (race_id,)) as cursor:
+            return {row["user_id"]: row["score"] for row in await cursor.fetchall()}
+
+    async def finish(self, race_id: int):
+        await self.db.execute("UPDATE races SET finished = 1 WHERE id = ?", (race_id,))
+        await self.db.commit()
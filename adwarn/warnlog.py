@@ -0,0 +1,245 @@
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import aiosqlite
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS warnings (
+    id TEXT PRIMARY KEY,
+    guild_id INTEGER NOT NULL,
+    member_id INTEGER NOT NULL,
+    moderator_id INTEGER NOT NULL,
+    channel_id INTEGER,
+    reason TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    removed_at REAL
+);
+CREATE INDEX IF NOT EXISTS warnings_member ON warnings (guild_id, member_id, removed_at, created_at);
+CREATE INDEX IF NOT EXISTS warnings_moderator ON warnings (guild_id, moderator_id, created_at);
+CREATE INDEX IF NOT EXISTS warnings_created ON warnings (guild_id, created_at);
+
+CREATE TABLE IF NOT EXISTS moderator_counts (
+    guild_id INTEGER NOT NULL,
+    period TEXT NOT NULL,
+    moderator_id INTEGER NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (guild_id, period, moderator_id)
+);
+CREATE INDEX IF NOT EXISTS moderator_counts_rank ON moderator_counts (guild_id, period, count);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Period key for the all-time moderator counts.
+ALL_TIME = "all"
+# Meta key recording that the old Config warnings have been imported.
+LEGACY_IMPORTED = "legacy_imported"
+# Namespace for the ids of legacy warnings that only survived in mod_warnings.
+LEGACY_NAMESPACE = uuid.UUID("5f1d3c2e-8a4b-4e6f-9c1d-2b7a0e9f4c31")
+
+
+def week_key(when: datetime) -> str:
+    year, week, _ = when.isocalendar()
+    return f"week:{year}-W{week:02d}"
+
+
+def month_key(when: datetime) -> str:
+    return f"month:{when.year}-{when.month:02d}"
+
+
+def period_keys(when: datetime) -> Tuple[str, str, str]:
+    """The rollup periods a warning issued at ``when`` counts towards."""
+    when = when.astimezone(timezone.utc)
+    return ALL_TIME, week_key(when), month_key(when)
+
+
+class WarningLog:
+    """SQLite-backed append-only log of warnings with per-moderator rollups.
+
+    Warnings are only ever inserted. Removing one stamps ``removed_at`` so it
+    stops counting against the member but stays in the moderator's history.
+    Issued counts are kept per moderator for all time, the ISO week and the
+    month, and are bumped in the same transaction as the insert.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.db: Optional[aiosqlite.Connection] = None
+
+    async def open(self):
+        self.db = await aiosqlite.connect(self.path)
+        self.db.row_factory = aiosqlite.Row
+        await self.db.executescript(SCHEMA)
+        await self.db.commit()
+
+    async def close(self):
+        if self.db is not None:
+            await self.db.close()
+            self.db = None
+
+    async def import_legacy(
+        self,
+        member_warnings: Dict[int, Dict[int, List[dict]]],
+        mod_warnings: Dict[int, Dict[str, List[dict]]],
+        warnings_issued: Dict[int, Dict[str, int]],
+    ) -> int:
+        """Import the old per-member ``warnings`` and per-guild ``mod_warnings``/``warnings_issued`` Config blobs.
+
+        Runs at most once: the rows, the counts and the meta flag are written in
+        one transaction, so an interrupted import leaves nothing behind and a
+        finished one is skipped. Returns 0 when it was already done.
+        """
+        async with self.db.execute("SELECT 1 FROM meta WHERE key = ?", (LEGACY_IMPORTED,)) as cursor:
+            if await cursor.fetchone() is not None:
+                return 0
+        rows = []
+        seen = set()
+        for guild_id, members in member_warnings.items():
+            for member_id, warnings in members.items():
+                for warning in warnings:
+                    created_at = datetime.fromisoformat(warning["time"]).timestamp()
+                    seen.add((guild_id, member_id, warning["moderator"], created_at))
+                    rows.append((
+                        warning["id"], guild_id, member_id, warning["moderator"],
+                        warning.get("channel"), warning["reason"], created_at, None,
+                    ))
+        # mod_warnings also kept warnings that were later removed from the member.
+        now = time.time()
+        for guild_id, moderators in mod_warnings.items():
+            for moderator_id, warnings in moderators.items():
+                for warning in warnings:
+                    created_at = datetime.fromisoformat(warning["time"]).timestamp()
+                    if (guild_id, warning["user"], int(moderator_id), created_at) in seen:
+                        continue
+                    # Derive the id from the warning itself so it is the same on every run.
+                    warning_id = str(uuid.uuid5(
+                        LEGACY_NAMESPACE, f"{guild_id}:{warning['user']}:{moderator_id}:{warning['time']}"
+                    ))
+                    rows.append((
+                        warning_id, guild_id, warning["user"], int(moderator_id),
+                        warning.get("channel"), warning["reason"], created_at, now,
+                    ))
+        try:
+            await self.db.executemany(
+                "INSERT OR IGNORE INTO warnings (id, guild_id, member_id, moderator_id, channel_id, reason, created_at, removed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            await self.db.executemany(
+                "INSERT INTO moderator_counts (guild_id, period, moderator_id, count) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (guild_id, period, moderator_id) DO UPDATE SET count = count + excluded.count",
+                [
+                    (guild_id, ALL_TIME, int(moderator_id), count)
+                    for guild_id, counts in warnings_issued.items()
+                    for moderator_id, count in counts.items()
+                ],
+            )
+            await self.db.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?)", (LEGACY_IMPORTED, str(time.time()))
+            )
+        except BaseException:
+            # Leave nothing half-imported for the next write on this connection to commit.
+            await self.db.rollback()
+            raise
+        await self.db.commit()
+        return len(rows)
+
+    async def add(
+        self, guild_id: int, member_id: int, moderator_id: int, channel_id: int, reason: str, when: datetime
+    ) -> Tuple[str, int]:
+        """Append a warning and return its id and the member's active warning count."""
+        warning_id = str(uuid.uuid4())
+        await self.db.execute(
+            "INSERT INTO warnings (id, guild_id, member_id, moderator_id, channel_id, reason, created_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (warning_id, guild_id, member_id, moderator_id, channel_id, reason, when.timestamp()),
+        )
+        await self.db.executemany(
+            "INSERT INTO moderator_counts (guild_id, period, moderator_id, count) VALUES (?, ?, ?, 1)"
+            " ON CONFLICT (guild_id, period, moderator_id) DO UPDATE SET count = count + 1",
+            [(guild_id, period, moderator_id) for period in period_keys(when)],
+        )
+        await self.db.commit()
+        return warning_id, await self.count(guild_id, member_id)
+
+    async def count(self, guild_id: int, member_id: int) -> int:
+        async with self.db.execute(
+            "SELECT COUNT(*) FROM warnings WHERE guild_id = ? AND member_id = ? AND removed_at IS NULL",
+            (guild_id, member_id),
+        ) as cursor:
+            return (await cursor.fetchone())[0]
+
+    async def for_member(self, guild_id: int, member_id: int) -> List[aiosqlite.Row]:
+        """A member's active warnings, oldest first."""
+        async with self.db.execute(
+            "SELECT * FROM warnings WHERE guild_id = ? AND member_id = ? AND removed_at IS NULL ORDER BY created_at",
+            (guild_id, member_id),
+        ) as cursor:
+            return await cursor.fetchall()
+
+    async def get(self, guild_id: int, member_id: int, warning_id: str) -> Optional[aiosqlite.Row]:
+        async with self.db.execute(
+            "SELECT * FROM warnings WHERE id = ? AND guild_id = ? AND member_id = ? AND removed_at IS NULL",
+            (warning_id, guild_id, member_id),
+        ) as cursor:
+            return await cursor.fetchone()
+
+    async def latest(self, guild_id: int, member_id: int) -> Optional[aiosqlite.Row]:
+        async with self.db.execute(
+            "SELECT * FROM warnings WHERE guild_id = ? AND member_id = ? AND removed_at IS NULL"
+            " ORDER BY created_at DESC LIMIT 1",
+            (guild_id, member_id),
+        ) as cursor:
+            return await cursor.fetchone()
+
+    async def remove(self, warning_id: str) -> bool:
+        cursor = await self.db.execute(
+            "UPDATE warnings SET removed_at = ? WHERE id = ? AND removed_at IS NULL", (time.time(), warning_id)
+        )
+        await self.db.commit()
+        return cursor.rowcount == 1
+
+    async def clear(self, guild_id: int, member_id: int) -> int:
+        cursor = await self.db.execute(
+            "UPDATE warnings SET removed_at = ? WHERE guild_id = ? AND member_id = ? AND removed_at IS NULL",
+            (time.time(), guild_id, member_id),
+        )
+        await self.db.commit()
+        return cursor.rowcount
+
+    async def edit(self, warning_id: str, reason: str) -> bool:
+        cursor = await self.db.execute(
+            "UPDATE warnings SET reason = ? WHERE id = ? AND removed_at IS NULL", (reason, warning_id)
+        )
+        await self.db.commit()
+        return cursor.rowcount == 1
+
+    async def by_moderator(
+        self, guild_id: int, moderator_id: int, limit: int, offset: int
+    ) -> Tuple[int, List[aiosqlite.Row]]:
+        """Return the total number of warnings a moderator issued and one page of them, newest first."""
+        async with self.db.execute(
+            "SELECT COUNT(*) FROM warnings WHERE guild_id = ? AND moderator_id = ?", (guild_id, moderator_id)
+        ) as cursor:
+            total = (await cursor.fetchone())[0]
+        async with self.db.execute(
+            "SELECT * FROM warnings WHERE guild_id = ? AND moderator_id = ? ORDER BY created_at DESC LIMIT ? OFFSET ?",
+            (guild_id, moderator_id, limit, offset),
+        ) as cursor:
+            rows = await cursor.fetchall()
+        return total, rows
+
+    async def top_moderators(self, guild_id: int, period: str = ALL_TIME, limit: int = -1) -> List[aiosqlite.Row]:
+        """Moderators ranked by warnings issued in a period, most first."""
+        async with self.db.execute(
+            "SELECT moderator_id, count FROM moderator_counts WHERE guild_id = ? AND period = ? AND count > 0"
+            " ORDER BY count DESC LIMIT ?",
+            (guild_id, period, limit),
+        ) as cursor:
+            return await cursor.fetchall()
@@ -1,18 +1,62 @@
 import discord
 from redbot.core import commands, Config
 from redbot.core.bot import Red
+from redbot.core.data_manager import cog_data_path
 from redbot.core.i18n import Translator, set_contextual_locales_from_guild
 from discord.ext import tasks
 import asyncio
-import random
-import string
+import heapq
+import io
 import logging
+import time
+from collections import Counter
 from datetime import datetime, timezone, timedelta
+from typing import Dict, List, Optional, Tuple
 import humanize
 
+from .codes import PremiumCodeLedger
+from .reports import BumpReportStore
+
 _ = Translator("Bumper", __file__)
 log = logging.getLogger("fb.Bumper")
 
+# Maximum number of bump channels sent to at the same time.
+BUMP_CONCURRENCY = 10
+# Attempts per destination for transient failures (429 / 5xx).
+BUMP_RETRIES = 3
+BUMP_RETRY_BASE_DELAY = 1.5
+# Interval between two automatic bumps of the same premium guild.
+AUTO_BUMP_INTERVAL = timedelta(hours=2)
+
+class ReportBumpButton(discord.ui.DynamicItem[discord.ui.Button], template=r"bumper:report:(?P<guild_id>[0-9]+)"):
+    """Persistent report button shared by every bump message.
+
+    The source guild is encoded in the custom_id, so the button keeps working
+    across restarts without holding a live View per sent message.
+    """
+
+    def __init__(self, guild_id: int):
+        super().__init__(
+            discord.ui.Button(
+                label="Report",
+                style=discord.ButtonStyle.danger,
+                custom_id=f"bumper:report:{guild_id}",
+            )
+        )
+        self.guild_id = guild_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(int(match["guild_id"]))
+
+    async def callback(self, interaction: discord.Interaction):
+        cog = interaction.client.get_cog("Bumper")
+        if cog is None:
+            await interaction.response.send_message(embed=discord.Embed(description="Bumping is currently unavailable.", color=discord.Color.red()), ephemeral=True)
+            return
+        await cog.report_bump(interaction, self.guild_id)
+
+
 class Bumper(commands.Cog):
     """
     A cog for bumping your server to other servers.
@@ -34,7 +78,8 @@ class Bumper(commands.Cog):
             "config_log_channel": None,
             "premium_expiry": None,
             "image_url": None,
-            "thumbnail_url": None
+            "thumbnail_url": None,
+            "next_auto_bump": None
         }
 
         default_global = {
@@ -48,11 +93,108 @@ class Bumper(commands.Cog):
         self.config.register_guild(**default_guild)
         self.config.register_global(**default_global)
 
-        self.reported_bumps = {}
+        self.reports = BumpReportStore(cog_data_path(self) / "reports.db")
+        self.codes = PremiumCodeLedger(cog_data_path(self) / "codes.db")
+        # guild_id -> bump_channel_id for every guild that receives bumps
+        self.bump_channels: Dict[int, int] = {}
+        # guild_id -> bump_log_channel_id for the same guilds, read when logging a bump
+        self.bump_log_channels: Dict[int, int] = {}
+        # Min-heap of (deadline, guild_id) for premium auto-bumps. Entries whose
+        # deadline no longer matches auto_bump_deadlines are stale and skipped.
+        self.auto_bump_queue: List[tuple] = []
+        self.auto_bump_deadlines: Dict[int, datetime] = {}
+        # guild_id -> (guild name, embed, view) ready to send; cleared by bumpset.
+        self.bump_payloads: Dict[int, Tuple[str, discord.Embed, discord.ui.View]] = {}
+
+    async def cog_load(self):
+        await self.reports.open()
+        await self.codes.open()
+        legacy_codes = await self.config.premium_codes()
+        if legacy_codes:
+            imported = await self.codes.import_legacy(legacy_codes)
+            await self.config.premium_codes.clear()
+            log.info(f"Moved {imported} premium codes from Config to the code ledger.")
+        self.bot.add_dynamic_items(ReportBumpButton)
+        await self.build_bump_registry()
+        await self.build_auto_bump_schedule()
         self.auto_bump_task.start()
 
-    def cog_unload(self):
+    async def cog_unload(self):
         self.auto_bump_task.cancel()
+        self.bot.remove_dynamic_items(ReportBumpButton)
+        await self.reports.close()
+        await self.codes.close()
+
+    async def build_bump_registry(self):
+        """Build the bump channel registry from stored guild settings."""
+        blacklisted_guilds = set(await self.config.blacklisted_guilds())
+        all_guilds = await self.config.all_guilds()
+        self.bump_channels = {
+            guild_id: data["bump_channel"]
+            for guild_id, data in all_guilds.items()
+            if data.get("bump_channel") and guild_id not in blacklisted_guilds
+        }
+        self.bump_log_channels = {
+            guild_id: data["bump_log_channel"]
+            for guild_id, data in all_guilds.items()
+            if data.get("bump_log_channel") and guild_id not in blacklisted_guilds
+        }
+        log.info(f"Bump registry built with {len(self.bump_channels)} subscribed guilds.")
+
+    async def build_auto_bump_schedule(self):
+        """Give every premium guild its own auto-bump deadline.
+
+        Deadlines come from the persisted next_auto_bump, falling back to
+        last_bump + AUTO_BUMP_INTERVAL. Overdue guilds (e.g. after downtime) are
+        spread evenly across one interval instead of all bumping at once.
+        """
+        now = datetime.now(timezone.utc)
+        all_guilds = await self.config.all_guilds()
+        self.auto_bump_queue = []
+        self.auto_bump_deadlines = {}
+        overdue = []
+        for guild_id, data in all_guilds.items():
+            if not data.get("premium"):
+                continue
+            if data.get("next_auto_bump"):
+                deadline = datetime.fromisoformat(data["next_auto_bump"])
+            elif data.get("last_bump"):
+                deadline = datetime.fromisoformat(data["last_bump"]) + AUTO_BUMP_INTERVAL
+            else:
+                deadline = now
+            if deadline <= now:
+                overdue.append((deadline, guild_id))
+            else:
+                self._schedule_auto_bump(guild_id, deadline)
+
+        overdue.sort()
+        step = AUTO_BUMP_INTERVAL / max(len(overdue), 1)
+        for index, (_, guild_id) in enumerate(overdue):
+            self._schedule_auto_bump(guild_id, now + step * index)
+        log.info(f"Auto bump schedule built for {len(self.auto_bump_deadlines)} premium guilds ({len(overdue)} overdue).")
+
+    def _schedule_auto_bump(self, guild_id: int, deadline: datetime):
+        self.auto_bump_deadlines[guild_id] = deadline
+        heapq.heappush(self.auto_bump_queue, (deadline, guild_id))
+
+    def _unschedule_auto_bump(self, guild_id: int):
+        # The heap entry is left in place and dropped lazily when popped.
+        self.auto_bump_deadlines.pop(guild_id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        if guild.id in await self.config.blacklisted_guilds():
+            return
+        guild_data = await self.config.guild(guild).all()
+        if guild_data["bump_channel"]:
+            self.bump_channels[guild.id] = guild_data["bump_channel"]
+        if guild_data["bump_log_channel"]:
+            self.bump_log_channels[guild.id] = guild_data["bump_log_channel"]
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.bump_channels.pop(guild.id, None)
+        self.bump_log_channels.pop(guild.id, None)
 
     @commands.group()
     @commands.guild_only()
@@ -65,6 +207,8 @@ class Bumper(commands.Cog):
     async def channel(self, ctx: commands.Context, channel: discord.TextChannel):
         """Set the bump channel."""
         await self.config.guild(ctx.guild).bump_channel.set(channel.id)
+        if ctx.guild.id not in await self.config.blacklisted_guilds():
+            self.bump_channels[ctx.guild.id] = channel.id
         await ctx.send(embed=discord.Embed(description=f"Bump channel set to: {channel.mention}", color=discord.Color.green()))
         await self.log_new_server_bump(ctx.guild)
 
@@ -72,6 +216,7 @@ class Bumper(commands.Cog):
     async def invite(self, ctx: commands.Context, invite: str):
         """Set the invite link."""
         await self.config.guild(ctx.guild).invite.set(invite)
+        self.bump_payloads.pop(ctx.guild.id, None)
         await ctx.send(embed=discord.Embed(description=f"Invite link set to: {invite}", color=discord.Color.green()))
 
     @bumpset.command()
@@ -81,24 +226,28 @@ class Bumper(commands.Cog):
             await ctx.send(embed=discord.Embed(description="Description is too long. Please keep it under 1024 characters.", color=discord.Color.red()))
             return
         await self.config.guild(ctx.guild).description.set(description)
+        self.bump_payloads.pop(ctx.guild.id, None)
         await ctx.send(embed=discord.Embed(description="Description set.", color=discord.Color.green()))
 
     @bumpset.command()
     async def embed_color(self, ctx: commands.Context, color: discord.Color):
         """Set the embed color."""
         await self.config.guild(ctx.guild).embed_color.set(color.value)
+        self.bump_payloads.pop(ctx.guild.id, None)
         await ctx.send(embed=discord.Embed(description=f"Embed color set to: {color}", color=discord.Color.green()))
 
     @bumpset.command()
     async def image(self, ctx: commands.Context, image_url: str):
         """Set the image URL for the bump embed."""
         await self.config.guild(ctx.guild).image_url.set(image_url)
+        self.bump_payloads.pop(ctx.guild.id, None)
         await ctx.send(embed=discord.Embed(description="Image URL set.", color=discord.Color.green()))
 
     @bumpset.command()
     async def thumbnail(self, ctx: commands.Context, thumbnail_url: str):
         """Set the thumbnail URL for the bump embed."""
         await self.config.guild(ctx.guild).thumbnail_url.set(thumbnail_url)
+        self.bump_payloads.pop(ctx.guild.id, None)
         await ctx.send(embed=discord.Embed(description="Thumbnail URL set.", color=discord.Color.green()))
 
     @commands.group()
@@ -117,6 +266,8 @@ class Bumper(commands.Cog):
     async def bump_log_channel(self, ctx: commands.Context, channel: discord.TextChannel):
         """Set the channel where bump logs are sent."""
         await self.config.guild(ctx.guild).bump_log_channel.set(channel.id)
+        if ctx.guild.id not in await self.config.blacklisted_guilds():
+            self.bump_log_channels[ctx.guild.id] = channel.id
         await ctx.send(embed=discord.Embed(description=f"Bump log channel set to: {channel.mention}", color=discord.Color.green()))
 
     @bumpowner.command()
@@ -129,55 +280,58 @@ class Bumper(commands.Cog):
     async def support_server_invite(self, ctx: commands.Context, invite: str):
         """Set the support server invite link."""
         await self.config.support_server_invite.set(invite)
+        self.bump_payloads.clear()
         await ctx.send(embed=discord.Embed(description=f"Support server invite link set to: {invite}", color=discord.Color.green()))
 
     @bumpowner.command()
-    async def listprem(self, ctx: commands.Context):
-        """List all premium codes and who they are assigned to."""
-        premium_codes = await self.config.premium_codes()
-        if not premium_codes:
+    async def listprem(self, ctx: commands.Context, page: int = 1):
+        """List premium codes and who they are assigned to, one page at a time."""
+        codes_per_page = 25
+        page = max(page, 1)
+        total, rows = await self.codes.page(codes_per_page, (page - 1) * codes_per_page)
+        if not total:
             await ctx.send(embed=discord.Embed(description="No premium codes found.", color=discord.Color.red()))
             return
+        total_pages = -(-total // codes_per_page)
+        if not rows:
+            await ctx.send(embed=discord.Embed(description=f"There are only {total_pages} pages.", color=discord.Color.red()))
+            return
 
-        codes_per_page = 25
-        pages = [dict(list(premium_codes.items())[i:i + codes_per_page]) for i in range(0, len(premium_codes), codes_per_page)]
-        total_pages = len(pages)
-
-        for page_num, page in enumerate(pages, start=1):
-            embed = discord.Embed(title=f"Premium Codes (Page {page_num}/{total_pages})", color=discord.Color.blue())
-            for code, data in page.items():
-                if isinstance(data, dict):  # Ensure data is a dictionary
-                    user = self.bot.get_user(data["user_id"])
-                    user_name = user.name if user else "Unknown User"
-                    redeemed = "Yes" if data["redeemed"] else "No"
-                    embed.add_field(name=code, value=f"User: {user_name}\nRedeemed: {redeemed}", inline=False)
-                else:
-                    log.error(f"Invalid data format for code {code}: {data}")
+        embed = discord.Embed(title=f"Premium Codes (Page {page}/{total_pages})", color=discord.Color.blue())
+        for row in rows:
+            user = self.bot.get_user(row["user_id"])
+            user_name = user.name if user else "Unknown User"
+            redeemed = "Yes" if row["redeemed"] else "No"
+            embed.add_field(name=row["code"], value=f"User: {user_name}\nRedeemed: {redeemed}", inline=False)
+        await ctx.send(embed=embed)
 
-            await ctx.send(embed=embed)
+    @bumpowner.command()
+    async def sweepcodes(self, ctx: commands.Context, days: int):
+        """Delete redeemed codes and codes left unredeemed for more than the given number of days."""
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).timestamp()
+        removed = await self.codes.sweep(cutoff)
+        await ctx.send(embed=discord.Embed(description=f"Removed {removed} expired premium codes.", color=discord.Color.green()))
 
     @commands.command()
-    async def mycodes(self, ctx: commands.Context):
-        """List all premium codes assigned to the user."""
-        premium_codes = await self.config.premium_codes()
-        user_codes = [code for code, data in premium_codes.items() if isinstance(data, dict) and data["user_id"] == ctx.author.id]
-        if not user_codes:
+    async def mycodes(self, ctx: commands.Context, page: int = 1):
+        """List the premium codes assigned to you, one page at a time."""
+        codes_per_page = 25
+        page = max(page, 1)
+        total, rows = await self.codes.page(codes_per_page, (page - 1) * codes_per_page, user_id=ctx.author.id)
+        if not total:
             await ctx.send(embed=discord.Embed(description="You have no premium codes assigned.", color=discord.Color.red()))
             return
+        total_pages = -(-total // codes_per_page)
+        if not rows:
+            await ctx.send(embed=discord.Embed(description=f"You only have {total_pages} pages of codes.", color=discord.Color.red()))
+            return
+
+        embed = discord.Embed(title=f"Your Premium Codes (Page {page}/{total_pages})", color=discord.Color.blue())
+        for row in rows:
+            redeemed = "Yes" if row["redeemed"] else "No"
+            embed.add_field(name=row["code"], value=f"Redeemed: {redeemed}", inline=False)
+        await ctx.send(embed=embed)
 
-        codes_per_page = 25
-        pages = [user_codes[i:i + codes_per_page] for i in range(0, len(user_codes), codes_per_page)]
-        total_pages = len(pages)
-
-        for page_num, page in enumerate(pages, start=1):
-            embed = discord.Embed(title=f"Your Premium Codes (Page {page_num}/{total_pages})", color=discord.Color.blue())
-            for code in page:
-                data = premium_codes[code]
-                redeemed = "Yes" if data["redeemed"] else "No"
-                embed.add_field(name=code, value=f"Redeemed: {redeemed}", inline=False)
-
-            await ctx.send(embed=embed)
-        
     @commands.command()
     async def codegen(self, ctx: commands.Context, user_id: int, duration: str, quantity: int = 1):
         """Generate premium codes. Use -1 for permanent, or specify time and unit (e.g., 1d for 1 day, 1m for 1 month)."""
@@ -186,41 +340,41 @@ class Bumper(commands.Cog):
             await ctx.send(embed=discord.Embed(description="Invalid user ID.", color=discord.Color.red()))
             return
 
-        codes = []
-        for _ in range(quantity):
-            code = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
-            expiry_message = ""
-            duration_seconds = None
+        if quantity < 1:
+            await ctx.send(embed=discord.Embed(description="Quantity must be at least 1.", color=discord.Color.red()))
+            return
+
+        duration_seconds = None
+        if duration == "-1":
+            expiry_message = " (Permanent)"
+        else:
+            try:
+                if duration.endswith("d"):
+                    days = int(duration[:-1])
+                    duration_seconds = timedelta(days=days).total_seconds()
+                    expiry_message = f" (Expires in {days} days upon redemption)"
+                elif duration.endswith("m"):
+                    months = int(duration[:-1])
+                    duration_seconds = timedelta(days=months * 30).total_seconds()
+                    expiry_message = f" (Expires in {months} months upon redemption)"
+                else:
+                    raise ValueError("Invalid duration format")
+            except ValueError:
+                await ctx.send(embed=discord.Embed(description="Invalid duration format. Use -1 for permanent, or specify time and unit (e.g., 1d for 1 day, 1m for 1 month).", color=discord.Color.red()))
+                return
+
+        codes = await self.codes.generate(user_id, duration_seconds, quantity)
+
+        codes_str = "\n".join(f"{code}{expiry_message}" for code in codes)
+        if len(codes_str) > 4000:
+            files = [discord.File(io.BytesIO(codes_str.encode()), filename="codes.txt") for _ in range(2)]
+            await ctx.send(embed=discord.Embed(description=f"Generated {len(codes)} premium codes.", color=discord.Color.green()), file=files[0])
+            try:
+                await user.send(embed=discord.Embed(description=f"Your {len(codes)} premium codes are attached.", color=discord.Color.green()), file=files[1])
+            except discord.Forbidden:
+                await ctx.send(embed=discord.Embed(description="Could not send DM to the user.", color=discord.Color.red()))
+            return
 
-            if duration == "-1":
-                expiry_message = " (Permanent)"
-            else:
-                try:
-                    if duration.endswith("d"):
-                        days = int(duration[:-1])
-                        duration_seconds = timedelta(days=days).total_seconds()
-                        expiry_message = f" (Expires in {days} days upon redemption)"
-                    elif duration.endswith("m"):
-                        months = int(duration[:-1])
-                        duration_seconds = timedelta(days=months * 30).total_seconds()
-                        expiry_message = f" (Expires in {months} months upon redemption)"
-                    else:
-                        raise ValueError("Invalid duration format")
-                except ValueError:
-                    await ctx.send(embed=discord.Embed(description="Invalid duration format. Use -1 for permanent, or specify time and unit (e.g., 1d for 1 day, 1m for 1 month).", color=discord.Color.red()))
-                    return
-
-            codes.append((code, expiry_message, duration_seconds))
-
-        async with self.config.premium_codes() as premium_codes:
-            for code, expiry_message, duration_seconds in codes:
-                premium_codes[code] = {
-                    "user_id": user_id,
-                    "duration": duration_seconds,
-                    "redeemed": False
-                }
-
-        codes_str = "\n".join([f"{code}{expiry_message}" for code, expiry_message, _ in codes])
         await ctx.send(embed=discord.Embed(description=f"Generated premium codes:\n{codes_str}", color=discord.Color.green()))
 
         try:
@@ -232,13 +386,11 @@ class Bumper(commands.Cog):
     @commands.is_owner()
     async def revokeprem(self, ctx: commands.Context, code: str):
         """Revoke a premium code."""
-        async with self.config.premium_codes() as premium_codes:
-            if code not in premium_codes:
-                await ctx.send(embed=discord.Embed(description="Invalid premium code.", color=discord.Color.red()))
-                return
+        if not await self.codes.revoke(code):
+            await ctx.send(embed=discord.Embed(description="Invalid premium code.", color=discord.Color.red()))
+            return
 
-            del premium_codes[code]
-            await ctx.send(embed=discord.Embed(description=f"Premium code {code} has been revoked.", color=discord.Color.green()))
+        await ctx.send(embed=discord.Embed(description=f"Premium code {code} has been revoked.", color=discord.Color.green()))
 
     @commands.command()
     @commands.is_owner()
@@ -251,48 +403,50 @@ class Bumper(commands.Cog):
 
         await self.config.guild(guild).premium.set(False)
         await self.config.guild(guild).premium_expiry.set(None)
+        await self.config.guild(guild).next_auto_bump.set(None)
+        self._unschedule_auto_bump(guild.id)
         await ctx.send(embed=discord.Embed(description=f"Premium status revoked from server {guild.name}.", color=discord.Color.green()))
 
     @commands.command()
     @commands.guild_only()
     async def redeem(self, ctx: commands.Context, code: str):
         """Redeem a premium code."""
-        async with self.config.premium_codes() as premium_codes:
-            if code not in premium_codes:
-                await ctx.send(embed=discord.Embed(description="Invalid premium code.", color=discord.Color.red()))
-                return
-
-            code_data = premium_codes[code]
-            if code_data["user_id"] != ctx.author.id:
-                await ctx.send(embed=discord.Embed(description="This code is not assigned to you.", color=discord.Color.red()))
-                return
+        code_data = await self.codes.get(code)
+        if not code_data:
+            await ctx.send(embed=discord.Embed(description="Invalid premium code.", color=discord.Color.red()))
+            return
 
-            if code_data["redeemed"]:
-                await ctx.send(embed=discord.Embed(description="This code has already been redeemed.", color=discord.Color.red()))
-                return
+        if code_data["user_id"] != ctx.author.id:
+            await ctx.send(embed=discord.Embed(description="This code is not assigned to you.", color=discord.Color.red()))
+            return
 
-            duration = code_data["duration"]
-            if duration:
-                expiry_date = datetime.now(timezone.utc) + timedelta(seconds=duration)
-            else:
-                expiry_date = None
+        if not await self.codes.redeem(code, ctx.author.id, ctx.guild.id):
+            await ctx.send(embed=discord.Embed(description="This code has already been redeemed.", color=discord.Color.red()))
+            return
 
-            current_expiry_date = await self.config.guild(ctx.guild).premium_expiry()
-            if current_expiry_date:
-                current_expiry_date = datetime.fromisoformat(current_expiry_date)
-                if expiry_date:
-                    new_expiry_date = max(current_expiry_date, expiry_date)
-                else:
-                    new_expiry_date = current_expiry_date + timedelta(days=365*10)  # Extend by 10 years for permanent codes
+        duration = code_data["duration"]
+        if duration:
+            expiry_date = datetime.now(timezone.utc) + timedelta(seconds=duration)
+        else:
+            expiry_date = None
+
+        current_expiry_date = await self.config.guild(ctx.guild).premium_expiry()
+        if current_expiry_date:
+            current_expiry_date = datetime.fromisoformat(current_expiry_date)
+            if expiry_date:
+                new_expiry_date = max(current_expiry_date, expiry_date)
             else:
-                new_expiry_date = expiry_date
+                new_expiry_date = current_expiry_date + timedelta(days=365*10)  # Extend by 10 years for permanent codes
+        else:
+            new_expiry_date = expiry_date
 
-            await self.config.guild(ctx.guild).premium.set(True)
-            await self.config.guild(ctx.guild).premium_expiry.set(new_expiry_date.isoformat() if new_expiry_date else None)
-            code_data["redeemed"] = True
+        await self.config.guild(ctx.guild).premium.set(True)
+        await self.config.guild(ctx.guild).premium_expiry.set(new_expiry_date.isoformat() if new_expiry_date else None)
+        if ctx.guild.id not in self.auto_bump_deadlines:
+            self._schedule_auto_bump(ctx.guild.id, datetime.now(timezone.utc))
 
-            expiry_message = " (Permanent)" if not new_expiry_date else f" (Expires on {new_expiry_date.isoformat()})"
-            await ctx.send(embed=discord.Embed(description=f"Premium code redeemed! Your server now has premium status{expiry_message}.", color=discord.Color.green()))
+        expiry_message = " (Permanent)" if not new_expiry_date else f" (Expires on {new_expiry_date.isoformat()})"
+        await ctx.send(embed=discord.Embed(description=f"Premium code redeemed! Your server now has premium status{expiry_message}.", color=discord.Color.green()))
 
     @commands.command()
     @commands.guild_only()
@@ -323,13 +477,18 @@ class Bumper(commands.Cog):
             await ctx.send(embed=discord.Embed(title="Failed!", description="Your server has autobump enabled due to having premium!", color=discord.Color.red()))
             return
 
-        await self.send_bump(ctx.guild)
+        results = await self.send_bump(ctx.guild)
 
         await self.config.guild(ctx.guild).last_bump.set(now.isoformat())
         await self.increment_bump_count(ctx.guild)
-        await ctx.send(embed=discord.Embed(title="Success!", description="Your bump has successfully been sent to every server.", color=discord.Color.green()))
+        await ctx.send(embed=discord.Embed(title="Success!", description=f"Your bump has successfully been sent to every server.\n{self.summarize_delivery(results)}.", color=discord.Color.green()))
+
+    async def get_bump_payload(self, guild: discord.Guild) -> Tuple[discord.Embed, discord.ui.View]:
+        """Return the cached embed and view for a guild's bump, building them if needed."""
+        cached = self.bump_payloads.get(guild.id)
+        if cached and cached[0] == guild.name:
+            return cached[1], cached[2]
 
-    async def send_bump(self, guild: discord.Guild):
         guild_data = await self.config.guild(guild).all()
 
         embed = discord.Embed(
@@ -350,43 +509,123 @@ class Bumper(commands.Cog):
         support_server_invite = await self.config.support_server_invite()
         support_button = discord.ui.Button(label="Join Support Server", style=discord.ButtonStyle.green, url=support_server_invite)
 
-        report_button = discord.ui.Button(label="Report", style=discord.ButtonStyle.danger)
+        view = discord.ui.View(timeout=None)
+        view.add_item(join_button)
+        view.add_item(support_button)
+        view.add_item(ReportBumpButton(guild.id))
+        # send() stores any unfinished view in the ViewStore under each sent
+        # message id. Clicks are routed through the ReportBumpButton registered
+        # in cog_load, so stop the view and send it as plain components.
+        view.stop()
 
-        async def report_callback(interaction: discord.Interaction):
-            report_channel_id = await self.config.report_channel()
-            if not report_channel_id:
-                await interaction.response.send_message(embed=discord.Embed(description="Report channel is not configured.", color=discord.Color.red()), ephemeral=True)
-                return
+        self.bump_payloads[guild.id] = (guild.name, embed, view)
+        return embed, view
 
-            report_channel = self.bot.get_channel(report_channel_id)
-            if not report_channel:
-                await interaction.response.send_message(embed=discord.Embed(description="Report channel is not found.", color=discord.Color.red()), ephemeral=True)
-                return
+    async def report_bump(self, interaction: discord.Interaction, guild_id: int):
+        """Forward a reported bump to the report channel."""
+        report_channel_id = await self.config.report_channel()
+        if not report_channel_id:
+            await interaction.response.send_message(embed=discord.Embed(description="Report channel is not configured.", color=discord.Color.red()), ephemeral=True)
+            return
 
-            report_message = await report_channel.send(
-                embed=embed,
-                content=f"Reported by {interaction.user.mention} from {interaction.guild.name}"
-            )
-            self.reported_bumps[report_message.id] = (guild.id, interaction.message.id)
-            await interaction.response.send_message(embed=discord.Embed(description="Bump reported.", color=discord.Color.green()), ephemeral=True)
+        report_channel = self.bot.get_channel(report_channel_id)
+        if not report_channel:
+            await interaction.response.send_message(embed=discord.Embed(description="Report channel is not found.", color=discord.Color.red()), ephemeral=True)
+            return
 
-        report_button.callback = report_callback
+        report_message = await report_channel.send(
+            embeds=interaction.message.embeds[:1],
+            content=f"Reported by {interaction.user.mention} from {interaction.guild.name}"
+        )
+        await self.reports.add_report(
+            report_message.id,
+            guild_id,
+            interaction.user.id,
+            interaction.guild_id,
+            interaction.channel_id,
+            interaction.message.id,
+        )
+        await interaction.response.send_message(embed=discord.Embed(description="Bump reported.", color=discord.Color.green()), ephemeral=True)
 
-        view = discord.ui.View()
-        view.add_item(join_button)
-        view.add_item(support_button)
-        view.add_item(report_button)
+    async def send_bump(self, guild: discord.Guild):
+        embed, view = await self.get_bump_payload(guild)
 
         log.info(f"Sending bump from {guild.name} to all configured servers.")
+        results = await self.deliver_bump(guild, embed, view)
+        log.info(f"Bump from {guild.name} delivered: {self.summarize_delivery(results)}.")
+        return results
+
+    async def deliver_bump(self, source_guild: discord.Guild, embed: discord.Embed, view: discord.ui.View) -> List[dict]:
+        """Send a bump to every subscribed channel concurrently.
+
+        Returns one result per destination with its status (sent, forbidden,
+        missing or failed), the sent message id and the delivery latency.
+        """
+        semaphore = asyncio.Semaphore(BUMP_CONCURRENCY)
+        results = await asyncio.gather(*(
+            self._deliver_to(semaphore, guild_id, channel_id, embed, view)
+            for guild_id, channel_id in list(self.bump_channels.items())
+        ))
+        sent = [r for r in results if r["status"] == "sent"]
+        await self.reports.record_bump(source_guild.id, [(r["guild_id"], r["channel_id"], r["message_id"]) for r in sent])
+        await self.log_bumps(source_guild, [r["guild_id"] for r in sent], semaphore)
+        return results
+
+    async def _deliver_to(self, semaphore: asyncio.Semaphore, guild_id: int, channel_id: int, embed: discord.Embed, view: discord.ui.View) -> dict:
+        result = {"guild_id": guild_id, "channel_id": channel_id, "status": "missing", "message_id": None, "latency": 0.0, "error": None}
+        guild = self.bot.get_guild(guild_id)
+        bump_channel = guild.get_channel(channel_id) if guild else None
+        if not bump_channel:
+            return result
 
-        for g in self.bot.guilds:
-            bump_channel_id = await self.config.guild(g).bump_channel()
-            if bump_channel_id:
-                bump_channel = g.get_channel(bump_channel_id)
-                if bump_channel:
-                    await bump_channel.send(embed=embed, view=view)
-                    log.info(f"Bump sent to {g.name} in channel {bump_channel.name}.")
-                    await self.log_bump(g, guild)
+        start = time.monotonic()
+        async with semaphore:
+            for attempt in range(1, BUMP_RETRIES + 1):
+                try:
+                    message = await bump_channel.send(embed=embed, view=view)
+                except discord.Forbidden:
+                    result["status"] = "forbidden"
+                    break
+                except discord.NotFound:
+                    result["status"] = "missing"
+                    break
+                except discord.HTTPException as e:
+                    # discord.py already waits out per-route buckets; only 429s
+                    # that escape it and server errors are worth retrying.
+                    if (e.status == 429 or e.status >= 500) and attempt < BUMP_RETRIES:
+                        await asyncio.sleep(BUMP_RETRY_BASE_DELAY * 2 ** (attempt - 1))
+                        continue
+                    result["status"] = "failed"
+                    result["error"] = f"{e.status} {e.text}"
+                    break
+                except Exception as e:
+                    log.exception(f"Unexpected error sending bump to {guild.name} ({guild_id}).")
+                    result["status"] = "failed"
+                    result["error"] = str(e)
+                    break
+                else:
+                    result["status"] = "sent"
+                    result["message_id"] = message.id
+                    break
+        result["latency"] = time.monotonic() - start
+
+        if result["status"] == "sent":
+            log.info(f"Bump sent to {guild.name} in channel {bump_channel.name}.")
+        else:
+            log.warning(f"Bump to {guild.name} ({guild_id}) in channel {channel_id} {result['status']}: {result['error']}")
+        return result
+
+    @staticmethod
+    def summarize_delivery(results: List[dict]) -> str:
+        counts = Counter(r["status"] for r in results)
+        sent = [r["latency"] for r in results if r["status"] == "sent"]
+        summary = f"{counts['sent']}/{len(results)} sent"
+        for status in ("forbidden", "missing", "failed"):
+            if counts[status]:
+                summary += f", {counts[status]} {status}"
+        if sent:
+            summary += f" (avg {sum(sent) / len(sent):.2f}s, max {max(sent):.2f}s)"
+        return summary
 
     @commands.group()
     @commands.is_owner()
@@ -394,88 +633,153 @@ class Bumper(commands.Cog):
         """Group command for handling bump reports."""
         pass
 
+    async def _can_handle_reports(self, user: discord.abc.User) -> bool:
+        trusted_users = await self.config.trusted_users()
+        return user.id in trusted_users or await self.bot.is_owner(user)
+
+    async def _delete_partial(self, semaphore: asyncio.Semaphore, channel_id: int, message_id: int) -> bool:
+        channel = self.bot.get_channel(channel_id)
+        if not channel:
+            return False
+        async with semaphore:
+            try:
+                await channel.get_partial_message(message_id).delete()
+            except discord.HTTPException:
+                return False
+        return True
+
     @bumprep.command()
     async def accept(self, ctx: commands.Context, report_message_id: int):
         """Accept a reported bump."""
-        trusted_users = await self.config.trusted_users()
-        if ctx.author.id not in trusted_users and not await self.bot.is_owner(ctx.author):
+        if not await self._can_handle_reports(ctx.author):
             await ctx.send(embed=discord.Embed(description="You are not authorized to accept bump reports.", color=discord.Color.red()))
             return
 
-        report_channel_id = await self.config.report_channel()
-        report_channel = self.bot.get_channel(report_channel_id)
-        if not report_channel:
-            await ctx.send(embed=discord.Embed(description="Report channel is not configured or found.", color=discord.Color.red()))
-            return
-
-        try:
-            report_message = await report_channel.fetch_message(report_message_id)
-        except discord.NotFound:
-            await ctx.send(embed=discord.Embed(description="Report message not found.", color=discord.Color.red()))
-            return
-
-        guild_id, message_id = self.reported_bumps.pop(report_message_id, (None, None))
-        if not guild_id:
+        report = await self.reports.get_report(report_message_id)
+        if not report:
             await ctx.send(embed=discord.Embed(description="Report not found in the system.", color=discord.Color.red()))
             return
 
-        guild = self.bot.get_guild(guild_id)
-        if not guild:
-            await ctx.send(embed=discord.Embed(description="Guild not found.", color=discord.Color.red()))
-            return
-
-        bump_channel_id = await self.config.guild(guild).bump_channel()
-        bump_channel = guild.get_channel(bump_channel_id)
-        if not bump_channel:
-            await ctx.send(embed=discord.Embed(description="Bump channel not found.", color=discord.Color.red()))
-            return
+        guild_id = report["source_guild_id"]
+        if report["bump_id"] is not None:
+            copies = [(row["channel_id"], row["message_id"]) for row in await self.reports.bump_messages(report["bump_id"])]
+        else:
+            copies = [(report["channel_id"], report["message_id"])]
+
+        async with self.config.blacklisted_guilds() as blacklisted_guilds:
+            if guild_id not in blacklisted_guilds:
+                blacklisted_guilds.append(guild_id)
+        self.bump_channels.pop(guild_id, None)
+        self.bump_log_channels.pop(guild_id, None)
+        self._unschedule_auto_bump(guild_id)
+
+        # Every open report against this guild is settled by the blacklist.
+        report_ids = await self.reports.close_guild_reports(guild_id, "accepted")
+        report_channel_id = await self.config.report_channel()
 
-        try:
-            bump_message = await bump_channel.fetch_message(message_id)
-            await bump_message.delete()
-            async with self.config.blacklisted_guilds() as blacklisted_guilds:
-                if guild.id not in blacklisted_guilds:
-                    blacklisted_guilds.append(guild.id)
-            await ctx.send(embed=discord.Embed(description=f"Bump from {guild.name} accepted and the server has been blacklisted.", color=discord.Color.green()))
-        except discord.NotFound:
-            await ctx.send(embed=discord.Embed(description="Bump message not found in the bump channel.", color=discord.Color.red()))
+        semaphore = asyncio.Semaphore(BUMP_CONCURRENCY)
+        deleted = await asyncio.gather(*(self._delete_partial(semaphore, channel_id, message_id) for channel_id, message_id in copies))
+        if report_channel_id:
+            await asyncio.gather(*(self._delete_partial(semaphore, report_channel_id, report_id) for report_id in report_ids))
 
-        await report_message.delete()
+        guild = self.bot.get_guild(guild_id)
+        guild_name = guild.name if guild else str(guild_id)
+        await ctx.send(embed=discord.Embed(
+            description=f"Bump from {guild_name} accepted and the server has been blacklisted. Deleted {sum(deleted)}/{len(copies)} bump messages.",
+            color=discord.Color.green()
+        ))
 
     @bumprep.command()
     async def deny(self, ctx: commands.Context, report_message_id: int):
         """Deny a reported bump."""
-        trusted_users = await self.config.trusted_users()
-        if ctx.author.id not in trusted_users and not await self.bot.is_owner(ctx.author):
+        if not await self._can_handle_reports(ctx.author):
             await ctx.send(embed=discord.Embed(description="You are not authorized to deny bump reports.", color=discord.Color.red()))
             return
 
-        report_channel_id = await self.config.report_channel()
-        report_channel = self.bot.get_channel(report_channel_id)
-        if not report_channel:
-            await ctx.send(embed=discord.Embed(description="Report channel is not configured or found.", color=discord.Color.red()))
-            return
-
-        try:
-            report_message = await report_channel.fetch_message(report_message_id)
-        except discord.NotFound:
-            await ctx.send(embed=discord.Embed(description="Report message not found.", color=discord.Color.red()))
+        report = await self.reports.get_report(report_message_id)
+        if not report:
+            await ctx.send(embed=discord.Embed(description="Report not found in the system.", color=discord.Color.red()))
             return
 
-        self.reported_bumps.pop(report_message_id, None)
+        await self.reports.close_report(report_message_id, "denied")
         await ctx.send(embed=discord.Embed(description="Report denied and dismissed.", color=discord.Color.green()))
 
-        await report_message.delete()
+        report_channel_id = await self.config.report_channel()
+        if report_channel_id:
+            await self._delete_partial(asyncio.Semaphore(1), report_channel_id, report_message_id)
+
+    @bumprep.command(name="list")
+    async def list_reports(self, ctx: commands.Context, guild_id: int = None):
+        """List open reports, either per reported server or for one server."""
+        if guild_id is None:
+            counts = await self.reports.open_report_counts()
+            if not counts:
+                await ctx.send(embed=discord.Embed(description="There are no open reports.", color=discord.Color.green()))
+                return
+            lines = []
+            for row in counts[:25]:
+                guild = self.bot.get_guild(row["source_guild_id"])
+                guild_name = guild.name if guild else "Unknown Server"
+                lines.append(f"{guild_name} (`{row['source_guild_id']}`): {row['reports']} open")
+            await ctx.send(embed=discord.Embed(title="Open Reports", description="\n".join(lines), color=discord.Color.blue()))
+            return
+
+        reports = await self.reports.open_reports(guild_id)
+        if not reports:
+            await ctx.send(embed=discord.Embed(description="There are no open reports for that server.", color=discord.Color.green()))
+            return
+        embed = discord.Embed(title=f"Open Reports for {guild_id}", color=discord.Color.blue())
+        for row in reports[:25]:
+            reported_at = datetime.fromtimestamp(row["created_at"], timezone.utc)
+            embed.add_field(
+                name=str(row["report_message_id"]),
+                value=f"Reporter: <@{row['reporter_id']}>\nReported: {discord.utils.format_dt(reported_at, 'R')}",
+                inline=False
+            )
+        await ctx.send(embed=embed)
 
-    @tasks.loop(hours=2)
+    @tasks.loop(minutes=1)
     async def auto_bump_task(self):
         await self.bot.wait_until_ready()
-        for guild in self.bot.guilds:
-            if await self.config.guild(guild).premium():
-                log.info(f"Auto bumping for premium guild: {guild.name}")
-                await self.send_bump(guild)
-                await self.config.guild(guild).last_bump.set(datetime.now(timezone.utc).isoformat())
-                await self.increment_bump_count(guild)
+        now = datetime.now(timezone.utc)
+        while self.auto_bump_queue and self.auto_bump_queue[0][0] <= now:
+            deadline, guild_id = heapq.heappop(self.auto_bump_queue)
+            if self.auto_bump_deadlines.get(guild_id) != deadline:
+                continue
+            try:
+                await self.run_auto_bump(guild_id, now)
+            except Exception:
+                log.exception(f"Auto bump failed for guild {guild_id}.")
+                self._schedule_auto_bump(guild_id, now + AUTO_BUMP_INTERVAL)
+
+    async def run_auto_bump(self, guild_id: int, now: datetime):
+        """Bump one due premium guild, or drop it from the schedule if premium ended."""
+        guild = self.bot.get_guild(guild_id)
+        if not guild:
+            self._unschedule_auto_bump(guild_id)
+            return
+
+        guild_data = await self.config.guild(guild).all()
+        if not guild_data["premium"]:
+            self._unschedule_auto_bump(guild_id)
+            return
+
+        if guild_data["premium_expiry"] and datetime.fromisoformat(guild_data["premium_expiry"]) <= now:
+            log.info(f"Premium expired for guild: {guild.name}")
+            await self.config.guild(guild).premium.set(False)
+            await self.config.guild(guild).premium_expiry.set(None)
+            await self.config.guild(guild).next_auto_bump.set(None)
+            self._unschedule_auto_bump(guild_id)
+            return
+
+        log.info(f"Auto bumping for premium guild: {guild.name}")
+        results = await self.send_bump(guild)
+        log.info(f"Auto bump for {guild.name} delivered: {self.summarize_delivery(results)}.")
+        next_bump = now + AUTO_BUMP_INTERVAL
+        await self.config.guild(guild).last_bump.set(now.isoformat())
+        await self.config.guild(guild).next_auto_bump.set(next_bump.isoformat())
+        self._schedule_auto_bump(guild_id, next_bump)
+        await self.increment_bump_count(guild)
 
     async def increment_bump_count(self, guild: discord.Guild):
         current_count = await self.config.guild(guild).bump_count()
@@ -490,17 +794,33 @@ class Bumper(commands.Cog):
             )
             await bump_log_channel.send(embed=embed)
 
-    async def log_bump(self, target_guild: discord.Guild, source_guild: discord.Guild):
+    async def log_bumps(self, source_guild: discord.Guild, target_guild_ids: List[int], semaphore: Optional[asyncio.Semaphore] = None):
+        """Send the bump log embed to every target guild's bump log channel in one batch."""
+        if not target_guild_ids:
+            return
+        semaphore = semaphore or asyncio.Semaphore(BUMP_CONCURRENCY)
         bump_count = await self.config.guild(source_guild).bump_count()
-        bump_log_channel_id = await self.config.guild(target_guild).bump_log_channel()
-        bump_log_channel = target_guild.get_channel(bump_log_channel_id)
-        if bump_log_channel:
-            embed = discord.Embed(
-                title="Server Bumped",
-                description=f"{source_guild.name} was bumped. This server has been bumped {bump_count} times.",
-                color=discord.Color.green()
-            )
-            await bump_log_channel.send(embed=embed)
+        embed = discord.Embed(
+            title="Server Bumped",
+            description=f"{source_guild.name} was bumped. This server has been bumped {bump_count} times.",
+            color=discord.Color.green()
+        )
+
+        async def send_log(channel: discord.TextChannel):
+            async with semaphore:
+                try:
+                    await channel.send(embed=embed)
+                except discord.HTTPException as e:
+                    log.warning(f"Failed to send bump log to {channel.guild.name} ({channel.guild.id}): {e}")
+
+        channels = []
+        for guild_id in target_guild_ids:
+            target_guild = self.bot.get_guild(guild_id)
+            bump_log_channel_id = self.bump_log_channels.get(guild_id)
+            bump_log_channel = target_guild.get_channel(bump_log_channel_id) if target_guild and bump_log_channel_id else None
+            if bump_log_channel:
+                channels.append(bump_log_channel)
+        await asyncio.gather(*(send_log(channel) for channel in channels))
 
     async def log_new_server_bump(self, guild: discord.Guild):
         config_log_channel_id = await self.config.guild(guild).config_log_channel()
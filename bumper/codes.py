@@ -0,0 +1,132 @@
+import random
+import string
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import aiosqlite
+
+CODE_ALPHABET = string.ascii_uppercase + string.digits
+CODE_LENGTH = 8
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS codes (
+    code TEXT PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    duration REAL,
+    redeemed INTEGER NOT NULL DEFAULT 0,
+    redeemed_guild_id INTEGER,
+    redeemed_at REAL,
+    -- NULL for codes imported from Config, which never recorded it
+    created_at REAL
+);
+CREATE INDEX IF NOT EXISTS codes_user ON codes (user_id, created_at);
+CREATE INDEX IF NOT EXISTS codes_created ON codes (created_at);
+"""
+
+
+class PremiumCodeLedger:
+    """SQLite-backed premium code ledger indexed by code and by owning user."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.db: Optional[aiosqlite.Connection] = None
+
+    async def open(self):
+        self.db = await aiosqlite.connect(self.path)
+        self.db.row_factory = aiosqlite.Row
+        await self.db.executescript(SCHEMA)
+        await self.db.commit()
+
+    async def close(self):
+        if self.db is not None:
+            await self.db.close()
+            self.db = None
+
+    async def import_legacy(self, premium_codes: Dict[str, dict]) -> int:
+        """Import codes from the old global ``premium_codes`` Config blob.
+
+        The blob never recorded when a code was created, so ``created_at`` is
+        left NULL rather than claiming the codes are new.
+        """
+        rows = [
+            (code, data["user_id"], data.get("duration"), int(bool(data.get("redeemed"))), None)
+            for code, data in premium_codes.items()
+            if isinstance(data, dict)
+        ]
+        await self.db.executemany(
+            "INSERT OR IGNORE INTO codes (code, user_id, duration, redeemed, created_at) VALUES (?, ?, ?, ?, ?)", rows
+        )
+        await self.db.commit()
+        return len(rows)
+
+    async def generate(self, user_id: int, duration: Optional[float], quantity: int) -> List[str]:
+        """Create ``quantity`` new unique codes for a user in one transaction."""
+        codes = set()
+        while len(codes) < quantity:
+            candidates = {
+                "".join(random.choices(CODE_ALPHABET, k=CODE_LENGTH)) for _ in range(quantity - len(codes))
+            } - codes
+            pending = list(candidates)
+            taken = set()
+            # Stay well under SQLite's bound-parameter limit.
+            for i in range(0, len(pending), 500):
+                chunk = pending[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                async with self.db.execute(
+                    f"SELECT code FROM codes WHERE code IN ({placeholders})", chunk
+                ) as cursor:
+                    taken.update(row["code"] for row in await cursor.fetchall())
+            codes |= candidates - taken
+
+        now = time.time()
+        await self.db.executemany(
+            "INSERT INTO codes (code, user_id, duration, created_at) VALUES (?, ?, ?, ?)",
+            [(code, user_id, duration, now) for code in codes],
+        )
+        await self.db.commit()
+        return sorted(codes)
+
+    async def get(self, code: str) -> Optional[aiosqlite.Row]:
+        async with self.db.execute("SELECT * FROM codes WHERE code = ?", (code,)) as cursor:
+            return await cursor.fetchone()
+
+    async def redeem(self, code: str, user_id: int, guild_id: int) -> bool:
+        """Mark a code redeemed if it belongs to the user and is unused. Returns whether it was claimed."""
+        cursor = await self.db.execute(
+            "UPDATE codes SET redeemed = 1, redeemed_guild_id = ?, redeemed_at = ?"
+            " WHERE code = ? AND user_id = ? AND redeemed = 0",
+            (guild_id, time.time(), code, user_id),
+        )
+        await self.db.commit()
+        return cursor.rowcount == 1
+
+    async def revoke(self, code: str) -> bool:
+        cursor = await self.db.execute("DELETE FROM codes WHERE code = ?", (code,))
+        await self.db.commit()
+        return cursor.rowcount == 1
+
+    async def sweep(self, older_than: float) -> int:
+        """Delete redeemed codes and codes left unredeemed since before ``older_than``.
+
+        Unredeemed codes of unknown age are kept; redeemed ones with no
+        timestamps at all predate the ledger and are always old enough.
+        """
+        cursor = await self.db.execute(
+            "DELETE FROM codes WHERE (redeemed = 0 AND created_at < ?)"
+            " OR (redeemed = 1 AND COALESCE(redeemed_at, created_at, 0) < ?)",
+            (older_than, older_than),
+        )
+        await self.db.commit()
+        return cursor.rowcount
+
+    async def page(self, limit: int, offset: int, user_id: Optional[int] = None) -> Tuple[int, List[aiosqlite.Row]]:
+        """Return the total number of codes and one page of them, optionally for one user."""
+        where, args = ("WHERE user_id = ?", (user_id,)) if user_id is not None else ("", ())
+        async with self.db.execute(f"SELECT COUNT(*) FROM codes {where}", args) as cursor:
+            total = (await cursor.fetchone())[0]
+        async with self.db.execute(
+            f"SELECT * FROM codes {where} ORDER BY created_at, code LIMIT ? OFFSET ?", args + (limit, offset)
+        ) as cursor:
+            rows = await cursor.fetchall()
+        return total, rows
@@ -0,0 +1,154 @@
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import aiosqlite
+
+# Sent bump messages older than this are forgotten; they can no longer be reported.
+BUMP_MESSAGE_RETENTION = 14 * 24 * 3600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bumps (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source_guild_id INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bumps_source ON bumps (source_guild_id);
+CREATE INDEX IF NOT EXISTS bumps_created ON bumps (created_at);
+
+CREATE TABLE IF NOT EXISTS bump_messages (
+    message_id INTEGER PRIMARY KEY,
+    bump_id INTEGER NOT NULL,
+    guild_id INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bump_messages_bump ON bump_messages (bump_id);
+
+CREATE TABLE IF NOT EXISTS reports (
+    report_message_id INTEGER PRIMARY KEY,
+    bump_id INTEGER,
+    source_guild_id INTEGER NOT NULL,
+    reporter_id INTEGER NOT NULL,
+    reporter_guild_id INTEGER,
+    channel_id INTEGER,
+    message_id INTEGER,
+    status TEXT NOT NULL DEFAULT 'open',
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reports_source ON reports (source_guild_id, status);
+CREATE INDEX IF NOT EXISTS reports_reporter ON reports (reporter_id);
+"""
+
+
+class BumpReportStore:
+    """SQLite-backed record of sent bumps and the reports filed against them."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.db: Optional[aiosqlite.Connection] = None
+
+    async def open(self):
+        self.db = await aiosqlite.connect(self.path)
+        self.db.row_factory = aiosqlite.Row
+        await self.db.executescript(SCHEMA)
+        await self.db.commit()
+
+    async def close(self):
+        if self.db is not None:
+            await self.db.close()
+            self.db = None
+
+    async def record_bump(self, source_guild_id: int, messages: List[Tuple[int, int, int]]) -> int:
+        """Record one bump and the (guild_id, channel_id, message_id) copies it produced."""
+        now = time.time()
+        cursor = await self.db.execute(
+            "INSERT INTO bumps (source_guild_id, created_at) VALUES (?, ?)", (source_guild_id, now)
+        )
+        bump_id = cursor.lastrowid
+        await self.db.executemany(
+            "INSERT OR REPLACE INTO bump_messages (message_id, bump_id, guild_id, channel_id) VALUES (?, ?, ?, ?)",
+            [(message_id, bump_id, guild_id, channel_id) for guild_id, channel_id, message_id in messages],
+        )
+        await self._prune(now - BUMP_MESSAGE_RETENTION)
+        await self.db.commit()
+        return bump_id
+
+    async def _prune(self, cutoff: float):
+        await self.db.execute(
+            "DELETE FROM bump_messages WHERE bump_id IN (SELECT id FROM bumps WHERE created_at < ?)", (cutoff,)
+        )
+        await self.db.execute(
+            "DELETE FROM bumps WHERE created_at < ? AND id NOT IN (SELECT bump_id FROM reports WHERE bump_id IS NOT NULL)",
+            (cutoff,),
+        )
+
+    async def bump_for_message(self, message_id: int) -> Optional[int]:
+        async with self.db.execute("SELECT bump_id FROM bump_messages WHERE message_id = ?", (message_id,)) as cursor:
+            row = await cursor.fetchone()
+        return row["bump_id"] if row else None
+
+    async def bump_messages(self, bump_id: int) -> List[aiosqlite.Row]:
+        async with self.db.execute(
+            "SELECT guild_id, channel_id, message_id FROM bump_messages WHERE bump_id = ?", (bump_id,)
+        ) as cursor:
+            return await cursor.fetchall()
+
+    async def add_report(
+        self,
+        report_message_id: int,
+        source_guild_id: int,
+        reporter_id: int,
+        reporter_guild_id: Optional[int],
+        channel_id: int,
+        message_id: int,
+    ):
+        bump_id = await self.bump_for_message(message_id)
+        await self.db.execute(
+            "INSERT OR REPLACE INTO reports (report_message_id, bump_id, source_guild_id, reporter_id, reporter_guild_id,"
+            " channel_id, message_id, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (report_message_id, bump_id, source_guild_id, reporter_id, reporter_guild_id, channel_id, message_id, time.time()),
+        )
+        await self.db.commit()
+
+    async def get_report(self, report_message_id: int) -> Optional[aiosqlite.Row]:
+        async with self.db.execute(
+            "SELECT * FROM reports WHERE report_message_id = ? AND status = 'open'", (report_message_id,)
+        ) as cursor:
+            return await cursor.fetchone()
+
+    async def close_report(self, report_message_id: int, status: str):
+        await self.db.execute(
+            "UPDATE reports SET status = ? WHERE report_message_id = ?", (status, report_message_id)
+        )
+        await self.db.commit()
+
+    async def close_guild_reports(self, source_guild_id: int, status: str) -> List[int]:
+        """Close every open report against a guild and return their report message ids."""
+        async with self.db.execute(
+            "SELECT report_message_id FROM reports WHERE source_guild_id = ? AND status = 'open'", (source_guild_id,)
+        ) as cursor:
+            ids = [row["report_message_id"] for row in await cursor.fetchall()]
+        await self.db.execute(
+            "UPDATE reports SET status = ? WHERE source_guild_id = ? AND status = 'open'", (status, source_guild_id)
+        )
+        await self.db.commit()
+        return ids
+
+    async def open_reports(self, source_guild_id: Optional[int] = None) -> List[aiosqlite.Row]:
+        if source_guild_id is None:
+            query, args = "SELECT * FROM reports WHERE status = 'open' ORDER BY created_at", ()
+        else:
+            query, args = (
+                "SELECT * FROM reports WHERE source_guild_id = ? AND status = 'open' ORDER BY created_at",
+                (source_guild_id,),
+            )
+        async with self.db.execute(query, args) as cursor:
+            return await cursor.fetchall()
+
+    async def open_report_counts(self) -> List[aiosqlite.Row]:
+        """Number of open reports per source guild, most reported first."""
+        async with self.db.execute(
+            "SELECT source_guild_id, COUNT(*) AS reports FROM reports WHERE status = 'open'"
+            " GROUP BY source_guild_id ORDER BY reports DESC"
+        ) as cursor:
+            return await cursor.fetchall()
@@ -5,6 +5,8 @@ from redbot.core.bot import Red
 import discord
 import wtforms
 
+from .events import EVENT_TEMPLATES
+
 def dashboard_page(*args, **kwargs):
   def decorator(func: t.Callable):
     func.__dashboard_decorator_params__ = (args, kwargs)
@@ -74,9 +76,17 @@ class DashboardIntegration(commands.Cog):  # Inherit from commands.Cog
     if kwargs["method"] == "POST":
       form = kwargs["data"]["form"]
       event = form.get("event")
+      if event not in EVENT_TEMPLATES:
+        return {
+          "status": 0,
+          "notifications": [{"message": f"{event} is not a logged event.", "category": "error"}],
+          "redirect_url": kwargs["request_url"],
+        }
       channel_id = int(form.get("channel"))
-      async with self.bot.get_cog("EventLogger").config.guild(guild).channels() as channels:
+      cog = self.bot.get_cog("EventLogger")
+      async with cog.config.guild(guild).channels() as channels:
         channels[event] = channel_id
+      await cog.refresh_routes(guild)
       return {
         "status": 0,
         "notifications": [{"message": f"Logging channel for {event} set to <#{channel_id}>", "category": "success"}],
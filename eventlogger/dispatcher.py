@@ -0,0 +1,162 @@
+import discord  # isort:skip
+import typing  # isort:skip
+import asyncio  # isort:skip
+import collections  # isort:skip
+import logging  # isort:skip
+import time  # isort:skip
+
+log = logging.getLogger("red.eventlogger.dispatcher")
+
+# Discord limits for a single message.
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+
+class _Lane:
+  __slots__ = ("channel", "embeds", "oldest")
+
+  def __init__(self, channel: discord.abc.Messageable) -> None:
+    self.channel = channel
+    self.embeds: typing.Deque[discord.Embed] = collections.deque()
+    self.oldest: float = 0.0
+
+
+class LogDispatcher:
+  """Batches log embeds per channel and sends them as multi-embed messages.
+
+  Each destination channel gets its own lane. A lane is flushed once it holds
+  a full message worth of embeds or once its oldest embed has waited
+  ``flush_interval`` seconds. Lanes flush concurrently, each sending only
+  what was queued when the pass started, so one busy channel cannot hold a
+  pass open while the others wait. Embeds are dropped (and counted) once
+  ``max_pending`` embeds are waiting.
+  """
+
+  def __init__(
+    self,
+    *,
+    flush_interval: float = 5.0,
+    max_pending: int = 5000,
+    concurrency: int = 5,
+  ) -> None:
+    self.flush_interval = flush_interval
+    self.max_pending = max_pending
+    self.concurrency = concurrency
+    self.lanes: typing.Dict[int, _Lane] = {}
+    self.pending = 0
+    self.dropped = 0
+    self.failed = 0
+    self.sent_messages = 0
+    self.sent_embeds = 0
+    self._wakeup = asyncio.Event()
+    self._task: typing.Optional[asyncio.Task] = None
+
+  def start(self) -> None:
+    if self._task is None or self._task.done():
+      self._task = asyncio.create_task(self._run())
+
+  async def stop(self) -> None:
+    """Stop the flusher and send whatever is still queued."""
+    if self._task is not None:
+      self._task.cancel()
+      try:
+        await self._task
+      except asyncio.CancelledError:
+        pass
+      self._task = None
+    await self._flush(force=True)
+
+  def submit(self, channel: discord.abc.Messageable, embed: discord.Embed) -> bool:
+    """Queue an embed for a channel. Returns False if it was dropped."""
+    if self.pending >= self.max_pending:
+      self.dropped += 1
+      return False
+    lane = self.lanes.get(channel.id)
+    if lane is None:
+      lane = self.lanes[channel.id] = _Lane(channel)
+    if not lane.embeds:
+      lane.oldest = time.monotonic()
+    lane.embeds.append(embed)
+    self.pending += 1
+    if len(lane.embeds) >= MAX_EMBEDS_PER_MESSAGE:
+      self._wakeup.set()
+    return True
+
+  def stats(self) -> typing.Dict[str, int]:
+    return {
+      "pending": self.pending,
+      "lanes": sum(1 for lane in self.lanes.values() if lane.embeds),
+      "dropped": self.dropped,
+      "failed": self.failed,
+      "sent_messages": self.sent_messages,
+      "sent_embeds": self.sent_embeds,
+    }
+
+  async def _run(self) -> None:
+    while True:
+      try:
+        await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+      except asyncio.TimeoutError:
+        pass
+      self._wakeup.clear()
+      try:
+        await self._flush()
+      except Exception:
+        log.exception("Unexpected error while flushing event logs.")
+
+  async def _flush(self, force: bool = False) -> None:
+    now = time.monotonic()
+    ready = [
+      lane
+      for lane in self.lanes.values()
+      if lane.embeds and (
+        force or len(lane.embeds) >= MAX_EMBEDS_PER_MESSAGE or now - lane.oldest >= self.flush_interval
+      )
+    ]
+    if not ready:
+      return
+    semaphore = asyncio.Semaphore(self.concurrency)
+    await asyncio.gather(*(self._flush_lane(lane, semaphore, drain=force) for lane in ready))
+    # Forget idle lanes so deleted channels do not linger.
+    for channel_id in [channel_id for channel_id, lane in self.lanes.items() if not lane.embeds]:
+      del self.lanes[channel_id]
+
+  def _take_batch(self, lane: _Lane) -> typing.List[discord.Embed]:
+    batch: typing.List[discord.Embed] = []
+    size = 0
+    while lane.embeds and len(batch) < MAX_EMBEDS_PER_MESSAGE:
+      length = len(lane.embeds[0])
+      if batch and size + length > MAX_EMBED_CHARS_PER_MESSAGE:
+        break
+      batch.append(lane.embeds.popleft())
+      size += length
+    self.pending -= len(batch)
+    return batch
+
+  async def _flush_lane(self, lane: _Lane, semaphore: asyncio.Semaphore, drain: bool = False) -> None:
+    async with semaphore:
+      started = time.monotonic()
+      # Embeds queued while this lane is sending wait for the next pass, unless draining on stop.
+      remaining = len(lane.embeds)
+      while lane.embeds and (drain or remaining > 0):
+        batch = self._take_batch(lane)
+        remaining -= len(batch)
+        try:
+          await lane.channel.send(embeds=batch)
+        except (discord.Forbidden, discord.NotFound):
+          # The channel is gone or unusable; drop everything queued for it.
+          self.failed += len(batch) + len(lane.embeds)
+          self.pending -= len(lane.embeds)
+          lane.embeds.clear()
+          log.warning(f"Dropping event logs for channel {lane.channel.id}: cannot send there.")
+          return
+        except discord.HTTPException as e:
+          self.failed += len(batch)
+          log.warning(f"Failed to send {len(batch)} event logs to channel {lane.channel.id}: {e}")
+        else:
+          self.sent_messages += 1
+          self.sent_embeds += len(batch)
+      # Whatever is left arrived after the pass started.
+      lane.oldest = started
+      if len(lane.embeds) >= MAX_EMBEDS_PER_MESSAGE:
+        self._wakeup.set()
@@ -0,0 +1,412 @@
+import discord  # isort:skip
+import typing  # isort:skip
+from datetime import datetime, timezone  # isort:skip
+from functools import lru_cache  # isort:skip
+
+# Field styles.
+PLAIN = "plain"
+CODE = "code"
+SPOILER = "spoiler"
+
+# Discord rejects embeds with a longer description, and with it the whole batched message.
+DESCRIPTION_LIMIT = 4096
+
+
+@lru_cache(maxsize=4096)
+def _label(name: str, object_id: int) -> str:
+  return f"{name} ({object_id})"
+
+
+def guild_label(guild: typing.Optional[discord.Guild]) -> str:
+  """Format a guild as ``name (id)``, cached per name/id pair."""
+  if guild is None:
+    return "N/A"
+  return _label(guild.name, guild.id)
+
+
+def _name(obj) -> str:
+  return obj.name if obj else "N/A"
+
+
+def _id(obj) -> typing.Union[int, str]:
+  return obj.id if obj else "N/A"
+
+
+def _names(items) -> str:
+  return ", ".join(item.name for item in items)
+
+
+class EventTemplate:
+  """Declarative description of how one event is routed and rendered.
+
+  ``category`` groups the event in the ``categories`` listing. ``guild``
+  resolves the guild to route on from the listener arguments. The
+  description is only rendered (``render``) once a log channel is known.
+  """
+
+  __slots__ = ("category", "guild", "fields", "timestamp", "timestamp_label", "check", "thumbnail")
+
+  def __init__(
+    self,
+    category: str,
+    guild: typing.Callable[..., typing.Optional[discord.Guild]],
+    fields: typing.Sequence[typing.Tuple[str, typing.Callable[..., typing.Any], str]],
+    *,
+    timestamp: typing.Optional[typing.Callable[..., datetime]] = None,
+    timestamp_label: str = "Timestamp",
+    check: typing.Optional[typing.Callable[..., bool]] = None,
+    thumbnail: typing.Optional[typing.Callable[..., str]] = None,
+  ) -> None:
+    self.category = category
+    self.guild = guild
+    self.fields = tuple(fields)
+    self.timestamp = timestamp
+    self.timestamp_label = timestamp_label
+    self.check = check
+    self.thumbnail = thumbnail
+
+  def render(self, args: tuple) -> str:
+    lines = []
+    for label, getter, style in self.fields:
+      value = getter(*args)
+      if style == CODE:
+        lines.append(f"**{label}:** `{value}`")
+      elif style == SPOILER:
+        lines.append(f"**{label}:** ||{value}||")
+      else:
+        lines.append(f"**{label}:** {value}")
+    when = self.timestamp(*args) if self.timestamp else datetime.now(timezone.utc)
+    footer = f"\n**{self.timestamp_label}:** <t:{int(when.timestamp())}:F>"
+    body = "\n".join(lines)
+    if len(body) + len(footer) > DESCRIPTION_LIMIT:
+      body = body[: DESCRIPTION_LIMIT - len(footer) - 1] + "…"
+    return body + footer
+
+
+def _guild_field(getter):
+  return ("Guild", lambda *args: guild_label(getter(*args)), SPOILER)
+
+
+def _actor_fields(label: str, getter):
+  return (
+    (label, lambda *args: _name(getter(*args)), PLAIN),
+    (f"{label} ID", lambda *args: _id(getter(*args)), SPOILER),
+  )
+
+
+def _object_event(kind: str, guild, actor_label: str, actor, *, created: bool = False) -> EventTemplate:
+  """Template for a single-object create/delete event (roles, threads, stickers...)."""
+  return EventTemplate(
+    kind.lower(),
+    guild,
+    (
+      (kind, lambda obj: obj.name, PLAIN),
+      (f"{kind} ID", lambda obj: obj.id, CODE),
+      _guild_field(guild),
+      *_actor_fields(actor_label, actor),
+    ),
+    timestamp=(lambda obj: obj.created_at) if created else None,
+  )
+
+
+def _automod_event(actor_label: str) -> EventTemplate:
+  """Template for the single-rule automod events (``on_automod_rule_*(rule)``)."""
+  return EventTemplate(
+    "automod",
+    lambda rule: rule.guild,
+    (
+      ("Rule", lambda rule: rule.name, PLAIN),
+      ("Rule ID", lambda rule: rule.id, CODE),
+      ("Enabled", lambda rule: rule.enabled, PLAIN),
+      _guild_field(lambda rule: rule.guild),
+      *_actor_fields(actor_label, lambda rule: rule.creator),
+    ),
+  )
+
+
+def _rename_event(kind: str, guild, actor) -> EventTemplate:
+  """Template for a ``before``/``after`` rename of a single object."""
+  return EventTemplate(
+    kind.lower(),
+    lambda before, after: guild(before),
+    (
+      (f"Before {kind}", lambda before, after: before.name, PLAIN),
+      (f"After {kind}", lambda before, after: after.name, PLAIN),
+      (f"{kind} ID", lambda before, after: before.id, CODE),
+      _guild_field(lambda before, after: guild(before)),
+      *_actor_fields("Updater", lambda before, after: actor(before)),
+    ),
+  )
+
+
+def _channel_object_event(actor_label: str) -> EventTemplate:
+  return EventTemplate(
+    "channel",
+    lambda channel: channel.guild,
+    (
+      ("Channel", lambda channel: channel.name, PLAIN),
+      ("Channel ID", lambda channel: channel.id, CODE),
+      ("Channel Type", lambda channel: str(channel.type), PLAIN),
+      _guild_field(lambda channel: channel.guild),
+      *_actor_fields(actor_label, lambda channel: channel.guild.me),
+    ),
+  )
+
+
+def _event_user_event() -> EventTemplate:
+  return EventTemplate(
+    "event",
+    lambda event, user: event.guild,
+    (
+      ("User", lambda event, user: user.name, PLAIN),
+      ("User ID", lambda event, user: user.id, CODE),
+      ("Event", lambda event, user: event.name, PLAIN),
+      ("Event ID", lambda event, user: event.id, CODE),
+      _guild_field(lambda event, user: event.guild),
+    ),
+  )
+
+
+def _invite_event(actor_label: str, *, created: bool = False) -> EventTemplate:
+  return EventTemplate(
+    "invite",
+    lambda invite: invite.guild,
+    (
+      ("Invite URL", lambda invite: invite.url, PLAIN),
+      ("Invite ID", lambda invite: invite.id, CODE),
+      _guild_field(lambda invite: invite.guild),
+      ("Channel", lambda invite: invite.channel.name, PLAIN),
+      ("Channel ID", lambda invite: invite.channel.id, CODE),
+      *_actor_fields(actor_label, lambda invite: invite.inviter),
+    ),
+    timestamp=(lambda invite: invite.created_at) if created else None,
+  )
+
+
+def _ban_event(actor_label: str) -> EventTemplate:
+  return EventTemplate(
+    "ban",
+    lambda guild, user: guild,
+    (
+      ("User", lambda guild, user: f"{user.name} ({user.mention})", PLAIN),
+      ("User ID", lambda guild, user: user.id, CODE),
+      _guild_field(lambda guild, user: guild),
+      *_actor_fields(actor_label, lambda guild, user: guild.me),
+    ),
+  )
+
+
+def _thread_member_event() -> EventTemplate:
+  return EventTemplate(
+    "thread",
+    lambda member: member.thread.guild,
+    (
+      ("Member", lambda member: member.thread.guild.get_member(member.id) or member.id, PLAIN),
+      ("Member ID", lambda member: member.id, CODE),
+      ("Thread", lambda member: member.thread.name, PLAIN),
+      ("Thread ID", lambda member: member.thread.id, CODE),
+      _guild_field(lambda member: member.thread.guild),
+    ),
+  )
+
+
+def _reaction_event() -> EventTemplate:
+  return EventTemplate(
+    "reaction",
+    lambda reaction, user: reaction.message.guild,
+    (
+      ("User", lambda reaction, user: f"{user.name} ({user.mention})", PLAIN),
+      ("User ID", lambda reaction, user: user.id, CODE),
+      ("Message ID", lambda reaction, user: reaction.message.id, CODE),
+      ("Channel", lambda reaction, user: reaction.message.channel.name, PLAIN),
+      ("Channel ID", lambda reaction, user: reaction.message.channel.id, CODE),
+      _guild_field(lambda reaction, user: reaction.message.guild),
+      ("Emoji", lambda reaction, user: reaction.emoji, PLAIN),
+    ),
+  )
+
+
+# One template per event key; the key is also the listener name without ``on_``.
+EVENT_TEMPLATES: typing.Dict[str, EventTemplate] = {
+  "integration_create": EventTemplate(
+    "app",
+    lambda integration: integration.guild,
+    (
+      ("Integration", lambda integration: integration.name, PLAIN),
+      ("Integration ID", lambda integration: integration.id, CODE),
+      _guild_field(lambda integration: integration.guild),
+    ),
+    timestamp=lambda integration: integration.created_at,
+  ),
+  "integration_update": EventTemplate(
+    "app",
+    lambda integration: integration.guild,
+    (
+      ("Integration", lambda integration: integration.name, PLAIN),
+      ("Integration ID", lambda integration: integration.id, CODE),
+      _guild_field(lambda integration: integration.guild),
+    ),
+  ),
+  "guild_channel_create": _channel_object_event("Creator"),
+  "guild_channel_delete": _channel_object_event("Deleter"),
+  "guild_channel_update": EventTemplate(
+    "channel",
+    lambda before, after: before.guild,
+    (
+      ("Before Channel", lambda before, after: before.name, PLAIN),
+      ("After Channel", lambda before, after: after.name, PLAIN),
+      ("Channel ID", lambda before, after: before.id, CODE),
+      _guild_field(lambda before, after: before.guild),
+      *_actor_fields("Updater", lambda before, after: before.guild.me),
+    ),
+    # Position shuffles are noisy and not worth logging.
+    check=lambda before, after: before.position == after.position,
+  ),
+  "guild_channel_pins_update": EventTemplate(
+    "channel",
+    lambda channel, last_pin: channel.guild,
+    (
+      ("Channel", lambda channel, last_pin: channel.name, PLAIN),
+      ("Channel ID", lambda channel, last_pin: channel.id, CODE),
+      _guild_field(lambda channel, last_pin: channel.guild),
+      ("Last Pin", lambda channel, last_pin: f"<t:{int(last_pin.timestamp())}:F>" if last_pin else "None", PLAIN),
+    ),
+  ),
+  "voice_state_update": EventTemplate(
+    "voice",
+    lambda member, before, after: member.guild,
+    (
+      ("Member", lambda member, before, after: f"{member.name} ({member.mention})", PLAIN),
+      ("Member ID", lambda member, before, after: member.id, CODE),
+      _guild_field(lambda member, before, after: member.guild),
+      ("Before Channel", lambda member, before, after: str(before.channel) if before.channel else "None", PLAIN),
+      ("After Channel", lambda member, before, after: str(after.channel) if after.channel else "None", PLAIN),
+      ("Before Mute", lambda member, before, after: before.mute, PLAIN),
+      ("After Mute", lambda member, before, after: after.mute, PLAIN),
+      ("Before Deaf", lambda member, before, after: before.deaf, PLAIN),
+      ("After Deaf", lambda member, before, after: after.deaf, PLAIN),
+    ),
+  ),
+  "automod_rule_create": _automod_event("Creator"),
+  "automod_rule_delete": _automod_event("Deleter"),
+  "automod_rule_update": _automod_event("Creator"),
+  "guild_emojis_update": EventTemplate(
+    "emoji",
+    lambda guild, before, after: guild,
+    (
+      _guild_field(lambda guild, before, after: guild),
+      ("Before Emojis", lambda guild, before, after: _names(before), PLAIN),
+      ("After Emojis", lambda guild, before, after: _names(after), PLAIN),
+    ),
+  ),
+  "guild_stickers_update": EventTemplate(
+    "sticker",
+    lambda guild, before, after: guild,
+    (
+      _guild_field(lambda guild, before, after: guild),
+      ("Before Stickers", lambda guild, before, after: _names(before), PLAIN),
+      ("After Stickers", lambda guild, before, after: _names(after), PLAIN),
+    ),
+  ),
+  "scheduled_event_create": _object_event(
+    "Event", lambda event: event.guild, "Creator", lambda event: event.creator, created=True
+  ),
+  "scheduled_event_delete": _object_event("Event", lambda event: event.guild, "Deleter", lambda event: event.creator),
+  "scheduled_event_update": _rename_event("Event", lambda event: event.guild, lambda event: event.creator),
+  "scheduled_event_user_add": _event_user_event(),
+  "scheduled_event_user_remove": _event_user_event(),
+  "invite_create": _invite_event("Creator", created=True),
+  "invite_delete": _invite_event("Deleter"),
+  "message_delete": EventTemplate(
+    "message",
+    lambda message: message.guild,
+    (
+      ("Message Content", lambda message: message.content, PLAIN),
+      ("Message ID", lambda message: message.id, CODE),
+      ("Author", lambda message: f"{message.author.name} ({message.author.mention})", PLAIN),
+      ("Author ID", lambda message: message.author.id, CODE),
+      ("Channel", lambda message: message.channel.name, PLAIN),
+      ("Channel ID", lambda message: message.channel.id, CODE),
+      _guild_field(lambda message: message.guild),
+    ),
+  ),
+  "bulk_message_delete": EventTemplate(
+    "message",
+    lambda messages: messages[0].guild if messages else None,
+    (
+      ("Message Count", lambda messages: len(messages), PLAIN),
+      ("Channel", lambda messages: messages[0].channel.name, PLAIN),
+      ("Channel ID", lambda messages: messages[0].channel.id, CODE),
+      _guild_field(lambda messages: messages[0].guild),
+      ("Messages", lambda messages: ", ".join(message.content for message in messages), PLAIN),
+    ),
+  ),
+  "message_edit": EventTemplate(
+    "message",
+    lambda before, after: before.guild,
+    (
+      ("Before Content", lambda before, after: before.content, PLAIN),
+      ("After Content", lambda before, after: after.content, PLAIN),
+      ("Message ID", lambda before, after: before.id, CODE),
+      ("Author", lambda before, after: f"{before.author.name} ({before.author.mention})", PLAIN),
+      ("Author ID", lambda before, after: before.author.id, CODE),
+      ("Channel", lambda before, after: before.channel.name, PLAIN),
+      ("Channel ID", lambda before, after: before.channel.id, CODE),
+      _guild_field(lambda before, after: before.guild),
+    ),
+  ),
+  "guild_role_create": _object_event("Role", lambda role: role.guild, "Creator", lambda role: role.guild.me),
+  "guild_role_delete": _object_event("Role", lambda role: role.guild, "Deleter", lambda role: role.guild.me),
+  "guild_role_update": _rename_event("Role", lambda role: role.guild, lambda role: role.guild.me),
+  "member_ban": _ban_event("Banner"),
+  "member_unban": _ban_event("Unbanner"),
+  "member_update": EventTemplate(
+    "user",
+    lambda before, after: before.guild,
+    (
+      ("Before Name", lambda before, after: before.name, PLAIN),
+      ("After Name", lambda before, after: after.name, PLAIN),
+      ("Member ID", lambda before, after: before.id, CODE),
+      _guild_field(lambda before, after: before.guild),
+      ("Before Nick", lambda before, after: before.nick, PLAIN),
+      ("After Nick", lambda before, after: after.nick, PLAIN),
+      ("Before Roles", lambda before, after: _names(before.roles), PLAIN),
+      ("After Roles", lambda before, after: _names(after.roles), PLAIN),
+      ("Before Status", lambda before, after: str(before.status), PLAIN),
+      ("After Status", lambda before, after: str(after.status), PLAIN),
+      ("Before Activity", lambda before, after: str(before.activity), PLAIN),
+      ("After Activity", lambda before, after: str(after.activity), PLAIN),
+    ),
+  ),
+  "webhooks_update": EventTemplate(
+    "webhook",
+    lambda channel: channel.guild,
+    (
+      ("Channel", lambda channel: channel.name, PLAIN),
+      ("Channel ID", lambda channel: channel.id, CODE),
+      _guild_field(lambda channel: channel.guild),
+      *_actor_fields("Updater", lambda channel: channel.guild.me),
+    ),
+  ),
+  "thread_create": _object_event(
+    "Thread", lambda thread: thread.guild, "Creator", lambda thread: thread.owner, created=True
+  ),
+  "thread_delete": _object_event("Thread", lambda thread: thread.guild, "Deleter", lambda thread: thread.owner),
+  "thread_update": _rename_event("Thread", lambda thread: thread.guild, lambda thread: thread.owner),
+  "thread_member_join": _thread_member_event(),
+  "thread_member_remove": _thread_member_event(),
+  "typing": EventTemplate(
+    "typing",
+    lambda channel, user, when: getattr(channel, "guild", None),
+    (
+      ("User", lambda channel, user, when: f"{user.name} ({user.mention})", PLAIN),
+      ("User ID", lambda channel, user, when: user.id, CODE),
+      ("Channel", lambda channel, user, when: channel.name, PLAIN),
+      ("Channel ID", lambda channel, user, when: channel.id, CODE),
+      _guild_field(lambda channel, user, when: channel.guild),
+    ),
+    timestamp=lambda channel, user, when: when,
+  ),
+  "reaction_add": _reaction_event(),
+  "reaction_remove": _reaction_event(),
+}
@@ -0,0 +1,63 @@
+import discord
+from typing import Dict
+
+
+class GuildComposition:
+    """Human and bot member counts for one guild."""
+
+    __slots__ = ("humans", "bots", "chunked")
+
+    def __init__(self, humans: int, bots: int, chunked: bool) -> None:
+        self.humans = humans
+        self.bots = bots
+        # Whether the guild was fully chunked when the counts were taken.
+        self.chunked = chunked
+
+    def __repr__(self) -> str:
+        return f"<GuildComposition humans={self.humans} bots={self.bots}>"
+
+
+class CompositionCache:
+    """Per-guild member composition, counted once and kept current from member events.
+
+    Counts are taken from the member cache the first time a guild is looked up,
+    and again once a guild that was counted before chunking finishes chunking.
+    """
+
+    def __init__(self) -> None:
+        self._guilds: Dict[int, GuildComposition] = {}
+
+    def get(self, guild: discord.Guild) -> GuildComposition:
+        composition = self._guilds.get(guild.id)
+        if composition is None or (guild.chunked and not composition.chunked):
+            composition = self._guilds[guild.id] = self._count(guild)
+        return composition
+
+    @staticmethod
+    def _count(guild: discord.Guild) -> GuildComposition:
+        bots = sum(1 for m in guild.members if m.bot)
+        return GuildComposition(len(guild.members) - bots, bots, guild.chunked)
+
+    def member_added(self, member: discord.Member) -> None:
+        composition = self._guilds.get(member.guild.id)
+        if composition is None:
+            return
+        if member.bot:
+            composition.bots += 1
+        else:
+            composition.humans += 1
+
+    def member_removed(self, member: discord.Member) -> None:
+        composition = self._guilds.get(member.guild.id)
+        if composition is None:
+            return
+        if member.bot:
+            composition.bots = max(composition.bots - 1, 0)
+        else:
+            composition.humans = max(composition.humans - 1, 0)
+
+    def forget(self, guild_id: int) -> None:
+        self._guilds.pop(guild_id, None)
+
+    def clear(self) -> None:
+        self._guilds.clear()
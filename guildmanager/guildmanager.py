@@ -1,6 +1,8 @@
+import asyncio
 import discord
+import time
 from bisect import insort
-from datetime import datetime
+from datetime import datetime, timedelta
 from redbot.core import Config, checks, commands
 from redbot.core.bot import Red
 from redbot.core.i18n import Translator, cog_i18n
@@ -8,10 +10,20 @@ from redbot.core.utils import AsyncIter
 from redbot.core.utils.chat_formatting import bold, humanize_list, humanize_number, inline
 from redbot.core.utils.menus import menu
 from redbot.core.utils.views import ConfirmView
-from typing import Dict, List, Union
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from .composition import CompositionCache, GuildComposition
 
 _ = T_ = Translator("GuildManager", __file__)
 
+LEAVE_CONCURRENCY = 5
+LEAVE_RETRIES = 3
+LEAVE_RETRY_BASE_DELAY = 1.5
+# Minimum seconds between progress message edits during a bulk leave.
+LEAVE_PROGRESS_INTERVAL = 2.0
+# The bot_add entry is written as the bot joins, so only a few entries from then on are read.
+INVITER_LOOKUP_LIMIT = 25
+
 
 @cog_i18n(_)
 class GuildManager(commands.Cog):
@@ -30,7 +42,30 @@ class GuildManager(commands.Cog):
             "log_channel": None,
         }
         self.config.register_global(**default_global)
-        self.log_guild_remove = True
+        # Guilds being left on purpose; their removal is logged as an autoleave instead.
+        self.silent_leaves = set()
+        # guild_id -> user who added the bot
+        self.inviters: Dict[int, discord.abc.User] = {}
+        self.inviter_tasks = set()
+        self.compositions = CompositionCache()
+
+    async def cog_unload(self):
+        for task in self.inviter_tasks:
+            task.cancel()
+
+    def guild_composition(self, guild: discord.Guild) -> GuildComposition:
+        """Return the cached human and bot counts of a guild."""
+        return self.compositions.get(guild)
+
+    def bot_ratio(self, guild: discord.Guild) -> float:
+        """Return the share of a guild's members that are bots, between 0 and 1."""
+        if not guild.member_count:
+            return 0.0
+        return self.compositions.get(guild).bots / guild.member_count
+
+    def is_bot_farm(self, guild: discord.Guild, threshold: float) -> bool:
+        """Whether a guild's bot ratio reaches the threshold. A threshold of 0 disables the check."""
+        return bool(threshold) and self.bot_ratio(guild) >= threshold
 
     @checks.is_owner()
     @commands.group(aliases=["guildman", "gman", "gm"])
@@ -281,8 +316,7 @@ class GuildManager(commands.Cog):
         whitelist = config["whitelist"]
         guilds = []
         async for guild in AsyncIter(self.bot.guilds):
-            bot_ratio = len([m for m in guild.members if m.bot]) / guild.member_count
-            if bot_ratio >= config["bot_ratio"]:
+            if self.is_bot_farm(guild, config["bot_ratio"]):
                 guilds.append(guild)
         if not guilds:
             await ctx.send(_("No bot farms found."))
@@ -292,7 +326,7 @@ class GuildManager(commands.Cog):
             guild_name = f"{guild.name}\n"
             if guild.id in whitelist:
                 guild_name += _("(Whitelisted)")
-            bot_ratio = len([m for m in guild.members if m.bot]) / guild.member_count
+            bot_ratio = self.bot_ratio(guild)
             value = _("Bot Ratio: {}").format(bold(str(round(bot_ratio * 100, 2)) + "%"))
             fields.append({"name": guild_name, "value": value, "inline": True})
         embeds = await self.pagify_embed_fields(
@@ -381,9 +415,9 @@ class GuildManager(commands.Cog):
         )
         await view.wait()
         if view.result:
-            await self.leave_guilds(guilds)
-            content = _("Done. I have left {} blacklisted guilds.").format(len(guilds))
-            await view.message.edit(content=content)
+            results = await self.leave_guilds(guilds, progress=self.leave_progress(view.message))
+            content = _("Done. I have left {} blacklisted guilds.").format(self.count_left(results))
+            await view.message.edit(content=self.summarize_leave(content, results))
         else:
             await view.message.edit(content=_("Ok, I won't leave any blacklisted guilds."))
 
@@ -395,8 +429,7 @@ class GuildManager(commands.Cog):
         async for guild in AsyncIter(self.bot.guilds):
             if guild.id in config["whitelist"]:
                 continue
-            bot_ratio = len([m for m in guild.members if m.bot]) / guild.member_count
-            if bot_ratio >= config["bot_ratio"]:
+            if self.is_bot_farm(guild, config["bot_ratio"]):
                 guilds.append(guild)
         if not guilds:
             await ctx.send(_("No bot farms found."))
@@ -407,9 +440,9 @@ class GuildManager(commands.Cog):
         )
         await view.wait()
         if view.result:
-            await self.leave_guilds(guilds)
-            content = _("Done. I have left {} bot farms.").format(len(guilds))
-            await view.message.edit(content=content)
+            results = await self.leave_guilds(guilds, progress=self.leave_progress(view.message))
+            content = _("Done. I have left {} bot farms.").format(self.count_left(results))
+            await view.message.edit(content=self.summarize_leave(content, results))
         else:
             await view.message.edit(content=_("Ok, I won't leave any bot farms."))
 
@@ -432,9 +465,9 @@ class GuildManager(commands.Cog):
         )
         await view.wait()
         if view.result:
-            await self.leave_guilds(guilds)
-            content = _("Done. I have left {} servers.").format(len(guilds))
-            await view.message.edit(content=content)
+            results = await self.leave_guilds(guilds, progress=self.leave_progress(view.message))
+            content = _("Done. I have left {} servers.").format(self.count_left(results))
+            await view.message.edit(content=self.summarize_leave(content, results))
         else:
             await view.message.edit(content=_("Ok, I won't leave any servers."))
 
@@ -448,11 +481,7 @@ class GuildManager(commands.Cog):
             channel = channels[0] if channels else None
         return channel
 
-    async def log_autoleave(self, guild: discord.Guild, title: str, reason: str):
-        config = await self.config.all()
-        log = self.bot.get_channel(config["log_channel"])
-        if not log:
-            return
+    def autoleave_embed(self, guild: discord.Guild, title: str, reason: str) -> discord.Embed:
         embed = discord.Embed(
             title=title,
             description=reason,
@@ -462,46 +491,144 @@ class GuildManager(commands.Cog):
         embed.set_author(name=f"{guild.name} ({guild.id})")
         if guild.icon:
             embed.author.icon_url = guild.icon.with_size(1024).url
-        await log.send(embed=embed)
+        return embed
 
-    async def leave_guilds(self, guilds: List[discord.Guild]):
+    async def log_autoleave(self, guild: discord.Guild, title: str, reason: str):
+        await self.send_log_embeds([self.autoleave_embed(guild, title, reason)])
+
+    async def send_log_embeds(self, embeds: List[discord.Embed]):
+        """Send embeds to the log channel, packing up to 10 embeds (6000 characters) per message."""
+        log = self.bot.get_channel(await self.config.log_channel())
+        if not log or not embeds:
+            return
+        batch, size = [], 0
+        for embed in embeds:
+            if batch and (len(batch) == 10 or size + len(embed) > 6000):
+                await log.send(embeds=batch)
+                batch, size = [], 0
+            batch.append(embed)
+            size += len(embed)
+        await log.send(embeds=batch)
+
+    def leave_reason(self, guild: discord.Guild, config: dict) -> Optional[Tuple[str, str]]:
+        """Return the log title and message for leaving a guild, or None if it should stay."""
+        if guild.id in config["blacklist"]:
+            return _("Blacklisted"), _("I'm leaving because this server is blacklisted.")
+        min_members = config["min_members"]
+        if guild.member_count < min_members:
+            return _("Not Enough Members"), _(
+                "I'm leaving because this server has less than {} members."
+            ).format(min_members)
+        if self.is_bot_farm(guild, config["bot_ratio"]):
+            return _("Bot Farm"), _("I'm leaving this server since it has a high bot to member ratio.")
+        return None
+
+    async def leave_guilds(
+        self,
+        guilds: List[discord.Guild],
+        *,
+        progress: Optional[Callable[[int, int], Awaitable[None]]] = None,
+    ) -> List[dict]:
+        """
+        Leave every guild that fails the requirements, a few at a time.
+
+        Returns one result per guild with a ``status`` of ``left``, ``skipped`` or ``failed``.
+        ``progress`` is awaited with (done, total) after each guild.
+        """
         config = await self.config.all()
-        async for guild in AsyncIter(guilds):
+        semaphore = asyncio.Semaphore(LEAVE_CONCURRENCY)
+        done = 0
+
+        async def run(guild: discord.Guild) -> dict:
+            nonlocal done
+            result = await self._leave_guild(semaphore, guild, config)
+            done += 1
+            if progress is not None:
+                await progress(done, len(guilds))
+            return result
+
+        results = await asyncio.gather(*(run(guild) for guild in guilds))
+        await self.send_log_embeds([result.pop("embed") for result in results if "embed" in result])
+        return list(results)
+
+    async def _leave_guild(self, semaphore: asyncio.Semaphore, guild: discord.Guild, config: dict) -> dict:
+        result = {"guild_id": guild.id, "name": guild.name, "status": "skipped", "error": None}
+        decision = self.leave_reason(guild, config)
+        if decision is None:
+            return result
+        title, reason = decision
+        async with semaphore:
             channel = await self.get_system_channel(guild)
-            if guild.id in config["blacklist"]:
-                self.log_guild_remove = False
-                reason = _("I'm leaving because this server is blacklisted.")
-                if channel:
-                    await channel.send(reason)
-                await guild.leave()
-                await self.log_autoleave(guild, _("Blacklisted"), reason)
-                return
-            min_members = config["min_members"]
-            if guild.member_count < min_members:
-                self.log_guild_remove = False
-                reason = _("I'm leaving because this server has less than {} members.").format(
-                    min_members
-                )
-                if channel:
+            if channel:
+                try:
                     await channel.send(reason)
-                await guild.leave()
-                await self.log_autoleave(guild, _("Not Enough Members"), reason)
+                except discord.HTTPException:
+                    pass
+            self.silent_leaves.add(guild.id)
+            for attempt in range(1, LEAVE_RETRIES + 1):
+                try:
+                    await guild.leave()
+                except discord.NotFound:
+                    # Already gone.
+                    break
+                except discord.HTTPException as e:
+                    # discord.py already waits out per-route buckets; only 429s
+                    # that escape it and server errors are worth retrying.
+                    if (e.status == 429 or e.status >= 500) and attempt < LEAVE_RETRIES:
+                        await asyncio.sleep(LEAVE_RETRY_BASE_DELAY * 2 ** (attempt - 1))
+                        continue
+                    self.silent_leaves.discard(guild.id)
+                    result["status"] = "failed"
+                    result["error"] = f"{e.status} {e.text}"
+                    return result
+                else:
+                    break
+        result["status"] = "left"
+        result["embed"] = self.autoleave_embed(guild, title, reason)
+        return result
+
+    @staticmethod
+    def leave_progress(message: discord.Message) -> Callable[[int, int], Awaitable[None]]:
+        """Build a progress callback that edits a message at most once per interval."""
+        last_edit = 0.0
+
+        async def progress(done: int, total: int):
+            nonlocal last_edit
+            now = time.monotonic()
+            if done < total and now - last_edit < LEAVE_PROGRESS_INTERVAL:
                 return
-            bot_ratio = len([m for m in guild.members if m.bot]) / guild.member_count
-            if bot_ratio >= config["bot_ratio"]:
-                self.log_guild_remove = False
-                reason = _("I'm leaving this server since it has a high bot to member ratio.")
-                if channel:
-                    await channel.send(reason)
-                await guild.leave()
-                await self.log_autoleave(guild, _("Bot Farm"), reason)
+            last_edit = now
+            try:
+                await message.edit(content=_("Leaving servers... {}/{}").format(done, total))
+            except discord.HTTPException:
+                pass
+
+        return progress
+
+    @staticmethod
+    def count_left(results: List[dict]) -> int:
+        return sum(1 for result in results if result["status"] == "left")
+
+    @staticmethod
+    def summarize_leave(content: str, results: List[dict]) -> str:
+        failed = [result for result in results if result["status"] == "failed"]
+        skipped = sum(1 for result in results if result["status"] == "skipped")
+        if skipped:
+            content += _("\n{} servers no longer met the criteria and were skipped.").format(skipped)
+        if failed:
+            content += _("\nFailed to leave {} servers:").format(len(failed))
+            for result in failed[:10]:
+                content += f"\n- {result['name']} ({result['guild_id']}): {result['error']}"
+            if len(failed) > 10:
+                content += _("\n...and {} more.").format(len(failed) - 10)
+        return content
 
     @commands.Cog.listener()
     async def on_guild_join(self, guild: discord.Guild):
         await self.send_to_log(guild, join=True)
         config = await self.config.all()
         if config["serverlocked"]:
-            self.log_guild_remove = False
+            self.silent_leaves.add(guild.id)
             channel = await self.get_system_channel(guild)
             reason = _("I'm leaving since I was serverlocked by my owner.")
             if channel:
@@ -512,17 +639,32 @@ class GuildManager(commands.Cog):
         if guild.id in config["whitelist"]:
             return
         blacklisted = guild.id in config["blacklist"]
-        bot_ratio = len([m for m in guild.members if m.bot]) / guild.member_count
-        bot_farm = bot_ratio >= config["bot_ratio"]
+        bot_farm = self.is_bot_farm(guild, config["bot_ratio"])
         not_enough_members = guild.member_count < config["min_members"]
         if any([blacklisted, bot_farm, not_enough_members]):
             await self.leave_guilds([guild])
 
     @commands.Cog.listener()
     async def on_guild_remove(self, guild: discord.Guild):
-        if self.log_guild_remove:
+        if guild.id in self.silent_leaves:
+            self.silent_leaves.discard(guild.id)
+        else:
             await self.send_to_log(guild, join=False)
-        self.log_guild_remove = True
+        self.compositions.forget(guild.id)
+        self.inviters.pop(guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_audit_log_entry_create(self, entry: discord.AuditLogEntry):
+        if entry.action is discord.AuditLogAction.bot_add and getattr(entry.target, "id", None) == self.bot.user.id:
+            self.inviters[entry.guild.id] = entry.user
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self.compositions.member_added(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.compositions.member_removed(member)
 
     async def send_to_log(self, guild: discord.Guild, *, join: bool):
         config = await self.config.all()
@@ -530,8 +672,8 @@ class GuildManager(commands.Cog):
         if not channel:
             return
         created_at = discord.utils.format_dt(guild.created_at, "F")
-        humans = len([m for m in guild.members if not m.bot])
-        bots = len([m for m in guild.members if m.bot])
+        composition = self.compositions.get(guild)
+        humans, bots = composition.humans, composition.bots
         description = [
             f"`Guild      :` {guild.name} ({guild.id})",
             f"`Owner      :` {guild.owner} ({guild.owner.id})",
@@ -540,17 +682,11 @@ class GuildManager(commands.Cog):
             f"`Bots       :` {bots} Bots",
         ]
 
+        inviter = self.inviters.get(guild.id)
+        if inviter:
+            description.insert(2, f"`Invited by :` {inviter} ({inviter.id})")
         if join:
             title = _("I have joined a server!")
-            inviter = None
-            if guild.me.guild_permissions.view_audit_log:
-                action = discord.AuditLogAction.bot_add
-                async for log in guild.audit_logs(action=action):
-                    if log.target.id == self.bot.user.id:
-                        inviter = log.user
-                        break
-            if inviter:
-                description.insert(2, f"`Invited by :` {inviter} ({inviter.id})")
         else:
             title = _("I have left a server!")
 
@@ -569,4 +705,38 @@ class GuildManager(commands.Cog):
         if guild.banner:
             embed.set_image(url=guild.banner.with_size(4096).url)
         embed.set_footer(text=f"I'm on {len(self.bot.guilds)} guilds now!")
-        await channel.send(embed=embed)
+        message = await channel.send(embed=embed)
+        if join and not inviter and guild.me.guild_permissions.view_audit_log:
+            # Post right away and fill in the inviter once the audit log has been read.
+            task = asyncio.create_task(self.add_inviter_to_log(message, embed, description, guild))
+            self.inviter_tasks.add(task)
+            task.add_done_callback(self.inviter_tasks.discard)
+
+    async def find_inviter(self, guild: discord.Guild) -> Optional[discord.abc.User]:
+        """Find who added the bot, reading only audit log entries from around the time it joined."""
+        if guild.id in self.inviters:
+            return self.inviters[guild.id]
+        joined_at = (guild.me and guild.me.joined_at) or discord.utils.utcnow()
+        after = joined_at - timedelta(minutes=1)
+        action = discord.AuditLogAction.bot_add
+        async for entry in guild.audit_logs(action=action, limit=INVITER_LOOKUP_LIMIT, after=after):
+            if getattr(entry.target, "id", None) == self.bot.user.id:
+                self.inviters[guild.id] = entry.user
+                return entry.user
+        return None
+
+    async def add_inviter_to_log(
+        self, message: discord.Message, embed: discord.Embed, description: List[str], guild: discord.Guild
+    ):
+        try:
+            inviter = await self.find_inviter(guild)
+        except discord.HTTPException:
+            return
+        if not inviter:
+            return
+        description.insert(2, f"`Invited by :` {inviter} ({inviter.id})")
+        embed.description = "\n".join(description)
+        try:
+            await message.edit(embed=embed)
+        except discord.HTTPException:
+            pass
@@ -0,0 +1,155 @@
+from bisect import bisect_left
+from difflib import get_close_matches
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import aiosqlite
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS links (
+    user_id INTEGER NOT NULL,
+    grp TEXT NOT NULL,
+    name TEXT NOT NULL,
+    name_lower TEXT NOT NULL,
+    link TEXT NOT NULL,
+    PRIMARY KEY (user_id, grp, name)
+);
+CREATE INDEX IF NOT EXISTS links_name ON links (name_lower);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Meta key recording that the table has been built from user config.
+BUILT = "built"
+
+
+class LinkIndex:
+    """SQLite-backed inverted index of link names across every user.
+
+    Maps each lowercased link name to the (user, group, link) entries that use
+    it. Exact lookups go through the ``name_lower`` index; the distinct names
+    are also kept sorted in memory for prefix search and fuzzy suggestions.
+    User config stays the source of truth for each user's own links.
+
+    Whether the table has been built is recorded in the database itself, so
+    a deleted or replaced ``links.db`` is rebuilt on the next load.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.db: Optional[aiosqlite.Connection] = None
+        # lowercased name -> number of entries using it, and the names in sorted order
+        self._counts: Dict[str, int] = {}
+        self._names: List[str] = []
+        self.built = False
+
+    async def open(self):
+        self.db = await aiosqlite.connect(self.path)
+        self.db.row_factory = aiosqlite.Row
+        await self.db.executescript(SCHEMA)
+        await self.db.commit()
+        async with self.db.execute("SELECT name_lower, COUNT(*) AS n FROM links GROUP BY name_lower") as cursor:
+            self._counts = {row["name_lower"]: row["n"] async for row in cursor}
+        self._names = sorted(self._counts)
+        async with self.db.execute("SELECT 1 FROM meta WHERE key = ?", (BUILT,)) as cursor:
+            self.built = await cursor.fetchone() is not None
+
+    async def close(self):
+        if self.db is not None:
+            await self.db.close()
+            self.db = None
+
+    async def build(self, all_users: dict):
+        """Rebuild the index from ``Config.all_users()`` data."""
+        rows = [
+            (int(user_id), group, name, name.lower(), link)
+            for user_id, user_data in all_users.items()
+            for group, links in user_data.get("groups", {}).items()
+            for name, link in links.items()
+        ]
+        await self.db.execute("DELETE FROM links")
+        await self.db.executemany(
+            "INSERT OR REPLACE INTO links (user_id, grp, name, name_lower, link) VALUES (?, ?, ?, ?, ?)", rows
+        )
+        await self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, '1')", (BUILT,))
+        await self.db.commit()
+        self.built = True
+        self._counts = {}
+        for row in rows:
+            self._counts[row[3]] = self._counts.get(row[3], 0) + 1
+        self._names = sorted(self._counts)
+
+    async def put(self, user_id: int, group: str, name: str, link: str):
+        await self.db.execute(
+            "INSERT INTO links (user_id, grp, name, name_lower, link) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (user_id, grp, name) DO UPDATE SET link = excluded.link",
+            (user_id, group, name, name.lower(), link),
+        )
+        await self.db.commit()
+        await self._recount(name.lower())
+
+    async def delete(self, user_id: int, group: str, name: str):
+        await self.db.execute("DELETE FROM links WHERE user_id = ? AND grp = ? AND name = ?", (user_id, group, name))
+        await self.db.commit()
+        await self._recount(name.lower())
+
+    async def delete_group(self, user_id: int, group: str):
+        async with self.db.execute(
+            "SELECT DISTINCT name_lower FROM links WHERE user_id = ? AND grp = ?", (user_id, group)
+        ) as cursor:
+            names = [row["name_lower"] async for row in cursor]
+        await self.db.execute("DELETE FROM links WHERE user_id = ? AND grp = ?", (user_id, group))
+        await self.db.commit()
+        for name in names:
+            await self._recount(name)
+
+    async def find(self, name: str) -> List[aiosqlite.Row]:
+        """All entries whose name matches ``name`` case-insensitively."""
+        async with self.db.execute(
+            "SELECT * FROM links WHERE name_lower = ? ORDER BY name, grp, user_id", (name.lower(),)
+        ) as cursor:
+            return await cursor.fetchall()
+
+    def prefix(self, prefix: str, limit: int = 25) -> List[str]:
+        """Lowercased names starting with ``prefix``, in order."""
+        prefix = prefix.lower()
+        start = bisect_left(self._names, prefix)
+        matches = []
+        for name in self._names[start:]:
+            if not name.startswith(prefix) or len(matches) >= limit:
+                break
+            matches.append(name)
+        return matches
+
+    def fuzzy(self, name: str, limit: int = 5) -> List[str]:
+        """Lowercased names close to ``name``, best first."""
+        return get_close_matches(name.lower(), self._names, n=limit, cutoff=0.6)
+
+    def suggest(self, query: str, limit: int = 25) -> List[str]:
+        """Prefix matches, topped up with fuzzy matches."""
+        matches = self.prefix(query, limit)
+        if len(matches) < limit:
+            matches.extend(name for name in self.fuzzy(query, limit - len(matches)) if name not in matches)
+        return matches
+
+    async def _recount(self, name: str):
+        """Sync the in-memory name list with the table after a write.
+
+        Counting from the table, rather than from whether this call inserted
+        or deleted, keeps the list right when writes for a name overlap.
+        """
+        async with self.db.execute("SELECT COUNT(*) AS n FROM links WHERE name_lower = ?", (name,)) as cursor:
+            count = (await cursor.fetchone())["n"]
+        index = bisect_left(self._names, name)
+        present = index < len(self._names) and self._names[index] == name
+        if count:
+            self._counts[name] = count
+            if not present:
+                self._names.insert(index, name)
+        else:
+            self._counts.pop(name, None)
+            if present:
+                del self._names[index]
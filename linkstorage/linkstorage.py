@@ -1,6 +1,13 @@
+import asyncio
+from typing import Optional
+
 import discord
 from redbot.core import commands, Config
 from redbot.core.bot import Red
+from redbot.core.data_manager import cog_data_path
+
+from .linkindex import LinkIndex
+from .pages import LinkPages
 
 class LinkStorage(commands.Cog):
     """A cog to store and retrieve links by name."""
@@ -13,8 +20,18 @@ class LinkStorage(commands.Cog):
         self.config.register_global(links={}, groups={}, allowed_users=[])
         # Register user-specific configuration
         self.config.register_user(groups={})
+        # Link name -> (user, group, link) lookups across all users
+        self.index = LinkIndex(cog_data_path(self) / "links.db")
+
+    async def cog_load(self):
+        await self.index.open()
+        if not self.index.built:
+            await self.index.build(await self.config.all_users())
 
-    @commands.group()
+    async def cog_unload(self):
+        await self.index.close()
+
+    @commands.hybrid_group()
     async def link(self, ctx: commands.Context):
         """Group command for managing links."""
         pass
@@ -32,6 +49,7 @@ class LinkStorage(commands.Cog):
                 if group not in groups:
                     groups[group] = {}
                 groups[group][name] = link
+            await self.index.put(ctx.author.id, group, name, link)
             embed = discord.Embed(description=f"Added link: {name} -> {link} to group {group}", color=discord.Color.green())
             await ctx.send(embed=embed)
         else:
@@ -48,6 +66,7 @@ class LinkStorage(commands.Cog):
         async with self.config.user(ctx.author).groups() as groups:
             if group in groups and name in groups[group]:
                 del groups[group][name]
+                await self.index.delete(ctx.author.id, group, name)
                 embed = discord.Embed(description=f"Removed link: {name} from group {group}", color=discord.Color.green())
                 await ctx.send(embed=embed)
             else:
@@ -58,57 +77,55 @@ class LinkStorage(commands.Cog):
     @commands.is_owner()
     async def adminremove(self, ctx: commands.Context, name: str, group: str = "default"):
         """Remove a link or group by its name (admin only)."""
-        async with self.config.all_users() as all_users:
-            for user_id, user_data in all_users.items():
-                if group in user_data['groups'] and name in user_data['groups'][group]:
-                    del user_data['groups'][group][name]
-                    embed = discord.Embed(description=f"Admin removed link: {name} from group {group}", color=discord.Color.green())
-                    await ctx.send(embed=embed)
-                    return
-            embed = discord.Embed(description=f"No link found with the name: {name} in group {group}", color=discord.Color.red())
+        for entry in await self.index.find(name):
+            if entry['name'] != name or entry['grp'] != group:
+                continue
+            async with self.config.user_from_id(entry['user_id']).groups() as groups:
+                groups.get(group, {}).pop(name, None)
+            await self.index.delete(entry['user_id'], group, name)
+            embed = discord.Embed(description=f"Admin removed link: {name} from group {group}", color=discord.Color.green())
             await ctx.send(embed=embed)
+            return
+        embed = discord.Embed(description=f"No link found with the name: {name} in group {group}", color=discord.Color.red())
+        await ctx.send(embed=embed)
 
     @link.command()
     async def get(self, ctx: commands.Context, *, name: str):
         """Retrieve a link by name."""
-        name_lower = name.lower()
-        results = []
-        async with self.config.all_users() as all_users:
-            for user_id, user_data in all_users.items():
-                for group, links in user_data['groups'].items():
-                    for link_name, link in links.items():
-                        if link_name.lower() == name_lower:
-                            results.append(f"{link_name} -> {link} (Group: {group})")
+        results = [f"{entry['name']} -> {entry['link']} (Group: {entry['grp']})" for entry in await self.index.find(name)]
         if results:
-            embed = discord.Embed(description="\n".join(results), color=discord.Color.blue())
-            await ctx.send(embed=embed)
-        else:
-            embed = discord.Embed(description=f"No link found with the name: {name}", color=discord.Color.red())
+            embed = discord.Embed(description="\n".join(results)[:4096], color=discord.Color.blue())
             await ctx.send(embed=embed)
+            return
+        description = f"No link found with the name: {name}"
+        suggestions = self.index.suggest(name, limit=5)
+        if suggestions:
+            description += "\nDid you mean: " + ", ".join(suggestions)
+        embed = discord.Embed(description=description, color=discord.Color.red())
+        await ctx.send(embed=embed)
+
+    @get.autocomplete("name")
+    async def autocomplete_name(self, interaction: discord.Interaction, current: str):
+        return [discord.app_commands.Choice(name=name[:100], value=name[:100]) for name in self.index.suggest(current)]
 
     @link.command()
-    async def list(self, ctx: commands.Context):
-        """List all stored links for the user."""
-        groups = await self.config.user(ctx.author).groups()
-        if groups:
-            sorted_groups = sorted(groups.items())
-            pages = []
-            description = ""
-            for group, links in sorted_groups:
-                for name, link in links.items():
-                    entry = f"{name} -> {link} (Group: {group})\n"
-                    if len(description) + len(entry) > 6000 or len(description.split('\n')) > 25:
-                        pages.append(description)
-                        description = ""
-                    description += entry
-            if description:
-                pages.append(description)
-
-            embeds = [discord.Embed(description=page, color=discord.Color.blue()) for page in pages]
-            await self.paginate(ctx, embeds)
+    async def search(self, ctx: commands.Context, *, query: str):
+        """Search link names by prefix, falling back to close matches."""
+        names = self.index.suggest(query)
+        if names:
+            embed = discord.Embed(title=f"Links matching {query}", description="\n".join(names), color=discord.Color.blue())
         else:
-            embed = discord.Embed(description="No links stored.", color=discord.Color.red())
-            await ctx.send(embed=embed)
+            embed = discord.Embed(description=f"No link names match: {query}", color=discord.Color.red())
+        await ctx.send(embed=embed)
+
+    @link.command()
+    async def list(self, ctx: commands.Context, *, query: Optional[str] = None):
+        """List all stored links for the user.
+
+        Give a group name to jump to that group, or any other text to show
+        only the links whose name or group contains it.
+        """
+        await self.send_link_list(ctx, ctx.author.id, query)
 
     @link.command()
     @commands.is_owner()
@@ -150,6 +167,7 @@ class LinkStorage(commands.Cog):
                 if group not in groups:
                     groups[group] = {}
                 groups[group][name] = link
+            await self.index.put(user_id, group, name, link)
             embed = discord.Embed(description=f"Added link: {name} -> {link} to group {group}", color=discord.Color.green())
             await ctx.send(embed=embed)
         else:
@@ -167,6 +185,7 @@ class LinkStorage(commands.Cog):
         async with self.config.user(user_id).groups() as groups:
             if group in groups and name in groups[group]:
                 del groups[group][name]
+                await self.index.delete(user_id, group, name)
                 embed = discord.Embed(description=f"Removed link: {name} from group {group}", color=discord.Color.green())
                 await ctx.send(embed=embed)
             else:
@@ -174,29 +193,13 @@ class LinkStorage(commands.Cog):
                 await ctx.send(embed=embed)
 
     @link.command()
-    async def userlist(self, ctx: commands.Context):
-        """List all stored links of the user."""
-        user_id = ctx.author.id
-        groups = await self.config.user(user_id).groups()
-        if groups:
-            sorted_groups = sorted(groups.items())
-            pages = []
-            description = ""
-            for group, links in sorted_groups:
-                for name, link in links.items():
-                    entry = f"{name} -> {link} (Group: {group})\n"
-                    if len(description) + len(entry) > 6000 or len(description.split('\n')) > 25:
-                        pages.append(description)
-                        description = ""
-                    description += entry
-            if description:
-                pages.append(description)
-
-            embeds = [discord.Embed(description=page, color=discord.Color.blue()) for page in pages]
-            await self.paginate(ctx, embeds)
-        else:
-            embed = discord.Embed(description="No links stored.", color=discord.Color.red())
-            await ctx.send(embed=embed)
+    async def userlist(self, ctx: commands.Context, *, query: Optional[str] = None):
+        """List all stored links of the user.
+
+        Give a group name to jump to that group, or any other text to show
+        only the links whose name or group contains it.
+        """
+        await self.send_link_list(ctx, ctx.author.id, query)
 
     @link.command()
     async def creategroup(self, ctx: commands.Context, group: str):
@@ -218,6 +221,7 @@ class LinkStorage(commands.Cog):
         async with self.config.user(user_id).groups() as groups:
             if group in groups:
                 del groups[group]
+                await self.index.delete_group(user_id, group)
                 embed = discord.Embed(description=f"Group {group} deleted.", color=discord.Color.green())
                 await ctx.send(embed=embed)
             else:
@@ -237,10 +241,29 @@ class LinkStorage(commands.Cog):
             embed = discord.Embed(description="No groups available.", color=discord.Color.red())
             await ctx.send(embed=embed)
 
-    async def paginate(self, ctx, embeds):
-        """Helper function to paginate embeds."""
-        current_page = 0
-        message = await ctx.send(embed=embeds[current_page])
+    async def send_link_list(self, ctx: commands.Context, user_id: int, query: Optional[str]):
+        """Show a user's links, opened at a group or narrowed by a search."""
+        groups = await self.config.user_from_id(user_id).groups()
+        pages = LinkPages.from_groups(groups)
+        start = 0
+        if query:
+            group_page = pages.page_of_group(query)
+            if group_page is not None:
+                start = group_page
+            else:
+                pages = pages.search(query)
+        if not len(pages):
+            description = f"No links match: {query}" if query else "No links stored."
+            embed = discord.Embed(description=description, color=discord.Color.red())
+            await ctx.send(embed=embed)
+            return
+        await self.paginate(ctx, pages, start)
+
+    async def paginate(self, ctx, pages: LinkPages, current_page: int = 0):
+        """Helper function to paginate link pages, rendering each page only when it is shown."""
+        message = await ctx.send(embed=pages.render(current_page))
+        if len(pages) == 1:
+            return
 
         await message.add_reaction("◀️")
         await message.add_reaction("▶️")
@@ -251,12 +274,12 @@ class LinkStorage(commands.Cog):
         while True:
             try:
                 reaction, user = await self.bot.wait_for("reaction_add", timeout=60.0, check=check)
-                if str(reaction.emoji) == "▶️" and current_page < len(embeds) - 1:
+                if str(reaction.emoji) == "▶️" and current_page < len(pages) - 1:
                     current_page += 1
-                    await message.edit(embed=embeds[current_page])
+                    await message.edit(embed=pages.render(current_page))
                 elif str(reaction.emoji) == "◀️" and current_page > 0:
                     current_page -= 1
-                    await message.edit(embed=embeds[current_page])
+                    await message.edit(embed=pages.render(current_page))
                 await message.remove_reaction(reaction, user)
             except asyncio.TimeoutError:
                 break
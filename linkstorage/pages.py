@@ -0,0 +1,75 @@
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+import discord
+
+PAGE_LINES = 25
+PAGE_CHARS = 4096
+
+
+def _entry(group: str, name: str, link: str) -> str:
+    return f"{name} -> {link} (Group: {group})"
+
+
+class LinkPages:
+    """A user's links sorted by group and name, split into embed pages on demand.
+
+    Page boundaries come from entry lengths alone, so building the pager is a
+    single pass without formatting any text; an embed is only rendered for the
+    page being shown.
+    """
+
+    def __init__(self, entries: List[Tuple[str, str, str]], title: Optional[str] = None):
+        self.entries = entries
+        self.title = title
+        # group -> index of its first entry
+        self.group_starts: Dict[str, int] = {}
+        for index, (group, _, _) in enumerate(entries):
+            self.group_starts.setdefault(group, index)
+        self.page_starts = self._paginate(entries)
+
+    @classmethod
+    def from_groups(cls, groups: Dict[str, Dict[str, str]]) -> "LinkPages":
+        entries = [
+            (group, name, links[name])
+            for group, links in sorted(groups.items())
+            for name in sorted(links, key=str.lower)
+        ]
+        return cls(entries)
+
+    @staticmethod
+    def _paginate(entries: List[Tuple[str, str, str]]) -> List[int]:
+        starts = [0]
+        lines = chars = 0
+        for index, (group, name, link) in enumerate(entries):
+            # Length of _entry() plus its newline, without building the string.
+            size = len(group) + len(name) + len(link) + 15
+            if lines and (lines >= PAGE_LINES or chars + size > PAGE_CHARS):
+                starts.append(index)
+                lines = chars = 0
+            lines += 1
+            chars += size
+        return starts
+
+    def __len__(self) -> int:
+        return len(self.page_starts) if self.entries else 0
+
+    def page_of_group(self, group: str) -> Optional[int]:
+        start = self.group_starts.get(group)
+        if start is None:
+            return None
+        return bisect_right(self.page_starts, start) - 1
+
+    def search(self, query: str) -> "LinkPages":
+        """The links whose name or group contains ``query``, case-insensitively."""
+        query = query.lower()
+        entries = [entry for entry in self.entries if query in entry[1].lower() or query in entry[0].lower()]
+        return LinkPages(entries, title=f"Links matching {query}")
+
+    def render(self, page: int) -> discord.Embed:
+        start = self.page_starts[page]
+        end = self.page_starts[page + 1] if page + 1 < len(self.page_starts) else len(self.entries)
+        description = "\n".join(_entry(*entry) for entry in self.entries[start:end])
+        embed = discord.Embed(title=self.title, description=description[:PAGE_CHARS], color=discord.Color.blue())
+        embed.set_footer(text=f"Page {page + 1}/{len(self)} · {len(self.entries)} links")
+        return embed
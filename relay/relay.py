@@ -1,13 +1,13 @@
+import asyncio
 import discord
 from redbot.core import commands, Config
 from redbot.core.bot import Red
-import smtplib
-import imaplib
-import email
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from twilio.rest import Client
 
+from .transport import IMAPMailbox, MailSummary, SMTPSession
+
 class SMTPConfigModal(discord.ui.Modal):
     def __init__(self, cog: commands.Cog):
         super().__init__(title="Set SMTP Configuration")
@@ -25,6 +25,7 @@ class SMTPConfigModal(discord.ui.Modal):
 
         for key, value in config_data.items():
             await self.cog.config.set_raw(key, value=value)
+        await self.cog.reset_transports()
 
         embed = discord.Embed(
             title="SMTP Configuration Set",
@@ -48,6 +49,7 @@ class IMAPConfigModal(discord.ui.Modal):
 
         for key, value in config_data.items():
             await self.cog.config.set_raw(key, value=value)
+        await self.cog.reset_transports()
 
         embed = discord.Embed(
             title="IMAP Configuration Set",
@@ -122,7 +124,83 @@ class Relay(commands.Cog):
             twilio_account_sid="",
             twilio_auth_token="",
             twilio_phone_number="",
-            user_phone_number=""
+            user_phone_number="",
+            mail_channel=None,
+            mail_uidvalidity=None,
+            mail_last_uid=None
+        )
+        self.smtp = None
+        self.imap = None
+        self.imap_watcher = None
+        self.watch_task = None
+
+    async def cog_load(self):
+        await self.start_mail_watch()
+
+    async def cog_unload(self):
+        await self.reset_transports(restart=False)
+
+    async def get_smtp(self) -> SMTPSession:
+        if self.smtp is None:
+            config = await self.config.all()
+            self.smtp = SMTPSession(
+                config['smtp_server'], config['smtp_port'], config['email_address'], config['email_password']
+            )
+        return self.smtp
+
+    async def get_imap(self) -> IMAPMailbox:
+        if self.imap is None:
+            config = await self.config.all()
+            self.imap = IMAPMailbox(
+                config['imap_server'], config['imap_port'], config['email_address'], config['email_password']
+            )
+        return self.imap
+
+    async def reset_transports(self, restart: bool = True):
+        """Close pooled mail connections, e.g. after the configuration changed."""
+        if self.watch_task is not None:
+            self.watch_task.cancel()
+            self.watch_task = None
+        for transport in (self.smtp, self.imap, self.imap_watcher):
+            if transport is not None:
+                await transport.close()
+        self.smtp = self.imap = self.imap_watcher = None
+        if restart:
+            await self.start_mail_watch()
+
+    async def start_mail_watch(self):
+        """Push new mail to the mail channel, if one is set and IMAP is configured."""
+        config = await self.config.all()
+        if not (config['mail_channel'] and config['imap_server'] and config['email_address']):
+            return
+        self.imap_watcher = IMAPMailbox(
+            config['imap_server'], config['imap_port'], config['email_address'], config['email_password']
+        )
+        self.watch_task = asyncio.create_task(
+            self.imap_watcher.watch(self.push_mail, config['mail_last_uid'], config['mail_uidvalidity'])
+        )
+
+    async def push_mail(self, messages, uidvalidity: int, last_uid: int):
+        await self.config.mail_uidvalidity.set(uidvalidity)
+        await self.config.mail_last_uid.set(last_uid)
+        if not messages:
+            return
+        await self.bot.wait_until_red_ready()
+        channel = self.bot.get_channel(await self.config.mail_channel())
+        if channel is None:
+            return
+        for msg in messages:
+            await channel.send(embed=self.mail_embed(msg))
+
+    @staticmethod
+    def mail_embed(msg: MailSummary) -> discord.Embed:
+        description = f"From: {msg.sender}\nSubject: {msg.subject}\n\n{msg.body}"
+        if len(description) > 4096:
+            description = description[:4093] + "..."
+        return discord.Embed(
+            title="New Email",
+            description=description,
+            color=discord.Color.blue()
         )
 
     @commands.group()
@@ -147,12 +225,8 @@ class Relay(commands.Cog):
         msg.attach(MIMEText(body, 'plain'))
 
         try:
-            server = smtplib.SMTP(config['smtp_server'], config['smtp_port'])
-            server.starttls()
-            server.login(config['email_address'], config['email_password'])
-            text = msg.as_string()
-            server.sendmail(config['email_address'], to, text)
-            server.quit()
+            smtp = await self.get_smtp()
+            await smtp.send(msg)
             embed = discord.Embed(
                 title="Email Sent",
                 description="Email sent successfully.",
@@ -176,16 +250,11 @@ class Relay(commands.Cog):
 
         Checks for new unread emails in the inbox and displays them.
         """
-        config = await self.config.all()
         try:
-            mail = imaplib.IMAP4_SSL(config['imap_server'], config['imap_port'])
-            mail.login(config['email_address'], config['email_password'])
-            mail.select('inbox')
+            imap = await self.get_imap()
+            messages = await imap.unseen()
 
-            status, messages = mail.search(None, 'UNSEEN')
-            email_ids = messages[0].split()
-
-            if not email_ids:
+            if not messages:
                 embed = discord.Embed(
                     title="No New Emails",
                     description="There are no new emails.",
@@ -194,29 +263,8 @@ class Relay(commands.Cog):
                 await ctx.send(embed=embed)
                 return
 
-            for email_id in email_ids:
-                status, msg_data = mail.fetch(email_id, '(RFC822)')
-                msg = email.message_from_bytes(msg_data[0][1])
-                subject = msg['subject']
-                from_ = msg['from']
-                body = ""
-
-                if msg.is_multipart():
-                    for part in msg.walk():
-                        if part.get_content_type() == "text/plain":
-                            body = part.get_payload(decode=True).decode()
-                            break
-                else:
-                    body = msg.get_payload(decode=True).decode()
-
-                embed = discord.Embed(
-                    title="New Email",
-                    description=f"From: {from_}\nSubject: {subject}\n\n{body}",
-                    color=discord.Color.blue()
-                )
-                await ctx.send(embed=embed)
-
-            mail.logout()
+            for msg in messages:
+                await ctx.send(embed=self.mail_embed(msg))
         except Exception as e:
             embed = discord.Embed(
                 title="Error",
@@ -225,6 +273,30 @@ class Relay(commands.Cog):
             )
             await ctx.send(embed=embed)
 
+    @emailrelay.command()
+    @commands.is_owner()
+    async def mailchannel(self, ctx, channel: discord.TextChannel = None):
+        """Set a channel that new emails are pushed to.
+
+        Usage:
+        [p]emailrelay mailchannel #channel
+
+        Leave the channel out to stop pushing emails.
+        """
+        if channel:
+            await self.config.mail_channel.set(channel.id)
+            description = f"New emails will be posted in {channel.mention}."
+        else:
+            await self.config.mail_channel.clear()
+            description = "New emails will no longer be posted."
+        await self.reset_transports()
+        embed = discord.Embed(
+            title="Mail Channel Set",
+            description=description,
+            color=discord.Color.green()
+        )
+        await ctx.send(embed=embed)
+
     @commands.command()
     async def relaycall(self, ctx, to: str, message: str):
         """Relay a call from Discord to a phone number.
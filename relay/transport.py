@@ -0,0 +1,317 @@
+import asyncio
+import email
+import imaplib
+import logging
+import re
+import selectors
+import smtplib
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.header import decode_header, make_header
+from email.message import Message
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+log = logging.getLogger("red.relay.transport")
+
+# Reuse an SMTP session for this long after its last send before reconnecting.
+SMTP_IDLE_TIMEOUT = 300
+# Servers drop IDLE after 30 minutes; re-issue it well before that.
+IMAP_IDLE_TIMEOUT = 300
+# Polling interval for servers without IDLE support.
+IMAP_POLL_INTERVAL = 60
+# Only the start of each message is downloaded; enough for headers and a preview.
+IMAP_PREVIEW_BYTES = 65536
+IMAP_MAX_BACKOFF = 300
+
+FETCH_UID = re.compile(rb"UID (\d+)")
+
+
+class MailSummary:
+    __slots__ = ("uid", "sender", "subject", "body")
+
+    def __init__(self, uid: Optional[int], sender: str, subject: str, body: str):
+        self.uid = uid
+        self.sender = sender
+        self.subject = subject
+        self.body = body
+
+
+def _header(msg: Message, name: str) -> str:
+    value = msg.get(name)
+    if value is None:
+        return ""
+    try:
+        return str(make_header(decode_header(value)))
+    except (UnicodeDecodeError, LookupError):
+        return str(value)
+
+
+def summarize(raw: bytes, uid: Optional[int] = None) -> MailSummary:
+    """Parse a (possibly truncated) message into sender, subject and its plain text body."""
+    msg = email.message_from_bytes(raw)
+    part = msg
+    if msg.is_multipart():
+        part = next((p for p in msg.walk() if p.get_content_type() == "text/plain"), None)
+    body = ""
+    if part is not None:
+        payload = part.get_payload(decode=True) or b""
+        body = payload.decode(part.get_content_charset() or "utf-8", errors="replace")
+    return MailSummary(uid, _header(msg, "From"), _header(msg, "Subject"), body)
+
+
+class _Worker:
+    """A single thread that owns a blocking connection, so it never runs on the event loop."""
+
+    def __init__(self, name: str):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+
+    async def call(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class SMTPSession:
+    """A kept-alive SMTP connection that sends messages from a worker thread.
+
+    The connection is opened on first use, checked with NOOP before reuse and
+    reopened once if the server dropped it.
+    """
+
+    def __init__(self, host: str, port: int, username: str, password: str, *, starttls: bool = True, timeout: float = 30):
+        self.host = host
+        self.port = int(port)
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self._conn: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self._worker = _Worker("relay-smtp")
+
+    async def send(self, message: Message):
+        await self._worker.call(self._send, message)
+
+    async def close(self):
+        await self._worker.call(self._disconnect)
+        self._worker.shutdown()
+
+    def _connect(self) -> smtplib.SMTP:
+        conn = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            conn.starttls()
+        if self.username:
+            conn.login(self.username, self.password)
+        return conn
+
+    def _disconnect(self):
+        if self._conn is not None:
+            try:
+                self._conn.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._conn = None
+
+    def _alive(self) -> bool:
+        if self._conn is None or time.monotonic() - self._last_used > SMTP_IDLE_TIMEOUT:
+            return False
+        try:
+            return self._conn.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _send(self, message: Message):
+        if not self._alive():
+            self._disconnect()
+            self._conn = self._connect()
+        try:
+            self._conn.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            self._conn = self._connect()
+            self._conn.send_message(message)
+        self._last_used = time.monotonic()
+
+
+class IMAPMailbox:
+    """A persistent IMAP connection to one mailbox, driven from a worker thread.
+
+    ``unseen`` serves manual checks. ``watch`` tracks UIDs and waits with IDLE
+    (or NOOP polling) between checks, so new mail is pushed as it arrives.
+    Use separate instances for the two, as IDLE occupies the connection.
+    """
+
+    def __init__(
+        self, host: str, port: int, username: str, password: str, *, ssl: bool = True, mailbox: str = "INBOX", timeout: float = 30
+    ):
+        self.host = host
+        self.port = int(port)
+        self.username = username
+        self.password = password
+        self.ssl = ssl
+        self.mailbox = mailbox
+        self.timeout = timeout
+        self._conn: Optional[imaplib.IMAP4] = None
+        self._closed = threading.Event()
+        self._worker = _Worker("relay-imap")
+
+    async def unseen(self) -> List[MailSummary]:
+        """Fetch unread messages and mark them read."""
+        return await self._worker.call(self._unseen)
+
+    async def watch(
+        self,
+        on_mail: Callable[[List[MailSummary], int, int], Awaitable[None]],
+        last_uid: Optional[int] = None,
+        uidvalidity: Optional[int] = None,
+    ):
+        """Call ``on_mail(messages, uidvalidity, last_uid)`` for new mail until closed.
+
+        Mail newer than ``last_uid`` is delivered first if ``uidvalidity`` still
+        matches; otherwise only mail arriving from now on is delivered.
+        """
+        backoff = 5
+        while not self._closed.is_set():
+            try:
+                uidvalidity, last_uid, messages = await self._worker.call(self._new_since, last_uid, uidvalidity)
+                await on_mail(messages, uidvalidity, last_uid)
+                backoff = 5
+                await self._worker.call(self._wait)
+            except asyncio.CancelledError:
+                # close() cancels the worker call in flight; that ends the watch normally.
+                if self._closed.is_set():
+                    return
+                raise
+            except Exception:
+                if self._closed.is_set():
+                    return
+                log.exception(f"IMAP watch on {self.host} failed; reconnecting in {backoff}s.")
+                await self._worker.call(self._disconnect)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, IMAP_MAX_BACKOFF)
+
+    async def close(self):
+        self._closed.set()
+        conn = self._conn
+        if conn is not None:
+            # Unblock a thread waiting in IDLE.
+            try:
+                conn.shutdown()
+            except OSError:
+                pass
+        self._worker.shutdown()
+        self._conn = None
+
+    def _connect(self) -> imaplib.IMAP4:
+        if self.ssl:
+            conn = imaplib.IMAP4_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            conn = imaplib.IMAP4(self.host, self.port, timeout=self.timeout)
+        conn.login(self.username, self.password)
+        return conn
+
+    def _disconnect(self):
+        if self._conn is not None:
+            try:
+                self._conn.logout()
+            except (imaplib.IMAP4.error, OSError):
+                pass
+            self._conn = None
+
+    def _select(self) -> int:
+        if self._conn is not None:
+            try:
+                self._conn.noop()
+            except (imaplib.IMAP4.error, OSError):
+                self._conn = None
+        if self._conn is None:
+            self._conn = self._connect()
+        typ, _ = self._conn.select(self.mailbox)
+        if typ != "OK":
+            raise imaplib.IMAP4.error(f"Cannot select {self.mailbox}")
+        _, data = self._conn.response("UIDVALIDITY")
+        return int(data[0]) if data and data[0] else 0
+
+    def _fetch(self, uids: List[bytes], peek: bool) -> List[MailSummary]:
+        if not uids:
+            return []
+        section = "BODY.PEEK[]" if peek else "BODY[]"
+        typ, data = self._conn.uid("FETCH", b",".join(uids), f"(UID {section}<0.{IMAP_PREVIEW_BYTES}>)")
+        if typ != "OK":
+            return []
+        messages = []
+        for item in data:
+            if isinstance(item, tuple):
+                match = FETCH_UID.search(item[0])
+                messages.append(summarize(item[1], int(match.group(1)) if match else None))
+        return messages
+
+    def _unseen(self) -> List[MailSummary]:
+        self._select()
+        typ, data = self._conn.uid("SEARCH", None, "UNSEEN")
+        uids = data[0].split() if typ == "OK" and data and data[0] else []
+        return self._fetch(uids, peek=False)
+
+    def _new_since(self, last_uid: Optional[int], uidvalidity: Optional[int]) -> Tuple[int, int, List[MailSummary]]:
+        current_validity = self._select()
+        if last_uid is None or uidvalidity != current_validity:
+            # UIDs from another mailbox generation mean nothing; start from the newest message.
+            typ, data = self._conn.uid("SEARCH", None, "ALL")
+            uids = data[0].split() if typ == "OK" and data and data[0] else []
+            return current_validity, max((int(uid) for uid in uids), default=0), []
+        typ, data = self._conn.uid("SEARCH", None, f"UID {last_uid + 1}:*")
+        # "n:*" always matches the newest message, even when it is not newer than n.
+        uids = [uid for uid in (data[0].split() if typ == "OK" and data and data[0] else []) if int(uid) > last_uid]
+        messages = self._fetch(uids, peek=True)
+        return current_validity, max([last_uid] + [int(uid) for uid in uids]), messages
+
+    def _wait(self):
+        if "IDLE" in self._conn.capabilities:
+            self._idle(IMAP_IDLE_TIMEOUT)
+        else:
+            self._closed.wait(IMAP_POLL_INTERVAL)
+
+    def _idle(self, timeout: float):
+        """RFC 2177 IDLE: block until the server reports a change or the timeout passes.
+
+        The wait happens in select, never in a read: a socket file that hits a
+        read timeout refuses all further reads, including the reply to DONE.
+        """
+        conn = self._conn
+        tag = conn._new_tag()
+        conn.send(tag + b" IDLE\r\n")
+        if not conn.readline().startswith(b"+"):
+            raise imaplib.IMAP4.error("Server rejected IDLE")
+        deadline = time.monotonic() + timeout
+        with selectors.DefaultSelector() as selector:
+            selector.register(conn.sock, selectors.EVENT_READ)
+            while not self._closed.is_set():
+                if not self._buffered(conn):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not selector.select(remaining):
+                        break
+                line = conn.readline()
+                if not line:
+                    raise imaplib.IMAP4.abort("Connection closed during IDLE")
+                if line.rstrip().endswith((b"EXISTS", b"RECENT")):
+                    break
+        conn.send(b"DONE\r\n")
+        while True:
+            line = conn.readline()
+            if not line:
+                raise imaplib.IMAP4.abort("Connection closed during IDLE")
+            if line.startswith(tag):
+                break
+        conn.tagged_commands.pop(tag, None)
+
+    def _buffered(self, conn: imaplib.IMAP4) -> bool:
+        """Whether data is already waiting in the connection's read buffers, which select cannot see."""
+        conn.sock.setblocking(False)
+        try:
+            return bool(conn.file.peek(1))
+        except (BlockingIOError, ssl.SSLWantReadError):
+            return False
+        finally:
+            conn.sock.settimeout(self.timeout)
@@ -0,0 +1,180 @@
+"""IMAPMailbox against a small in-process IMAP server.
+
+relay/transport.py only uses the standard library, so it is loaded straight
+from its file; importing the relay package would pull in Red and discord.py.
+"""
+import asyncio
+import importlib.util
+import socket
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+spec = importlib.util.spec_from_file_location(
+    "relay_transport", Path(__file__).resolve().parent.parent / "relay" / "transport.py"
+)
+transport = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(transport)
+
+MESSAGE = b"From: sender@example.com\r\nSubject: Hello\r\n\r\nBody text\r\n"
+
+
+class FakeIMAPServer:
+    """Serves one mailbox over plain IMAP4rev1 with IDLE, one client at a time."""
+
+    def __init__(self):
+        self.messages = {1: MESSAGE}
+        self.uidvalidity = 7
+        self.commands = []
+        self.idling = threading.Event()
+        self._clients = []
+        self._lock = threading.Lock()
+        self._listener = socket.create_server(("127.0.0.1", 0))
+        self.port = self._listener.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def close(self):
+        self._listener.close()
+        for client in self._clients:
+            try:
+                client.close()
+            except OSError:
+                pass
+
+    def deliver(self, raw: bytes):
+        """Add a message and announce it to an idling client."""
+        with self._lock:
+            uid = max(self.messages) + 1
+            self.messages[uid] = raw
+            for client in self._clients:
+                try:
+                    client.sendall(f"* {len(self.messages)} EXISTS\r\n".encode())
+                except OSError:
+                    pass
+
+    def _accept(self):
+        while True:
+            try:
+                client, _ = self._listener.accept()
+            except OSError:
+                return
+            self._clients.append(client)
+            threading.Thread(target=self._serve, args=(client,), daemon=True).start()
+
+    def _serve(self, client: socket.socket):
+        reader = client.makefile("rb")
+        client.sendall(b"* OK fake IMAP ready\r\n")
+        try:
+            while True:
+                line = reader.readline()
+                if not line:
+                    return
+                tag, _, rest = line.rstrip(b"\r\n").partition(b" ")
+                command = rest.decode()
+                self.commands.append(command.split(" ")[0].upper())
+                reply = self._handle(client, reader, command)
+                if reply is None:
+                    return
+                client.sendall(reply + tag + b" OK done\r\n")
+        except OSError:
+            return
+
+    def _handle(self, client, reader, command: str):
+        name, _, args = command.partition(" ")
+        name = name.upper()
+        if name == "CAPABILITY":
+            return b"* CAPABILITY IMAP4rev1 IDLE\r\n"
+        if name in ("LOGIN", "NOOP"):
+            return b""
+        if name == "LOGOUT":
+            client.sendall(b"* BYE\r\n")
+            return None
+        if name == "SELECT":
+            return (
+                f"* {len(self.messages)} EXISTS\r\n* OK [UIDVALIDITY {self.uidvalidity}] ok\r\n".encode()
+            )
+        if name == "IDLE":
+            client.sendall(b"+ idling\r\n")
+            self.idling.set()
+            done = reader.readline()
+            self.idling.clear()
+            assert done.strip() == b"DONE"
+            return b""
+        if name == "UID":
+            sub, _, rest = args.partition(" ")
+            sub = sub.upper()
+            if sub == "SEARCH":
+                uids = sorted(self.messages)
+                if rest.startswith("UID "):
+                    low = int(rest[4:].split(":")[0])
+                    uids = [uid for uid in uids if uid >= low] or uids[-1:]
+                return f"* SEARCH {' '.join(map(str, uids))}\r\n".encode()
+            if sub == "FETCH":
+                reply = b""
+                for seq, uid in enumerate(sorted(self.messages), start=1):
+                    if str(uid) in rest.split(" ")[0].split(","):
+                        body = self.messages[uid]
+                        reply += f"* {seq} FETCH (UID {uid} BODY[]<0> {{{len(body)}}}\r\n".encode() + body + b")\r\n"
+                return reply
+        return b""
+
+
+@pytest.fixture
+def server():
+    server = FakeIMAPServer()
+    yield server
+    server.close()
+
+
+def mailbox(server) -> "transport.IMAPMailbox":
+    return transport.IMAPMailbox("127.0.0.1", server.port, "user", "secret", ssl=False, timeout=5)
+
+
+def test_quiet_idle_times_out_and_keeps_the_connection(server):
+    box = mailbox(server)
+    box._select()
+    started = time.monotonic()
+    box._idle(0.3)
+    assert 0.3 <= time.monotonic() - started < 3
+    # The reply to DONE was read, and the same connection still works.
+    box._idle(0.2)
+    assert box._select() == server.uidvalidity
+    assert server.commands.count("LOGIN") == 1
+    box._disconnect()
+
+
+def test_idle_returns_when_mail_arrives(server):
+    box = mailbox(server)
+    box._select()
+    threading.Timer(0.2, lambda: server.idling.wait(5) and server.deliver(MESSAGE)).start()
+    started = time.monotonic()
+    box._idle(10)
+    assert time.monotonic() - started < 5
+    assert box._select() == server.uidvalidity
+    box._disconnect()
+
+
+def test_watch_pushes_new_mail_over_one_connection(server):
+    received = []
+
+    async def run():
+        box = mailbox(server)
+        got_mail = asyncio.Event()
+
+        async def on_mail(messages, uidvalidity, last_uid):
+            received.extend(messages)
+            if messages:
+                got_mail.set()
+
+        task = asyncio.create_task(box.watch(on_mail, last_uid=1, uidvalidity=server.uidvalidity))
+        await asyncio.get_running_loop().run_in_executor(None, server.idling.wait, 5)
+        server.deliver(b"From: other@example.com\r\nSubject: New\r\n\r\nFresh\r\n")
+        await asyncio.wait_for(got_mail.wait(), 5)
+        await box.close()
+        await asyncio.wait_for(task, 5)
+
+    asyncio.run(run())
+    assert [(m.uid, m.subject) for m in received] == [(2, "New")]
+    assert server.commands.count("LOGIN") == 1
@@ -0,0 +1,403 @@
+import asyncio
+import base64
+import io
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import discord
+
+log = logging.getLogger("red.xenon.restore")
+
+# Concurrent requests per kind of operation. discord.py still waits out each
+# route's rate limit bucket; these only stop one restore from queueing hundreds
+# of requests against the same bucket at once.
+ROUTE_BUDGETS = {
+    "delete_channel": 5,
+    "delete_role": 5,
+    "create_role": 3,
+    "edit_role": 3,
+    "create_channel": 5,
+    "edit_channel": 5,
+    "create_emoji": 2,
+    "create_sticker": 2,
+}
+
+CHANNEL_CREATORS = {
+    "text": "create_text_channel",
+    "news": "create_text_channel",
+    "voice": "create_voice_channel",
+    "stage_voice": "create_stage_channel",
+    "forum": "create_forum",
+    "category": "create_category",
+}
+
+# Saved channel settings each Guild.create_* method accepts. Any other saved
+# setting is applied with channel.edit once the channel exists.
+CREATE_SETTINGS = {
+    "text": {"topic", "nsfw", "slowmode_delay", "default_auto_archive_duration", "default_thread_slowmode_delay"},
+    "news": {"topic", "nsfw", "default_auto_archive_duration", "default_thread_slowmode_delay"},
+    "voice": {"bitrate", "user_limit", "rtc_region", "video_quality_mode"},
+    "stage_voice": {"bitrate", "user_limit", "rtc_region", "video_quality_mode"},
+    "forum": {
+        "topic",
+        "nsfw",
+        "slowmode_delay",
+        "default_auto_archive_duration",
+        "default_thread_slowmode_delay",
+        "default_layout",
+        "default_sort_order",
+    },
+    "category": set(),
+}
+
+# Settings where None is meaningful on edit (no topic, automatic voice region).
+# Other unset settings are left alone.
+NULLABLE_SETTINGS = {"topic", "rtc_region"}
+
+# Channel settings saved as the enum's value.
+SETTING_ENUMS = {
+    "video_quality_mode": discord.VideoQualityMode,
+    "default_layout": discord.ForumLayoutType,
+    "default_sort_order": discord.ForumOrderType,
+}
+
+
+ROLE_KEYS = ("name", "position", "permissions", "color", "hoist", "mentionable")
+CHANNEL_KEYS = ("name", "type", "position")
+
+
+class InvalidTemplate(Exception):
+    """The template is missing data the restore needs; nothing has been changed."""
+
+
+def validate_template(template) -> List[str]:
+    """Problems that would stop a restore part way through, described for the user."""
+    problems = []
+    for index, role in enumerate(template.roles):
+        missing = [key for key in ROLE_KEYS if key not in role]
+        if missing:
+            problems.append(f"Role {role.get('name', index)} is missing {', '.join(missing)}")
+    for index, channel in enumerate(template.channels):
+        missing = [key for key in CHANNEL_KEYS if key not in channel]
+        if missing:
+            problems.append(f"Channel {channel.get('name', index)} is missing {', '.join(missing)}")
+        for target_id, perm in channel.get("permissions", {}).items():
+            if not ({"allow", "deny"} <= perm.keys() or {"read_messages", "send_messages"} <= perm.keys()):
+                problems.append(f"Channel {channel.get('name', index)} has an unreadable overwrite for {target_id}")
+    for key in ("emojis", "stickers"):
+        for entry in getattr(template, key, None) or []:
+            if "name" not in entry or "image" not in entry:
+                problems.append(f"An entry in {key} is missing its name or image")
+    return problems
+
+
+class RestoreStep:
+    """Progress and timing of one stage of a restore."""
+
+    __slots__ = ("name", "total", "done", "failed", "started", "finished")
+
+    def __init__(self, name: str, total: int):
+        self.name = name
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    def __str__(self) -> str:
+        state = "done" if self.finished else "running"
+        failed = f", {self.failed} failed" if self.failed else ""
+        return f"{self.name}: {self.done}/{self.total}{failed} ({self.elapsed:.1f}s, {state})"
+
+
+class TemplateRestorer:
+    """Applies a template to a guild in dependency order.
+
+    Deletions run first, then roles, then categories, then the channels inside
+    them, each stage concurrently within ``ROUTE_BUDGETS``. Positions are set
+    afterwards with one bulk edit for roles and one for channels. Template
+    emojis and stickers whose names the guild lacks are created last.
+
+    In diff mode existing roles and channels are matched to the template by
+    name (and channel type); matches are edited only where they differ, and
+    only unmatched objects are created or deleted.
+    """
+
+    def __init__(
+        self,
+        guild: discord.Guild,
+        template,
+        *,
+        diff: bool = False,
+        progress: Optional[Callable[[List[RestoreStep], bool], Awaitable[None]]] = None,
+    ):
+        self.guild = guild
+        self.template = template
+        self.diff = diff
+        self.progress = progress
+        self.steps: List[RestoreStep] = []
+        self.errors: List[str] = []
+        self.budgets = {kind: asyncio.Semaphore(limit) for kind, limit in ROUTE_BUDGETS.items()}
+        # template id -> object in the guild
+        self.role_map: Dict[int, discord.Role] = {}
+        self.channel_map: Dict[int, discord.abc.GuildChannel] = {}
+        # (template entry, guild object) pairs, including entries without ids
+        self.applied_roles: List[Tuple[dict, discord.Role]] = []
+        self.applied_channels: List[Tuple[dict, discord.abc.GuildChannel]] = []
+
+    async def run(self) -> List[RestoreStep]:
+        # Check everything up front: a full restore deletes first, so stopping
+        # half way would leave the guild without its roles and channels.
+        problems = validate_template(self.template)
+        if problems:
+            raise InvalidTemplate("; ".join(problems))
+        roles = [r for r in self.template.roles if not self._is_default_role(r)]
+        categories = [c for c in self.template.channels if c["type"] == "category"]
+        children = [c for c in self.template.channels if c["type"] != "category"]
+
+        role_matches, stale_roles = self._match_roles(roles)
+        channel_matches, stale_channels = self._match_channels(self.template.channels)
+
+        await self._stage("Delete channels", stale_channels, self._delete_channel)
+        await self._stage("Delete roles", stale_roles, self._delete_role)
+        self._map_default_role()
+        await self._stage("Roles", [(data, role_matches.get(id(data))) for data in roles], self._apply_role)
+        await self._stage(
+            "Categories", [(data, channel_matches.get(id(data))) for data in categories], self._apply_channel
+        )
+        await self._stage(
+            "Channels", [(data, channel_matches.get(id(data))) for data in children], self._apply_channel
+        )
+        await self._stage("Positions", [self._apply_role_positions, self._apply_channel_positions], lambda f: f())
+        emojis, stickers = self._missing_assets()
+        if emojis:
+            await self._stage("Emojis", emojis, self._create_emoji)
+        if stickers:
+            await self._stage("Stickers", stickers, self._create_sticker)
+        return self.steps
+
+    async def _stage(self, name: str, items: list, worker: Callable[..., Awaitable[None]]):
+        step = RestoreStep(name, len(items))
+        self.steps.append(step)
+        await self._report()
+
+        async def run(item):
+            try:
+                await worker(item)
+            except discord.HTTPException as e:
+                step.failed += 1
+                self.errors.append(f"{name}: {e}")
+            except Exception as e:
+                # One bad item must not stop its siblings or the later stages.
+                log.exception(f"Restore stage {name} failed in guild {self.guild.id}")
+                step.failed += 1
+                self.errors.append(f"{name}: {type(e).__name__}: {e}")
+            step.done += 1
+            await self._report()
+
+        await asyncio.gather(*(run(item) for item in items))
+        step.finished = time.monotonic()
+        await self._report(force=True)
+
+    async def _report(self, force: bool = False):
+        if self.progress is not None:
+            await self.progress(self.steps, force)
+
+    # Matching
+
+    @staticmethod
+    def _is_default_role(data: dict) -> bool:
+        return data["position"] == 0 or data["name"] == "@everyone"
+
+    def _deletable_roles(self) -> List[discord.Role]:
+        return [r for r in self.guild.roles if not r.is_default() and not r.managed and r < self.guild.me.top_role]
+
+    def _match_roles(self, roles: List[dict]) -> Tuple[Dict[int, discord.Role], List[discord.Role]]:
+        existing = self._deletable_roles()
+        if not self.diff:
+            return {}, existing
+        by_name: Dict[str, List[discord.Role]] = {}
+        for role in sorted(existing, key=lambda r: r.position):
+            by_name.setdefault(role.name, []).append(role)
+        matches = {}
+        for data in sorted(roles, key=lambda r: r["position"]):
+            candidates = by_name.get(data["name"])
+            if candidates:
+                matches[id(data)] = candidates.pop(0)
+        return matches, [role for candidates in by_name.values() for role in candidates]
+
+    def _match_channels(self, channels: List[dict]) -> Tuple[Dict[int, discord.abc.GuildChannel], list]:
+        existing = list(self.guild.channels)
+        if not self.diff:
+            return {}, existing
+        by_key: Dict[Tuple[str, str], list] = {}
+        for channel in sorted(existing, key=lambda c: c.position):
+            by_key.setdefault((str(channel.type), channel.name), []).append(channel)
+        matches = {}
+        for data in sorted(channels, key=lambda c: c["position"]):
+            candidates = by_key.get((data["type"], data["name"]))
+            if candidates:
+                matches[id(data)] = candidates.pop(0)
+        return matches, [channel for candidates in by_key.values() for channel in candidates]
+
+    # Deletions
+
+    async def _delete_channel(self, channel: discord.abc.GuildChannel):
+        async with self.budgets["delete_channel"]:
+            try:
+                await channel.delete()
+            except discord.NotFound:
+                pass
+
+    async def _delete_role(self, role: discord.Role):
+        async with self.budgets["delete_role"]:
+            try:
+                await role.delete()
+            except discord.NotFound:
+                pass
+
+    # Roles
+
+    def _map_default_role(self):
+        for data in self.template.roles:
+            if self._is_default_role(data) and "id" in data:
+                self.role_map[data["id"]] = self.guild.default_role
+
+    @staticmethod
+    def _role_fields(data: dict) -> dict:
+        return {
+            "name": data["name"],
+            "permissions": discord.Permissions(data["permissions"]),
+            "color": discord.Color(data["color"]),
+            "hoist": data["hoist"],
+            "mentionable": data["mentionable"],
+        }
+
+    async def _apply_role(self, item: Tuple[dict, Optional[discord.Role]]):
+        data, role = item
+        fields = self._role_fields(data)
+        if role is None:
+            async with self.budgets["create_role"]:
+                role = await self.guild.create_role(**fields)
+        elif (
+            role.permissions != fields["permissions"]
+            or role.color != fields["color"]
+            or role.hoist != fields["hoist"]
+            or role.mentionable != fields["mentionable"]
+        ):
+            async with self.budgets["edit_role"]:
+                await role.edit(**fields)
+        if "id" in data:
+            self.role_map[data["id"]] = role
+        self.applied_roles.append((data, role))
+
+    async def _apply_role_positions(self):
+        # Keep the template's order, packed below the bot's own top role.
+        ordered = sorted(self.applied_roles, key=lambda pair: pair[0]["position"])
+        ceiling = self.guild.me.top_role.position
+        positions = {}
+        for position, (data, role) in enumerate(ordered, start=1):
+            if position >= ceiling:
+                break
+            if role.position != position:
+                positions[role] = position
+        if positions:
+            await self.guild.edit_role_positions(positions)
+
+    # Channels
+
+    def _overwrites(self, data: dict) -> Dict[discord.abc.Snowflake, discord.PermissionOverwrite]:
+        overwrites = {}
+        for target_id, perm in data.get("permissions", {}).items():
+            target_id = int(target_id)
+            target = self.role_map.get(target_id) or self.guild.get_role(target_id) or self.guild.get_member(target_id)
+            if target is None and perm.get("type") == "member":
+                # Member overwrites apply by id whether or not the member is cached.
+                target = discord.Object(id=target_id)
+            if target is None:
+                continue
+            if "allow" in perm:
+                allow, deny = perm["allow"], perm["deny"]
+            else:
+                # Older templates stored perm.pair() under these two keys.
+                allow, deny = perm["read_messages"], perm["send_messages"]
+            overwrites[target] = discord.PermissionOverwrite.from_pair(
+                discord.Permissions(allow or 0), discord.Permissions(deny or 0)
+            )
+        return overwrites
+
+    async def _apply_channel(self, item: Tuple[dict, Optional[discord.abc.GuildChannel]]):
+        data, channel = item
+        overwrites = self._overwrites(data)
+        category = self.channel_map.get(data.get("category")) if data.get("category") else None
+        settings = {
+            key: SETTING_ENUMS[key](value) if key in SETTING_ENUMS and value is not None else value
+            for key, value in data.get("settings", {}).items()
+        }
+        if channel is None:
+            creator = getattr(self.guild, CHANNEL_CREATORS.get(data["type"], "create_text_channel"))
+            accepted = CREATE_SETTINGS.get(data["type"], set())
+            kwargs = {key: value for key, value in settings.items() if key in accepted and value is not None}
+            followup = {key: value for key, value in settings.items() if key not in accepted and value is not None}
+            if data["type"] == "news":
+                kwargs["news"] = True
+            if data["type"] != "category":
+                kwargs["category"] = category
+            async with self.budgets["create_channel"]:
+                channel = await creator(name=data["name"], overwrites=overwrites, **kwargs)
+            if followup:
+                async with self.budgets["edit_channel"]:
+                    await channel.edit(**followup)
+        else:
+            changes = {
+                key: value
+                for key, value in settings.items()
+                if (value is not None or key in NULLABLE_SETTINGS) and getattr(channel, key, value) != value
+            }
+            if channel.overwrites != overwrites:
+                changes["overwrites"] = overwrites
+            if changes:
+                async with self.budgets["edit_channel"]:
+                    await channel.edit(**changes)
+        if "id" in data:
+            self.channel_map[data["id"]] = channel
+        self.applied_channels.append((data, channel))
+
+    async def _apply_channel_positions(self):
+        payload = []
+        for data, channel in self.applied_channels:
+            entry = {"id": channel.id, "position": data["position"]}
+            if data["type"] != "category":
+                parent = self.channel_map.get(data.get("category")) if data.get("category") else None
+                entry["parent_id"] = parent.id if parent else None
+            payload.append(entry)
+        if payload:
+            await self.guild._state.http.bulk_channel_update(self.guild.id, payload)
+
+    # Emojis and stickers
+
+    def _missing_assets(self) -> Tuple[List[dict], List[dict]]:
+        """Template emojis and stickers whose names the guild does not have yet."""
+        emoji_names = {emoji.name for emoji in self.guild.emojis}
+        sticker_names = {sticker.name for sticker in self.guild.stickers}
+        emojis = [data for data in getattr(self.template, "emojis", None) or [] if data["name"] not in emoji_names]
+        stickers = [data for data in getattr(self.template, "stickers", None) or [] if data["name"] not in sticker_names]
+        return emojis, stickers
+
+    async def _create_emoji(self, data: dict):
+        roles = [self.role_map[role_id] for role_id in data.get("roles", []) if role_id in self.role_map]
+        async with self.budgets["create_emoji"]:
+            await self.guild.create_custom_emoji(name=data["name"], image=base64.b64decode(data["image"]), roles=roles)
+
+    async def _create_sticker(self, data: dict):
+        extension = "gif" if data["format"] == discord.StickerFormatType.gif.value else "png"
+        file = discord.File(io.BytesIO(base64.b64decode(data["image"])), filename=f"{data['name']}.{extension}")
+        async with self.budgets["create_sticker"]:
+            await self.guild.create_sticker(
+                name=data["name"], description=data.get("description") or "", emoji=data["emoji"], file=file
+            )
@@ -0,0 +1,149 @@
+import asyncio
+import base64
+from typing import Any, Dict, List, Optional
+
+import discord
+from discord.enums import Enum
+
+# Concurrent asset downloads (emoji and sticker images) while capturing.
+FETCH_CONCURRENCY = 8
+
+# Per channel type, the attributes saved under "settings". Each one is a
+# keyword accepted by that channel type's edit(); the restorer passes the ones
+# its Guild.create_* method also takes at creation and edits in the rest.
+CHANNEL_SETTINGS = {
+    "text": ("topic", "nsfw", "slowmode_delay", "default_auto_archive_duration", "default_thread_slowmode_delay"),
+    "news": ("topic", "nsfw", "default_auto_archive_duration", "default_thread_slowmode_delay"),
+    "voice": ("nsfw", "bitrate", "user_limit", "rtc_region", "video_quality_mode"),
+    "stage_voice": ("bitrate", "user_limit", "rtc_region", "video_quality_mode"),
+    "forum": (
+        "topic",
+        "nsfw",
+        "slowmode_delay",
+        "default_auto_archive_duration",
+        "default_thread_slowmode_delay",
+        "default_layout",
+        "default_sort_order",
+    ),
+    "category": (),
+}
+
+
+class GuildSnapshot:
+    """Captures a guild's structure as plain, JSON-ready data.
+
+    Roles, channels, overwrites and settings come from the cached guild state.
+    Emoji and sticker images, and bans if requested, are not cached and are
+    fetched with at most ``FETCH_CONCURRENCY`` requests in flight.
+    """
+
+    def __init__(self, guild: discord.Guild, *, bans: bool = False):
+        self.guild = guild
+        self.bans = bans
+        self.errors: List[str] = []
+        self._fetches = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+    async def capture(self) -> Dict[str, Any]:
+        guild = self.guild
+        emojis, stickers = await asyncio.gather(
+            asyncio.gather(*(self._emoji(emoji) for emoji in guild.emojis)),
+            asyncio.gather(*(self._sticker(sticker) for sticker in guild.stickers)),
+        )
+        data = {
+            "verification_level": guild.verification_level.value,
+            "explicit_content_filter": guild.explicit_content_filter.value,
+            "default_notifications": guild.default_notifications.value,
+            "roles": [self._role(role) for role in guild.roles],
+            "channels": [self._channel(channel) for channel in guild.channels],
+            "emojis": [emoji for emoji in emojis if emoji is not None],
+            "stickers": [sticker for sticker in stickers if sticker is not None],
+        }
+        if self.bans:
+            data["bans"] = await self._bans()
+        return data
+
+    @staticmethod
+    def _role(role: discord.Role) -> Dict[str, Any]:
+        return {
+            "id": role.id,
+            "name": role.name,
+            "permissions": role.permissions.value,
+            "position": role.position,
+            "color": role.color.value,
+            "hoist": role.hoist,
+            "mentionable": role.mentionable,
+        }
+
+    @staticmethod
+    def _channel(channel: discord.abc.GuildChannel) -> Dict[str, Any]:
+        channel_type = str(channel.type)
+        settings = {}
+        for key in CHANNEL_SETTINGS.get(channel_type, ()):
+            value = getattr(channel, key, None)
+            if isinstance(value, Enum):
+                value = value.value
+            settings[key] = value
+        # Raw overwrites keep entries for members that are not cached.
+        permissions = {
+            str(overwrite.id): {
+                "allow": overwrite.allow,
+                "deny": overwrite.deny,
+                "type": "role" if overwrite.is_role() else "member",
+            }
+            for overwrite in channel._overwrites
+        }
+        return {
+            "id": channel.id,
+            "category": channel.category_id,
+            "name": channel.name,
+            "type": channel_type,
+            "position": channel.position,
+            "permissions": permissions,
+            "settings": settings,
+        }
+
+    async def _read(self, asset, name: str) -> Optional[str]:
+        async with self._fetches:
+            try:
+                return base64.b64encode(await asset.read()).decode()
+            except discord.DiscordException as e:
+                self.errors.append(f"{name}: {e}")
+                return None
+
+    async def _emoji(self, emoji: discord.Emoji) -> Optional[Dict[str, Any]]:
+        image = await self._read(emoji, f"Emoji {emoji.name}")
+        if image is None:
+            return None
+        return {
+            "id": emoji.id,
+            "name": emoji.name,
+            "animated": emoji.animated,
+            "roles": [role.id for role in emoji.roles],
+            "image": image,
+        }
+
+    async def _sticker(self, sticker: discord.GuildSticker) -> Optional[Dict[str, Any]]:
+        if sticker.format is discord.StickerFormatType.lottie:
+            # Lottie stickers cannot be uploaded by bots, so there is nothing to restore.
+            return None
+        image = await self._read(sticker, f"Sticker {sticker.name}")
+        if image is None:
+            return None
+        return {
+            "id": sticker.id,
+            "name": sticker.name,
+            "description": sticker.description,
+            "emoji": sticker.emoji,
+            "format": sticker.format.value,
+            "image": image,
+        }
+
+    async def _bans(self) -> List[Dict[str, Any]]:
+        try:
+            return [
+                {"id": entry.user.id, "reason": entry.reason}
+                async for entry in self.guild.bans(limit=None)
+            ]
+        except discord.HTTPException as e:
+            self.errors.append(f"Bans: {e}")
+            return []
@@ -0,0 +1,179 @@
+import asyncio
+import gzip
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SCHEMA_VERSION = 2
+# Incremental snapshots chain onto their base; past this depth a full snapshot is stored instead.
+MAX_CHAIN_DEPTH = 24
+# Template sections that are lists of entries keyed by "id" and can be stored as deltas.
+DELTA_SECTIONS = ("roles", "channels", "emojis", "stickers", "bans")
+
+
+class TemplateStore:
+    """Gzip-compressed, versioned template payloads with a small JSON index.
+
+    Each template is stored as ``<id>.json.gz`` holding a schema version, an
+    optional base template id, and either the full template or a delta from
+    the base. ``index.json`` holds the metadata needed for listing, so listing
+    never opens a payload. Disk I/O and (de)compression run in an executor.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.index_path = path / "index.json"
+        self.index: Dict[str, Dict[str, Any]] = {}
+
+    async def open(self):
+        await self._run(self.path.mkdir, parents=True, exist_ok=True)
+        if self.index_path.exists():
+            self.index = await self._run(self._read_json, self.index_path)
+
+    async def import_legacy(self, directory: Path) -> int:
+        """Move uncompressed ``<id>.json`` templates from the old templates directory into the store."""
+        if not directory.is_dir():
+            return 0
+        imported = 0
+        for file in sorted(directory.glob("*.json")):
+            template_id = file.stem
+            if template_id in self.index:
+                continue
+            data = await self._run(self._read_json, file)
+            await self.save(template_id, data, {"guild_name": None, "guild_id": None}, created_at=file.stat().st_mtime)
+            await self._run(file.unlink)
+            imported += 1
+        return imported
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Index entries, newest first."""
+        return sorted(
+            ({"id": template_id, **meta} for template_id, meta in self.index.items()),
+            key=lambda entry: entry["created_at"],
+            reverse=True,
+        )
+
+    async def save(
+        self,
+        template_id: str,
+        data: Dict[str, Any],
+        meta: Dict[str, Any],
+        *,
+        base: Optional[str] = None,
+        created_at: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Store a template, as a delta from ``base`` when one is given. Returns its index entry."""
+        payload = {"version": SCHEMA_VERSION, "base": None, "data": data}
+        if base is not None and self._depth(base) < MAX_CHAIN_DEPTH:
+            base_data = await self.load(base)
+            if base_data is not None:
+                delta = await self._run(self._delta, base_data, data)
+                payload = {"version": SCHEMA_VERSION, "base": base, "delta": delta}
+        size = await self._run(self._write_payload, self._payload_path(template_id), payload)
+        entry = {
+            **meta,
+            "roles": len(data.get("roles", [])),
+            "channels": len(data.get("channels", [])),
+            "created_at": created_at or time.time(),
+            "size": size,
+            "base": payload["base"],
+            "version": SCHEMA_VERSION,
+        }
+        self.index[template_id] = entry
+        await self._run(self._write_json, self.index_path, self.index)
+        return entry
+
+    async def load(self, template_id: str) -> Optional[Dict[str, Any]]:
+        """Return the full template data, applying deltas down from the base snapshot."""
+        if template_id not in self.index:
+            return None
+        chain = []
+        current: Optional[str] = template_id
+        while current is not None:
+            payload = await self._run(self._read_payload, self._payload_path(current))
+            chain.append(payload)
+            current = payload.get("base")
+        data = chain.pop()["data"]
+        while chain:
+            data = self._apply(data, chain.pop()["delta"])
+        return data
+
+    def _depth(self, template_id: str) -> int:
+        depth = 0
+        entry = self.index.get(template_id)
+        while entry is not None and entry.get("base"):
+            depth += 1
+            entry = self.index.get(entry["base"])
+        return depth
+
+    @staticmethod
+    def _delta(base: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Any]:
+        delta: Dict[str, Any] = {"fields": {k: v for k, v in data.items() if k not in DELTA_SECTIONS}}
+        for section in DELTA_SECTIONS:
+            if section not in data:
+                continue
+            entries = data[section]
+            old = {entry["id"]: entry for entry in base.get(section, []) if "id" in entry}
+            if any("id" not in entry for entry in entries):
+                # Entries without ids cannot be matched; keep the section whole.
+                delta[section] = {"full": entries}
+                continue
+            new_ids = {entry["id"] for entry in entries}
+            delta[section] = {
+                "upsert": [entry for entry in entries if old.get(entry["id"]) != entry],
+                "remove": [entry_id for entry_id in old if entry_id not in new_ids],
+            }
+        return delta
+
+    @staticmethod
+    def _apply(base: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+        data = dict(delta["fields"])
+        for section in DELTA_SECTIONS:
+            change = delta.get(section)
+            if change is None:
+                continue
+            if "full" in change:
+                data[section] = change["full"]
+                continue
+            entries = {entry["id"]: entry for entry in base.get(section, []) if "id" in entry}
+            for entry_id in change["remove"]:
+                entries.pop(entry_id, None)
+            for entry in change["upsert"]:
+                entries[entry["id"]] = entry
+            data[section] = list(entries.values())
+        return data
+
+    def _payload_path(self, template_id: str) -> Path:
+        return self.path / f"{template_id}.json.gz"
+
+    @staticmethod
+    async def _run(func, *args, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(None, lambda: func(*args, **kwargs))
+
+    @staticmethod
+    def _read_json(path: Path) -> Any:
+        with open(path, "r") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_json(path: Path, data: Any):
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _read_payload(path: Path) -> Dict[str, Any]:
+        with gzip.open(path, "rb") as f:
+            return json.loads(f.read())
+
+    @staticmethod
+    def _write_payload(path: Path, payload: Dict[str, Any]) -> int:
+        raw = gzip.compress(json.dumps(payload, separators=(",", ":")).encode())
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            f.write(raw)
+        os.replace(tmp, path)
+        return len(raw)
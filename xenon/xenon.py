@@ -1,9 +1,22 @@
 import discord
 from redbot.core import commands
+from redbot.core.data_manager import cog_data_path
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Literal, Optional
 import json
-import os
+import time
 import uuid
 
+from .restore import TemplateRestorer, validate_template
+from .snapshot import GuildSnapshot
+from .store import TemplateStore
+
+# Minimum seconds between progress message edits during a restore.
+PROGRESS_INTERVAL = 2.0
+# Templates listed per embed by listt.
+LIST_PAGE_SIZE = 25
+
 class CustomJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder to handle discord.Permissions objects."""
     def default(self, obj):
@@ -23,7 +36,10 @@ def is_owner_or_trusted(ctx):
     return ctx.author.id in ctx.cog.trusted_users or ctx.bot.is_owner(ctx.author)
 
 class ServerTemplate:
-    def __init__(self, verification_level, explicit_content_filter, default_notifications, roles, channels):
+    def __init__(
+        self, verification_level, explicit_content_filter, default_notifications, roles, channels,
+        emojis=None, stickers=None, bans=None,
+    ):
         """
         Initialize a ServerTemplate instance.
 
@@ -32,79 +48,64 @@ class ServerTemplate:
         :param default_notifications: The default notification settings of the server.
         :param roles: A list of roles in the server.
         :param channels: A list of channels in the server.
+        :param emojis: A list of custom emojis in the server, with their images.
+        :param stickers: A list of stickers in the server, with their images.
+        :param bans: A list of banned user IDs and reasons, if they were saved.
         """
         self.verification_level = verification_level
         self.explicit_content_filter = explicit_content_filter
         self.default_notifications = default_notifications
         self.roles = roles
         self.channels = channels
+        self.emojis = emojis or []
+        self.stickers = stickers or []
+        self.bans = bans or []
 
 class Xenon(commands.Cog):
     """Cog for saving and loading server templates."""
     
     def __init__(self, bot):
         self.bot = bot
-        self.template_dir = 'templates'
-        # Ensure the templates directory exists
-        if not os.path.exists(self.template_dir):
-            os.makedirs(self.template_dir)
+        self.store = TemplateStore(cog_data_path(self) / "templates")
         self.trusted_users = set()  # This should be populated appropriately
 
+    async def cog_load(self):
+        await self.store.open()
+        # Templates used to be written uncompressed to a relative directory.
+        await self.store.import_legacy(Path('templates'))
+
     @commands.command()
     @commands.check(is_owner_or_trusted)
-    async def savet(self, ctx):
-        """Saves the current server's structure as a template."""
+    async def savet(self, ctx, bans: Optional[Literal["bans"]] = None, base_id: Optional[str] = None):
+        """Saves the current server's structure as a template.
+
+        Roles, channels with their overwrites and settings, emojis and
+        stickers are saved. Add ``bans`` to also save the ban list.
+
+        Pass the ID of an earlier template of this server as ``base_id`` to
+        store only the changes since that template.
+        """
+        if base_id is not None and base_id not in self.store.index:
+            await ctx.send('Base template not found.')
+            return
         guild = ctx.guild
-        channels = []
-        roles = []
-
-        # Save channels
-        for channel in guild.channels:
-            permissions = {}
-            for role, perm in channel.overwrites.items():
-                permissions[str(role.id)] = {
-                    'read_messages': perm.pair()[0],
-                    'send_messages': perm.pair()[1]
-                }
-            channels.append({
-                'name': channel.name,
-                'type': str(channel.type),
-                'position': channel.position,
-                'permissions': permissions
-            })
-
-        # Save roles
-        for role in guild.roles:
-            roles.append({
-                'name': role.name,
-                'permissions': role.permissions.value,  # Convert permissions to integer
-                'position': role.position,
-                'color': role.color.value,
-                'hoist': role.hoist,
-                'mentionable': role.mentionable
-            })
-
-        # Save additional guild settings
-        verification_level = guild.verification_level.value  # Save verification level as integer
-        explicit_content_filter = guild.explicit_content_filter.value  # Save explicit content filter as integer
-        default_notifications = guild.default_notifications.value  # Save default notifications as integer
-
-        # Create the ServerTemplate instance with the correct order of parameters
-        template = ServerTemplate(
-            verification_level=verification_level,
-            explicit_content_filter=explicit_content_filter,
-            default_notifications=default_notifications,
-            roles=roles,
-            channels=channels
-        )
-        
+
+        async with ctx.typing():
+            snapshot = GuildSnapshot(guild, bans=bans is not None)
+            data = await snapshot.capture()
+
         template_id = str(uuid.uuid4())
         
-        # Use custom JSON encoder
-        with open(f'{self.template_dir}/{template_id}.json', 'w') as f:
-            json.dump(template.__dict__, f, cls=CustomJSONEncoder)
+        # Encoding and compression run in the store's executor
+        entry = await self.store.save(
+            template_id, data, {'guild_name': guild.name, 'guild_id': guild.id}, base=base_id
+        )
 
-        await ctx.send(f'Template saved with ID: {template_id}')
+        kind = 'incremental ' if entry['base'] else ''
+        message = f'Template saved with ID: {template_id} ({kind}{entry["size"] / 1024:.1f} KiB)'
+        if snapshot.errors:
+            message += f"\nSkipped {len(snapshot.errors)} item(s): " + "; ".join(snapshot.errors[:5])
+        await ctx.send(message[:2000])
 
 
     @commands.command()
@@ -123,28 +124,40 @@ class Xenon(commands.Cog):
 
     @commands.command()
     @commands.check(is_owner_or_trusted)
-    async def loadt(self, ctx, template_id):
+    async def loadt(self, ctx, template_id, mode: str = "full"):
         """Loads a template and applies it to the current server.
 
-        This command will delete all existing channels and roles on the server
-        and recreate them based on the specified template.
+        In ``full`` mode this command will delete all existing channels and roles
+        on the server and recreate them based on the specified template. In
+        ``diff`` mode only roles and channels that differ from the template are
+        created, edited or deleted.
 
         Parameters
         ----------
         template_id : str
             The ID of the template to load.
+        mode : str
+            ``full`` (default) or ``diff``.
         """
+        if mode not in ("full", "diff"):
+            await ctx.send('Invalid mode. Use `full` or `diff`.')
+            return
         guild = ctx.guild
 
         # Load template
         try:
-            with open(f'{self.template_dir}/{template_id}.json', 'r') as f:
-                template_data = json.load(f)
+            template_data = await self.store.load(template_id)
         except FileNotFoundError:
+            template_data = None
+        if template_data is None:
             await ctx.send('Template not found.')
             return
 
-        template = ServerTemplate(**template_data)
+        try:
+            template = ServerTemplate(**template_data)
+        except TypeError as e:
+            await ctx.send(f'Invalid template: {e}')
+            return
 
         # Debugging statement to check the type of verification_level
         print(f"Loaded verification_level: {template.verification_level} (type: {type(template.verification_level)})")
@@ -153,6 +166,11 @@ class Xenon(commands.Cog):
         if not isinstance(template.verification_level, int):
             await ctx.send('Invalid template: verification_level must be a integer.')
             return
+        problems = validate_template(template)
+        if problems:
+            message = 'Invalid template, nothing was changed:\n' + '\n'.join(f'- {problem}' for problem in problems[:10])
+            await ctx.send(message[:2000])
+            return
 
         # Disable community features if enabled
         if 'COMMUNITY' in guild.features:
@@ -173,48 +191,12 @@ class Xenon(commands.Cog):
                 await ctx.send(f"Invalid verification level in template: {template.verification_level}")
                 return
 
-        # Clear existing channels and roles
-        for channel in list(guild.channels):
-            try:
-                await channel.delete()  # Move the 'await' statement inside the function
-            except discord.HTTPException as e:
-                await ctx.send(f"Failed to delete channel {channel.name}: {str(e)}")
-
-        for role in list(guild.roles):
-            if role != guild.default_role and not role.managed:
-                try:
-                    await role.delete()
-                except discord.HTTPException as e:
-                    await ctx.send(f"Failed to delete role {role.name}: {str(e)}")
-
-        # Create roles
-        role_map = {}
-        for role_data in template.roles:
-            role = await guild.create_role(
-                name=role_data['name'],
-                permissions=discord.Permissions(role_data['permissions']),
-                color=discord.Color(role_data['color']),
-                hoist=role_data['hoist'],
-                mentionable=role_data['mentionable']
-            )
-            role_map[role_data['name']] = role
-
-        # Create channels
-        for channel_data in template.channels:
-            overwrites = {}
-            for role_id, perm in channel_data['permissions'].items():
-                role = discord.utils.get(guild.roles, id=int(role_id))
-                if role:
-                    overwrites[role] = discord.PermissionOverwrite(
-                        read_messages=perm['read_messages'],
-                        send_messages=perm['send_messages']
-                    )
-            await guild.create_text_channel(
-                name=channel_data['name'],
-                overwrites=overwrites,
-                position=channel_data['position']
-            )
-            
+        # Restore roles and channels in dependency order
+        status = await ctx.send('Applying template...')
+        restorer = TemplateRestorer(guild, template, diff=mode == "diff", progress=self.restore_progress(status))
+        steps = await restorer.run()
+        report = self.restore_report(steps, restorer.errors)
+
         # Re-enable community features if they were originally enabled
         if 'COMMUNITY' in guild.features:
             try:
@@ -223,23 +205,76 @@ class Xenon(commands.Cog):
                 await guild.edit(explicit_content_filter=discord.ContentFilter(template.explicit_content_filter))
                 await guild.edit(default_notifications=discord.NotificationLevel(template.default_notifications))
             except discord.HTTPException as e:
-                await ctx.send(f"Failed to re-enable community features: {str(e)}")
-                return
+                report += f"\nFailed to re-enable community features: {str(e)}"
+
+        await self.send_restore_report(ctx, status, report)
 
-        await ctx.send('Template applied successfully.')
+    @staticmethod
+    def restore_progress(message: discord.Message):
+        """Build a progress callback that edits the status message at most once per interval."""
+        last_edit = 0.0
+
+        async def progress(steps, force):
+            nonlocal last_edit
+            now = time.monotonic()
+            if not force and now - last_edit < PROGRESS_INTERVAL:
+                return
+            last_edit = now
+            try:
+                await message.edit(content="Applying template...\n" + "\n".join(str(step) for step in steps))
+            except discord.HTTPException:
+                # The status channel may have been deleted by the restore itself.
+                pass
+
+        return progress
+
+    @staticmethod
+    def restore_report(steps, errors) -> str:
+        total = sum(step.elapsed for step in steps)
+        lines = ['Template applied successfully.' if not errors else 'Template applied with errors.']
+        lines.extend(str(step) for step in steps)
+        lines.append(f"Total: {total:.1f}s")
+        for error in errors[:10]:
+            lines.append(f"- {error}")
+        if len(errors) > 10:
+            lines.append(f"...and {len(errors) - 10} more errors.")
+        return "\n".join(lines)
+
+    async def send_restore_report(self, ctx, status: discord.Message, report: str):
+        report = report[:2000]
+        try:
+            await status.edit(content=report)
+            return
+        except discord.HTTPException:
+            pass
+        # A full restore deletes the channel the command was run in.
+        try:
+            await ctx.author.send(report)
+        except discord.HTTPException:
+            pass
     
     @commands.command()
-    async def listt(self, ctx):
-        """Lists all saved templates."""
-        template_files = os.listdir(self.template_dir)
-        if not template_files:
+    async def listt(self, ctx, page: int = 1):
+        """Lists all saved templates, newest first."""
+        entries = self.store.list()
+        if not entries:
             await ctx.send('No templates found.')
             return
 
+        pages = (len(entries) + LIST_PAGE_SIZE - 1) // LIST_PAGE_SIZE
+        page = max(1, min(page, pages))
         embed = discord.Embed(title="Saved Templates", color=discord.Color.blue())
-        for template_file in template_files:
-            template_id = template_file.split('.')[0]
-            embed.add_field(name=template_id, value=f"Template ID: {template_id}", inline=False)
+        for entry in entries[(page - 1) * LIST_PAGE_SIZE:page * LIST_PAGE_SIZE]:
+            created = datetime.fromtimestamp(entry['created_at'], timezone.utc)
+            lines = [
+                f"Server: {entry['guild_name'] or 'unknown'}",
+                f"{entry['roles']} roles, {entry['channels']} channels, {entry['size'] / 1024:.1f} KiB",
+                f"Saved {discord.utils.format_dt(created, 'R')}",
+            ]
+            if entry['base']:
+                lines.append(f"Based on `{entry['base']}`")
+            embed.add_field(name=entry['id'], value="\n".join(lines), inline=False)
+        embed.set_footer(text=f"Page {page}/{pages}")
 
         await ctx.send(embed=embed)
 